@@ -4,19 +4,78 @@ Driver Assistant Module
 Şoförlere yönelik rota analizi ve servis bulma özellikleri
 """
 
+import json
 import math
-import time
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timezone
 import numpy as np
 
 from api.routes_client import GoogleRoutesClient
 from api.places_client import GooglePlacesClient
+from api.response_cache import response_cache, quantize_coordinate, quantize_point, snap_radius_km
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371
+
+# Sabit demo rotaları için önceden hesaplanmış Routes API sonuçları
+# (`DriverAssistant.precompute_route` ile üretilir; dosya yoksa tablo boştur)
+PRECOMPUTED_ROUTES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "precomputed_routes.json")
+
+
+def route_key(origin: Dict[str, float], destination: Dict[str, float]) -> str:
+    """
+    Başlangıç/hedef çifti için yuvarlanmış koordinatlardan tablo anahtarı üretir.
+    
+    Returns:
+        str: "enlem,boylam->enlem,boylam" biçiminde anahtar
+    """
+    (origin_lat, origin_lon), (dest_lat, dest_lon) = quantize_point(origin), quantize_point(destination)
+    return f"{origin_lat},{origin_lon}->{dest_lat},{dest_lon}"
+
+
+def load_precomputed_routes(path: str = PRECOMPUTED_ROUTES_PATH) -> Dict[str, Dict[str, Any]]:
+    """
+    Önceden hesaplanmış rota tablosunu yükler.
+    
+    Args:
+        path: Tablo dosyasının yolu
+        
+    Returns:
+        Dict: route_key -> {'response': ..., 'details': ...}; dosya yoksa boş sözlük
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load precomputed routes: {e}")
+        return {}
+
+
+PRECOMPUTED_ROUTES = load_precomputed_routes()
+
+
+def haversine_km(lat1: np.ndarray, lon1: np.ndarray,
+                 lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Derece cinsinden koordinat dizileri arasındaki büyük daire mesafesini hesaplar.
+    
+    Girdiler NumPy yayınlama (broadcasting) kurallarına uyan herhangi bir şekilde olabilir.
+    
+    Returns:
+        np.ndarray: Kilometre cinsinden mesafeler
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(v) for v in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
 class DriverAssistant:
     """
     Şoförlere yönelik rota analizi ve servis bulma sistemi.
@@ -98,46 +157,128 @@ class DriverAssistant:
             logger.warning("Not enough route points, using start and end only")
             return route_points
         
-        # Belirli aralıklarla ara noktalar oluştur
-        interpolated_points = []
-        total_distance = 0
+        # Belirli aralıklarla ara noktalar oluştur (tüm segmentler tek seferde, vektörel)
+        lats = np.array([p["latitude"] for p in route_points])
+        lons = np.array([p["longitude"] for p in route_points])
+        
+        segment_km = haversine_km(lats[:-1], lons[:-1], lats[1:], lons[1:])
+        segment_start_km = np.concatenate(([0.0], np.cumsum(segment_km)[:-1]))
+        
+        # Her segmentte kaç aralık var? Segment başına (aralık + 1) nokta üretilir
+        num_intervals = np.maximum(1, (segment_km / interval_km).astype(int))
+        points_per_segment = num_intervals + 1
+        segment_index = np.repeat(np.arange(len(segment_km)), points_per_segment)
+        first_offsets = np.cumsum(points_per_segment) - points_per_segment
+        step = np.arange(segment_index.size) - first_offsets[segment_index]
+        ratio = step / num_intervals[segment_index]
+        
+        # Linear interpolation
+        start = segment_index
+        end = segment_index + 1
+        point_lats = lats[start] + ratio * (lats[end] - lats[start])
+        point_lons = lons[start] + ratio * (lons[end] - lons[start])
+        distances = segment_start_km[segment_index] + ratio * segment_km[segment_index]
+        
+        interpolated_points = [
+            {"latitude": lat, "longitude": lng, "distance_from_start": distance}
+            for lat, lng, distance in zip(point_lats.tolist(), point_lons.tolist(), distances.tolist())
+        ]
+        
+        logger.info(f"Generated {len(interpolated_points)} route points with {interval_km}km intervals")
+        return interpolated_points
+    
+    @response_cache.memoize(lambda args: (quantize_point(args["origin"]),
+                                          quantize_point(args["destination"])))
+    def compute_route(self,
+                      origin: Dict[str, float],
+                      destination: Dict[str, float]) -> Dict[str, Any]:
+        """
+        İki nokta arasındaki rotayı bir kez hesaplar.
         
-        for i in range(len(route_points) - 1):
-            point1 = route_points[i]
-            point2 = route_points[i + 1]
+        Dönen değer `find_services_along_route` ve `plan_driver_stops` metodlarına
+        `route` parametresiyle verilerek aynı rota için tekrar Routes API çağrısı
+        yapılması önlenir.
+        
+        Args:
+            origin: Başlangıç koordinatları {'latitude': x, 'longitude': y}
+            destination: Hedef koordinatları {'latitude': x, 'longitude': y}
             
-            segment_distance = self.calculate_distance(
-                point1["latitude"], point1["longitude"],
-                point2["latitude"], point2["longitude"]
-            )
+        Returns:
+            Dict: 'response' (ham Routes API yanıtı) ve 'details' (rota detayları)
+        """
+        # Sabit demo rotaları önceden hesaplanmış tablodan karşılanır
+        precomputed = PRECOMPUTED_ROUTES.get(route_key(origin, destination))
+        if precomputed is not None:
+            logger.info("Using precomputed route")
+            return precomputed
+        
+        route_response = self.routes_client.compute_route(
+            origin=origin,
+            destination=destination,
+            travel_mode="DRIVE",
+            routing_preference="TRAFFIC_AWARE"
+        )
+        
+        return {
+            "response": route_response,
+            "details": self.routes_client.get_route_details(route_response)
+        }
+    
+    def precompute_route(self,
+                         origin: Dict[str, float],
+                         destination: Dict[str, float],
+                         path: str = PRECOMPUTED_ROUTES_PATH) -> bool:
+        """
+        Rotayı Routes API ile hesaplayıp önceden hesaplanmış rota tablosuna yazar.
+        
+        Sabit demo rotaları için bir kez çalıştırılır; sonraki `compute_route`
+        çağrıları bu rota için ağa gitmez.
+        
+        Args:
+            origin: Başlangıç koordinatları
+            destination: Hedef koordinatları
+            path: Tablo dosyasının yolu
             
-            # Bu segment üzerinde kaç ara nokta gerekli?
-            num_intervals = max(1, int(segment_distance / interval_km))
+        Returns:
+            bool: Kayıt başarılıysa True
+        """
+        try:
+            route_response = self.routes_client.compute_route(
+                origin=origin,
+                destination=destination,
+                travel_mode="DRIVE",
+                routing_preference="TRAFFIC_AWARE"
+            )
+            route = {
+                "response": route_response,
+                "details": self.routes_client.get_route_details(route_response)
+            }
             
-            for j in range(num_intervals + 1):
-                ratio = j / num_intervals if num_intervals > 0 else 0
-                
-                # Linear interpolation
-                lat = point1["latitude"] + ratio * (point2["latitude"] - point1["latitude"])
-                lng = point1["longitude"] + ratio * (point2["longitude"] - point1["longitude"])
-                
-                interpolated_points.append({
-                    "latitude": lat,
-                    "longitude": lng,
-                    "distance_from_start": total_distance + (ratio * segment_distance)
-                })
+            routes = load_precomputed_routes(path)
+            routes[route_key(origin, destination)] = route
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(routes, f, ensure_ascii=False)
             
-            total_distance += segment_distance
-        
-        logger.info(f"Generated {len(interpolated_points)} route points with {interval_km}km intervals")
-        return interpolated_points
+            PRECOMPUTED_ROUTES[route_key(origin, destination)] = route
+            logger.info(f"Precomputed route saved to {path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error precomputing route: {e}")
+            return False
     
+    @response_cache.memoize(lambda args: (quantize_point(args["origin"]),
+                                          quantize_point(args["destination"]),
+                                          sorted(args["service_types"] or []),
+                                          args["search_radius_km"],
+                                          args["interval_km"]),
+                            should_cache=lambda result: result["summary"]["total_services"] > 0)
     def find_services_along_route(self, 
                                 origin: Dict[str, float],
                                 destination: Dict[str, float],
                                 service_types: List[str] = None,
                                 search_radius_km: float = 10,
-                                interval_km: float = 50) -> Dict[str, Any]:
+                                interval_km: float = 50,
+                                route: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Rota boyunca belirli mesafe aralıklarında servisleri bulur.
         
@@ -147,6 +288,7 @@ class DriverAssistant:
             service_types: Aranacak servis türleri
             search_radius_km: Her nokta için arama yarıçapı (km)
             interval_km: Nokta aralığı (km)
+            route: `compute_route` ile önceden hesaplanmış rota (verilmezse hesaplanır)
             
         Returns:
             Dict: Rota bilgisi ve bulunan servisler
@@ -157,22 +299,18 @@ class DriverAssistant:
         logger.info(f"Finding services along route: {service_types}")
         
         try:
-            # Önce rotayı hesapla
-            route_response = self.routes_client.compute_route(
-                origin=origin,
-                destination=destination,
-                travel_mode="DRIVE",
-                routing_preference="TRAFFIC_AWARE"
-            )
-            
-            # Rota detaylarını al
-            route_details = self.routes_client.get_route_details(route_response)
+            # Önce rotayı hesapla (önceden hesaplanmışsa onu kullan)
+            if route is None:
+                route = self.compute_route(origin, destination)
+            route_response = route["response"]
+            route_details = route["details"]
             
             # Rota üzerinde ara noktalar oluştur
             route_points = self.interpolate_route_points(route_response, interval_km)
             
-            # Her ara noktada servisleri ara
-            all_services = []
+            # Her ara noktada servisleri ara; örtüşen arama çemberlerinden gelen
+            # aynı servisler (place_id / koordinat) toplanırken atlanır
+            unique_services = {}
             search_radius_m = search_radius_km * 1000
             
             for i, point in enumerate(route_points):
@@ -189,41 +327,26 @@ class DriverAssistant:
                 
                 # Servis bilgilerini zenginleştir
                 for service in services:
+                    service_key = service.get("id", "")
+                    if not service_key:
+                        # ID yoksa koordinatlara göre benzersizlik kontrolü
+                        location = service.get("location", {})
+                        service_key = f"{location.get('latitude', 0):.6f},{location.get('longitude', 0):.6f}"
+                    if service_key in unique_services:
+                        continue
+                    unique_services[service_key] = service
+                    
                     service["search_point"] = {
                         "latitude": point["latitude"],
                         "longitude": point["longitude"],
                         "distance_from_start": point.get("distance_from_start", 0)
                     }
-                    
-                    # Servise olan mesafeyi hesapla
-                    service_location = service.get("location", {})
-                    if service_location.get("latitude") and service_location.get("longitude"):
-                        distance_to_service = self.calculate_distance(
-                            point["latitude"], point["longitude"],
-                            service_location["latitude"], service_location["longitude"]
-                        )
-                        service["distance_from_route"] = distance_to_service
-                
-                all_services.extend(services)
-                
-                # Rate limiting
-                time.sleep(1)
-            
-            # Duplicate servisleri temizle (aynı place_id)
-            unique_services = {}
-            for service in all_services:
-                place_id = service.get("id", "")
-                if place_id and place_id not in unique_services:
-                    unique_services[place_id] = service
-                elif not place_id:
-                    # ID yoksa koordinatlara göre benzersizlik kontrolü
-                    location = service.get("location", {})
-                    coord_key = f"{location.get('latitude', 0):.6f},{location.get('longitude', 0):.6f}"
-                    if coord_key not in unique_services:
-                        unique_services[coord_key] = service
             
             unique_services_list = list(unique_services.values())
             
+            # Her servisi en yakın rota noktasına bağla ve rotaya olan mesafesini hesapla
+            self._assign_nearest_route_points(unique_services_list, route_points)
+            
             # Başlangıç mesafesine göre sırala
             unique_services_list.sort(key=lambda x: x.get("search_point", {}).get("distance_from_start", 0))
             
@@ -255,6 +378,44 @@ class DriverAssistant:
             logger.error(f"Error finding services along route: {e}")
             raise
     
+    def _assign_nearest_route_points(self,
+                                     services: List[Dict[str, Any]],
+                                     route_points: List[Dict[str, float]]) -> None:
+        """
+        Servisleri en yakın rota noktasına bağlar (vektörel haversine).
+        
+        Tüm servis × rota noktası mesafeleri tek bir NumPy ifadesiyle hesaplanır;
+        her servis için en yakın nokta `search_point`, o noktaya olan mesafe ise
+        `distance_from_route` olarak yazılır. Konumu olmayan servisler değişmez.
+        
+        Args:
+            services: Servis listesi (yerinde güncellenir)
+            route_points: Rota üzerindeki ara noktalar
+        """
+        located = [s for s in services
+                   if s.get("location", {}).get("latitude") and s.get("location", {}).get("longitude")]
+        if not located or not route_points:
+            return
+        
+        service_lats = np.array([s["location"]["latitude"] for s in located])[:, np.newaxis]
+        service_lons = np.array([s["location"]["longitude"] for s in located])[:, np.newaxis]
+        point_lats = np.array([p["latitude"] for p in route_points])[np.newaxis, :]
+        point_lons = np.array([p["longitude"] for p in route_points])[np.newaxis, :]
+        
+        distances = haversine_km(service_lats, service_lons, point_lats, point_lons)
+        
+        nearest = distances.argmin(axis=1)
+        nearest_distances = distances[np.arange(len(located)), nearest]
+        
+        for service, point_index, distance in zip(located, nearest.tolist(), nearest_distances.tolist()):
+            point = route_points[point_index]
+            service["search_point"] = {
+                "latitude": point["latitude"],
+                "longitude": point["longitude"],
+                "distance_from_start": point.get("distance_from_start", 0)
+            }
+            service["distance_from_route"] = distance
+    
     def _categorize_services(self, services: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Servisleri türlerine göre kategorilere ayırır.
@@ -278,6 +439,10 @@ class DriverAssistant:
         
         return categories
     
+    @response_cache.memoize(lambda args: (quantize_coordinate(args["latitude"]),
+                                          quantize_coordinate(args["longitude"]),
+                                          snap_radius_km(args["radius_km"] * 1000)),
+                            should_cache=lambda result: all(result["summary"].values()))
     def find_emergency_services(self, 
                               latitude: float, 
                               longitude: float, 
@@ -295,47 +460,45 @@ class DriverAssistant:
         """
         logger.info(f"Finding emergency services near ({latitude}, {longitude})")
         
-        emergency_services = {
-            "24h_gas_stations": [],
-            "repair_shops": [],
-            "hospitals": [],
-            "police_stations": []
-        }
+        radius_meters = radius_km * 1000
+        
+        # Kategoriler birbirinden bağımsız; dört arama aynı anda yapılır
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                # 24 saat benzin istasyonları
+                "24h_gas_stations": executor.submit(
+                    self.places_client.search_24h_services,
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_meters=radius_meters
+                ),
+                # Tamirhaneler
+                "repair_shops": executor.submit(
+                    self.places_client.search_nearby,
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_meters=radius_meters,
+                    place_types=["car_repair"]
+                ),
+                # Hastaneler
+                "hospitals": executor.submit(
+                    self.places_client.search_nearby,
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_meters=radius_meters,
+                    place_types=["hospital"]
+                ),
+                # Karakol
+                "police_stations": executor.submit(
+                    self.places_client.search_nearby,
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_meters=radius_meters,
+                    place_types=["police"]
+                ),
+            }
         
-        # 24 saat benzin istasyonları
-        gas_stations_24h = self.places_client.search_24h_services(
-            latitude=latitude,
-            longitude=longitude,
-            radius_meters=radius_km * 1000
-        )
-        emergency_services["24h_gas_stations"] = gas_stations_24h
-        
-        # Tamirhaneler
-        repair_shops = self.places_client.search_nearby(
-            latitude=latitude,
-            longitude=longitude,
-            radius_meters=radius_km * 1000,
-            place_types=["car_repair"]
-        )
-        emergency_services["repair_shops"] = repair_shops
-        
-        # Hastaneler
-        hospitals = self.places_client.search_nearby(
-            latitude=latitude,
-            longitude=longitude,
-            radius_meters=radius_km * 1000,
-            place_types=["hospital"]
-        )
-        emergency_services["hospitals"] = hospitals
-        
-        # Karakol
-        police = self.places_client.search_nearby(
-            latitude=latitude,
-            longitude=longitude,
-            radius_meters=radius_km * 1000,
-            place_types=["police"]
-        )
-        emergency_services["police_stations"] = police
+        emergency_services = {category: future.result() for category, future in futures.items()}
         
         return {
             "location": {"latitude": latitude, "longitude": longitude},
@@ -350,11 +513,18 @@ class DriverAssistant:
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
     
+    @response_cache.memoize(lambda args: (quantize_point(args["origin"]),
+                                          quantize_point(args["destination"]),
+                                          args["driving_hours_limit"],
+                                          sorted(args["preferred_stop_types"] or [])),
+                            should_cache=lambda result: all(stop["service_count"] > 0
+                                                            for stop in result.get("planned_stops", [])))
     def plan_driver_stops(self, 
                         origin: Dict[str, float],
                         destination: Dict[str, float],
                         driving_hours_limit: float = 4.5,
-                        preferred_stop_types: List[str] = None) -> Dict[str, Any]:
+                        preferred_stop_types: List[str] = None,
+                        route: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Şoför dinlenme molalarını planlar (EU regulations: 4.5 saatte mola).
         
@@ -363,6 +533,7 @@ class DriverAssistant:
             destination: Hedef koordinatları  
             driving_hours_limit: Maksimum sürüş süresi (saat)
             preferred_stop_types: Tercih edilen mola türleri
+            route: `compute_route` ile önceden hesaplanmış rota (verilmezse hesaplanır)
             
         Returns:
             Dict: Planlanan molalar ve detaylar
@@ -372,15 +543,11 @@ class DriverAssistant:
         
         logger.info(f"Planning driver stops every {driving_hours_limit} hours")
         
-        # Rotayı hesapla
-        route_response = self.routes_client.compute_route(
-            origin=origin,
-            destination=destination,
-            travel_mode="DRIVE",
-            routing_preference="TRAFFIC_AWARE"
-        )
-        
-        route_details = self.routes_client.get_route_details(route_response)
+        # Rotayı hesapla (önceden hesaplanmışsa onu kullan)
+        if route is None:
+            route = self.compute_route(origin, destination)
+        route_response = route["response"]
+        route_details = route["details"]
         total_duration_hours = route_details["duration_minutes"] / 60
         
         # Kaç mola gerekli?
@@ -10,10 +10,14 @@ import logging
 from typing import Dict, List, Optional, Tuple, Any
 
 from config import config
+from api.response_cache import response_cache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Şehir koordinatları neredeyse hiç değişmez; sonuçlar diskte 30 gün tutulur
+CITY_CACHE_TTL_SECONDS = 30 * 86400
+
 class GeocodingClient:
     """
     Google Geocoding API ile şehir isimlerini koordinatlara dönüştürme işlemleri.
@@ -32,6 +36,9 @@ class GeocodingClient:
         # Geocoding API endpoint
         self.geocoding_endpoint = "https://maps.googleapis.com/maps/api/geocode/json"
         
+    @response_cache.memoize(lambda args: (args["city_name"].strip().lower(),
+                                          args["country"].strip().lower()),
+                            expire=CITY_CACHE_TTL_SECONDS)
     def get_city_coordinates(self, city_name: str, country: str = "Turkey") -> Optional[Dict[str, Any]]:
         """
         Şehir adından koordinatları bulur.
@@ -6,14 +6,24 @@ Google Places API client for finding places of interest.
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 import logging
 
+from urllib3.util.retry import Retry
+
 from config import config
+from api.response_cache import response_cache, quantize_coordinate, snap_radius_km
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Toplu AdBlue aramasında aynı anda yapılacak en fazla istek sayısı
+BATCH_SEARCH_WORKERS = 8
+
+# Kota aşımı (429) ve geçici sunucu hatalarında tekrar denenecek durum kodları
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 class GooglePlacesClient:
     """
     Google Places API ile etkileşim kurarak mekanları (örneğin, benzin istasyonları)
@@ -33,6 +43,20 @@ class GooglePlacesClient:
         self.config = config
         self.config.validate_api_keys()
         self.session = requests.Session()
+        # Sabit bekleme yerine: 429'da Retry-After'a uyup üstel geri çekilme ile yeniden dene
+        retry_policy = Retry(
+            total=self.config.http_max_retries,
+            backoff_factor=self.config.http_backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,  # Places aramaları POST; onlar da yeniden denenir
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=self.config.http_pool_size,
+            pool_maxsize=self.config.http_pool_size,
+            max_retries=retry_policy
+        ))
         
     def get_headers(self) -> dict:
         """
@@ -198,6 +222,9 @@ class GooglePlacesClient:
             logger.error(f"Request error during truck-friendly search: {e}")
             return []
 
+    @response_cache.memoize(lambda args: (quantize_coordinate(args["latitude"]),
+                                          quantize_coordinate(args["longitude"]),
+                                          snap_radius_km(args["radius_meters"])))
     def search_adblue_stations(self, 
                               latitude: float, 
                               longitude: float, 
@@ -246,6 +273,50 @@ class GooglePlacesClient:
         logger.info(f"Found {len(adblue_stations)} potential AdBlue stations")
         return adblue_stations
 
+    def search_adblue_stations_batch(self, 
+                                     points: List[Dict[str, float]], 
+                                     radius_meters: int = 25000) -> List[Dict[str, Any]]:
+        """
+        Birden fazla nokta çevresinde AdBlue istasyonlarını eşzamanlı arar.
+        
+        Her nokta için Nearby araması aynı `requests.Session` (bağlantı havuzu)
+        üzerinden paralel yapılır. Sonuçlar place id'ye göre tekilleştirilir ve her
+        istasyona bulunduğu ilk arama noktası `search_point` olarak eklenir.
+        
+        Args:
+            points (List[Dict[str, float]]): {'latitude': x, 'longitude': y} noktaları.
+            radius_meters (int, optional): Her nokta için arama yarıçapı. Varsayılan 25km.
+        
+        Returns:
+            List[Dict[str, Any]]: Tekilleştirilmiş AdBlue istasyonları listesi.
+        """
+        if not points:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(BATCH_SEARCH_WORKERS, len(points))) as executor:
+            results = list(executor.map(
+                lambda point: self.search_adblue_stations(
+                    latitude=point["latitude"],
+                    longitude=point["longitude"],
+                    radius_meters=radius_meters
+                ),
+                points
+            ))
+        
+        unique_stations = {}
+        for point, stations in zip(points, results):
+            for station in stations:
+                place_id = station.get('id')
+                if not place_id or place_id in unique_stations:
+                    continue
+                unique_stations[place_id] = dict(
+                    station,
+                    search_point={"latitude": point["latitude"], "longitude": point["longitude"]}
+                )
+        
+        logger.info(f"Found {len(unique_stations)} unique AdBlue stations around {len(points)} points")
+        return list(unique_stations.values())
+
     def search_driver_amenities(self, 
                               latitude: float, 
                               longitude: float, 
@@ -324,15 +395,20 @@ class GooglePlacesClient:
         # 24 saat açık olabilecek yer türleri
         service_types = ["gas_station", "convenience_store", "restaurant"]
         
+        # Tür başına aramalar bağımsız; aynı anda yapılır
+        with ThreadPoolExecutor(max_workers=len(service_types)) as executor:
+            results = list(executor.map(
+                lambda service_type: self.search_nearby(
+                    latitude=latitude,
+                    longitude=longitude,
+                    radius_meters=radius_meters,
+                    place_types=[service_type]
+                ),
+                service_types
+            ))
+        
         all_services = []
-        for service_type in service_types:
-            places = self.search_nearby(
-                latitude=latitude,
-                longitude=longitude,
-                radius_meters=radius_meters,
-                place_types=[service_type]
-            )
-            
+        for places in results:
             # 24 saat açık olma potansiyeli olan yerleri filtrele
             for place in places:
                 display_name = place.get('displayName', {})
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Google API yanıtları için SQLite tabanlı kalıcı önbellek.
+Aynı koordinat ve yarıçapla tekrarlanan sorguların ağa gitmeden diskten
+karşılanmasını sağlar.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from utils.json_utils import dumps_json, loads_json
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Önbellek dosyası ve varsayılan geçerlilik süresi (24 saat)
+CACHE_PATH = ".places_cache.sqlite"
+DEFAULT_TTL_SECONDS = 86400
+
+# Koordinatlar 4 ondalığa (~11m) yuvarlanır
+COORDINATE_PRECISION = 4
+
+CREATE_CACHE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+"""
+
+
+def quantize_coordinate(value: float) -> float:
+    """
+    Koordinatı önbellek anahtarı için yuvarlar.
+
+    Args:
+        value (float): Enlem veya boylam.
+
+    Returns:
+        float: 4 ondalığa yuvarlanmış değer.
+    """
+    return round(float(value), COORDINATE_PRECISION)
+
+
+def quantize_point(point: Dict[str, float]) -> tuple:
+    """
+    {'latitude': x, 'longitude': y} sözlüğünü yuvarlanmış bir demete çevirir.
+
+    Args:
+        point (Dict[str, float]): Koordinat sözlüğü.
+
+    Returns:
+        tuple: (enlem, boylam)
+    """
+    return (quantize_coordinate(point["latitude"]), quantize_coordinate(point["longitude"]))
+
+
+def snap_radius_km(radius_meters: float) -> int:
+    """
+    Metre cinsinden yarıçapı en yakın kilometreye yuvarlar.
+
+    Args:
+        radius_meters (float): Yarıçap (metre).
+
+    Returns:
+        int: Kilometre cinsinden yarıçap.
+    """
+    return int(round(radius_meters / 1000))
+
+
+class ResponseCache:
+    """
+    API yanıtlarını JSON olarak SQLite dosyasında saklayan basit bir önbellek.
+
+    Her işlem kendi bağlantısını açar; bu sayede demo'lardaki thread havuzundan
+    güvenle kullanılabilir.
+    """
+
+    def __init__(self, path: str = CACHE_PATH):
+        """
+        ResponseCache sınıfını başlatır.
+
+        Args:
+            path (str): SQLite önbellek dosyasının yolu.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+        # True ise memoize önbellekten okumaz (ör. --no-cache); taze sonuçlar yine yazılır
+        self.refresh = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Önbellek dosyasına bağlanır, tablo yoksa oluşturur."""
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                connection.execute(CREATE_CACHE_TABLE_SQL)
+                connection.commit()
+                self._initialized = True
+        return connection
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Önbellekteki değeri döndürür.
+
+        Args:
+            key (str): Önbellek anahtarı.
+
+        Returns:
+            Optional[Any]: Süresi dolmamış değer, yoksa None.
+        """
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute(
+                    "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+            finally:
+                connection.close()
+            return loads_json(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any, expire: int = DEFAULT_TTL_SECONDS) -> bool:
+        """
+        Değeri önbelleğe yazar.
+
+        Args:
+            key (str): Önbellek anahtarı.
+            value (Any): JSON'a çevrilebilir değer.
+            expire (int): Geçerlilik süresi (saniye).
+
+        Returns:
+            bool: Yazma başarılıysa True.
+        """
+        try:
+            payload = dumps_json(value)
+            connection = self._connect()
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, payload, time.time() + expire)
+                )
+                connection.commit()
+            finally:
+                connection.close()
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Response cache write failed: {e}")
+            return False
+
+    def clear(self) -> bool:
+        """
+        Önbellekteki tüm kayıtları siler.
+
+        Returns:
+            bool: Silme başarılıysa True.
+        """
+        try:
+            connection = self._connect()
+            try:
+                connection.execute("DELETE FROM responses")
+                connection.commit()
+            finally:
+                connection.close()
+            logger.info("Response cache cleared")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Response cache clear failed: {e}")
+            return False
+
+    def memoize(self,
+                key_builder: Callable[[Dict[str, Any]], Any],
+                expire: int = DEFAULT_TTL_SECONDS,
+                should_cache: Callable[[Any], bool] = bool) -> Callable:
+        """
+        Bir metodun sonucunu, normalize edilmiş argümanlarına göre önbelleğe alan dekoratör.
+
+        Yalnızca `should_cache(sonuç)` True olan sonuçlar yazılır. Varsayılan `bool`,
+        hata durumunda dönen boş liste/None değerlerini dışarıda bırakır; hata
+        durumunda da dolu bir sözlük döndüren metotlar kendi koşulunu vermelidir.
+        `refresh` açıksa önbellekten okunmaz.
+
+        Args:
+            key_builder (Callable): `self` hariç bağlanmış argümanları alıp
+                                    anahtar parçasını döndüren fonksiyon.
+            expire (int): Geçerlilik süresi (saniye).
+            should_cache (Callable): Sonucun önbelleğe yazılıp yazılmayacağını belirler.
+
+        Returns:
+            Callable: Dekoratör.
+        """
+        def decorator(func: Callable) -> Callable:
+            signature = inspect.signature(func)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+                arguments.pop("self", None)
+                key = f"{func.__qualname__}:{json.dumps(key_builder(arguments), sort_keys=True, default=str)}"
+
+                if not self.refresh:
+                    cached = self.get(key)
+                    if cached is not None:
+                        logger.info(f"Response cache hit: {func.__qualname__}")
+                        return cached
+
+                result = func(*args, **kwargs)
+                if result is not None and should_cache(result):
+                    self.set(key, result, expire)
+                return result
+
+            return wrapper
+
+        return decorator
+
+
+# Global önbellek instance
+response_cache = ResponseCache()
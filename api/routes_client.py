@@ -1,5 +1,6 @@
 import requests
 import json
+import threading
 import time
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timezone, timedelta
@@ -30,11 +31,16 @@ class GoogleRoutesClient:
         self.config = config
         self.config.validate_api_keys()
         self.session = requests.Session()
+        self.session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=self.config.http_pool_size,
+            pool_maxsize=self.config.http_pool_size
+        ))
         self.session.headers.update(self.config.get_headers())
         
         # Rate limiting
         self.last_request_time = 0
         self.min_interval = 60 / self.config.requests_per_minute  # seconds between requests
+        self._rate_lock = threading.Lock()  # Rotalar paralel hesaplanırken istek sırası paylaşılır
         
     def _rate_limit(self):
         """
@@ -42,17 +48,19 @@ class GoogleRoutesClient:
         
         `config` dosyasında belirtilen `requests_per_minute` değerine göre,
         ardışık iki istek arasında geçmesi gereken minimum süreyi kontrol eder.
-        Gerekirse, bir sonraki isteği yapmadan önce programı bekletir.
+        Gerekirse, bir sonraki isteği yapmadan önce programı bekletir. Thread'ler
+        arasında güvenlidir: her çağrı kilit altında kendi istek zamanını ayırır,
+        beklemeyi kilit dışında yapar.
         """
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        with self._rate_lock:
+            current_time = time.time()
+            request_time = max(current_time, self.last_request_time + self.min_interval)
+            self.last_request_time = request_time
         
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
+        sleep_time = request_time - current_time
+        if sleep_time > 0:
             logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
-            
-        self.last_request_time = time.time()
     
     def compute_route(self, 
                      origin: Dict[str, float], 
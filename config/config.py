@@ -35,6 +35,13 @@ class Config:
         # Rate limiting
         self.requests_per_minute = 60
         self.requests_per_day = 25000
+        
+        # HTTP bağlantı havuzu (eşzamanlı aramalarda TLS bağlantıları yeniden kullanılır)
+        self.http_pool_size = 20
+        
+        # 429/5xx yanıtlarında üstel geri çekilme ile yeniden deneme (Retry-After başlığına uyulur)
+        self.http_max_retries = 3
+        self.http_backoff_factor = 0.5
     
     def _get_config_value(self, key: str, default: Optional[str] = None) -> Optional[str]:
         """
@@ -184,6 +184,8 @@ LOG_MSG_DB_OUTPUT = "   🗃️  Database: {db_path}"
 LOG_MSG_TOTALS = "   📈 Toplam: {stations} istasyon, {countries} ülke"
 LOG_MSG_EXCEL_EXPORT_SUCCESS = "📊 Excel dosyası kaydedildi: {filename}"
 LOG_MSG_EXCEL_EXPORT_ERROR = "❌ Excel export hatası: {error}"
+LOG_MSG_JSON_EXPORT_SUCCESS = "📄 JSON dosyaları kaydedildi: {summary_file}, {stations_file}"
+LOG_MSG_JSON_EXPORT_ERROR = "❌ JSON export hatası: {error}"
 COMPREHENSIVE_FUEL_DATA_FILENAME_PREFIX = "comprehensive_fuel_data_"
 FUEL_STATIONS_DATA_FILENAME_PREFIX = "fuel_stations_data_"
 
@@ -6,7 +6,7 @@ Google Routes ve Places API'lerinden rota ve yakıt istasyonu verisi çeker
 
 import sys
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from api.routes_client import GoogleRoutesClient
 from api.places_client import GooglePlacesClient
@@ -14,10 +14,16 @@ import logging
 from polyline import decode as decode_polyline
 from math import radians, sin, cos, sqrt, atan2
 from config import constants
+from utils.json_utils import dumps_json_bytes
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Eşzamanlı istek sayıları. 429 yanıtları istemcinin yeniden deneme/backoff
+# ayarlarıyla karşılanır; istekler arasında sabit bekleme yapılmaz
+ROUTE_COLLECTION_WORKERS = 4
+ROUTE_SEARCH_WORKERS = 4
+
 def haversine_distance(lat1, lon1, lat2, lon2):
     """
     İki coğrafi nokta arasındaki mesafeyi Haversine formülü kullanarak hesaplar.
@@ -75,7 +81,8 @@ class DataCollector:
         Rota geometrisini temsil eden polyline'ı kullanarak, rota boyunca
         belirli aralıklarla (STATION_SEARCH_INTERVAL_KM) ve belirli bir
         yarıçap içinde (STATION_SEARCH_RADIUS_METERS) yakıt istasyonlarını arar.
-        Tekrarlanan istasyonları önlemek için bir set kullanır.
+        Arama noktaları önce belirlenir, aramalar eşzamanlı yapılır. Tekrarlanan
+        istasyonlar, istasyon kimliğine göre tutulan bir sözlükle ayıklanır.
 
         Args:
             polyline (str): Rota geometrisini kodlanmış olarak içeren polyline dizesi.
@@ -90,9 +97,8 @@ class DataCollector:
         if not decoded_points:
             return []
 
-        collected_station_ids = set()
-        all_stations = []
-        
+        # Arama noktaları yalnızca geometriye bağlıdır; önce hepsi belirlenir
+        search_points = []
         last_search_point = decoded_points[0]
         
         for point in decoded_points[1:]:
@@ -102,27 +108,37 @@ class DataCollector:
             )
             
             if distance >= constants.STATION_SEARCH_INTERVAL_KM:
-                logger.info(constants.LOG_MSG_ROUTE_STATION_SEARCH.format(point=point))
-                nearby_stations = self.places_client.search_nearby(
-                    latitude=point[0],
-                    longitude=point[1],
-                    radius_meters=constants.STATION_SEARCH_RADIUS_METERS,
-                    place_types=['gas_station']
-                )
-                
-                for station in nearby_stations:
-                    station_id = station.get('id')
-                    if station_id and station_id not in collected_station_ids:
-                        all_stations.append(station)
-                        collected_station_ids.add(station_id)
-                
+                search_points.append(point)
                 last_search_point = point
-                time.sleep(1) # Rate limiting
+        
+        def search_point(point) -> list:
+            logger.info(constants.LOG_MSG_ROUTE_STATION_SEARCH.format(point=point))
+            return self.places_client.search_nearby(
+                latitude=point[0],
+                longitude=point[1],
+                radius_meters=constants.STATION_SEARCH_RADIUS_METERS,
+                place_types=['gas_station']
+            )
+        
+        # Aramalar eşzamanlı yapılır; sonuçlar rota sırasıyla birleştirilir
+        with ThreadPoolExecutor(max_workers=ROUTE_SEARCH_WORKERS) as executor:
+            point_results = list(executor.map(search_point, search_points))
+        
+        # station_id -> ham istasyon; tekilleştirme ve rota sırası tek sözlükle korunur
+        stations_by_id = {}
+        
+        for nearby_stations in point_results:
+            for station in nearby_stations:
+                station_id = station.get('id')
+                if station_id and station_id not in stations_by_id:
+                    stations_by_id[station_id] = station
+        
+        all_stations = list(stations_by_id.values())
 
         logger.info(constants.LOG_MSG_ROUTE_STATIONS_FOUND.format(count=len(all_stations)))
         return all_stations
 
-    def collect_route_data(self, route_config: dict) -> dict:
+    def collect_route_data(self, route_config: dict, ts: str = None) -> dict:
         """
         Tek bir rota ve üzerindeki istasyonlar için veri toplar.
 
@@ -134,6 +150,7 @@ class DataCollector:
         Args:
             route_config (dict): 'id', 'name', 'origin' ve 'destination' anahtarlarını
                                  içeren rota yapılandırma sözlüğü.
+            ts (str, optional): Toplama turunun ISO zaman damgası. Verilmezse o an kullanılır.
 
         Returns:
             dict: Rota detaylarını ve bulunan istasyonları içeren bir sözlük.
@@ -166,7 +183,7 @@ class DataCollector:
                 'distance_km': round(route_details.get('distance_km', 0), 1),
                 'duration_minutes': int(route_details.get('duration_minutes', 0)),
                 'polyline': route_details.get('polyline'),
-                'last_updated': datetime.now(timezone.utc).isoformat(),
+                'last_updated': ts or datetime.now(timezone.utc).isoformat(),
                 'fuel_stations': stations
             }
             
@@ -198,18 +215,25 @@ class DataCollector:
         collected_routes = []
         total_stations_found = 0
         
-        for route_config in self.routes_to_collect:
-            route_data = self.collect_route_data(route_config)
+        # Tur zaman damgası bir kez alınır; rotalar, özet ve metadata aynı anı gösterir
+        collection_ts = datetime.now(timezone.utc).isoformat()
+        
+        # Rotalar birbirinden bağımsızdır; eşzamanlı toplanır, sıra korunur
+        with ThreadPoolExecutor(max_workers=ROUTE_COLLECTION_WORKERS) as executor:
+            route_results = list(executor.map(
+                lambda route_config: self.collect_route_data(route_config, collection_ts),
+                self.routes_to_collect
+            ))
+        
+        for route_data in route_results:
             if route_data:
                 collected_routes.append(route_data)
                 total_stations_found += len(route_data.get('fuel_stations', []))
-            
-            time.sleep(2) # Rotalar arası bekleme
         
         summary = {
             'total_routes_collected': len(collected_routes),
             'total_stations_found': total_stations_found,
-            'collection_time': datetime.now(timezone.utc).isoformat()
+            'collection_time': collection_ts
         }
         
         output_data = {
@@ -218,13 +242,13 @@ class DataCollector:
             'metadata': {
                 'api_source': constants.METADATA_API_SOURCE,
                 'data_quality': constants.METADATA_DATA_QUALITY,
-                'collection_timestamp': datetime.now(timezone.utc).isoformat(),
+                'collection_timestamp': collection_ts,
                 'version': constants.METADATA_VERSION
             }
         }
         
-        with open(self.data_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(self.data_file, 'wb') as f:
+            f.write(dumps_json_bytes(output_data, indent=True))
         
         logger.info(constants.LOG_MSG_DATA_SAVED.format(file=self.data_file))
         logger.info(constants.LOG_MSG_SUMMARY.format(routes=summary['total_routes_collected'], stations=summary['total_stations_found']))
@@ -6,7 +6,7 @@ Veri modelleri ve veri toplama sistemi
 
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 import json
@@ -14,7 +14,7 @@ import sqlite3
 from pathlib import Path
 from config import constants
 
-@dataclass
+@dataclass(slots=True)
 class FuelStationData:
     """
     Bir benzin istasyonunun tüm verilerini temsil eden veri sınıfı (dataclass).
@@ -80,7 +80,93 @@ class FuelStationData:
             'last_updated': self.last_updated.isoformat()
         }
 
-@dataclass
+@dataclass(slots=True)
+class StationRow:
+    """
+    EnhancedDataCollector'ın ürettiği zenginleştirilmiş tek bir mekan kaydı.
+    
+    Her mekanda bulunan alanlar slot olarak tutulur; toplama seçeneklerine bağlı
+    ve mekan türüne özgü alanlar (örn: 'parking_options', 'cuisine_type') `extra`
+    sözlüğündedir. Mevcut tüketiciler için `get`, `[]` ve `in` ile sözlük gibi
+    okunabilir.
+    """
+    station_id: str
+    name: str
+    brand: str
+    country: str
+    city: str
+    region: str
+    latitude: float
+    longitude: float
+    address: str
+    short_formatted_address: str
+    rating: float
+    review_count: int
+    business_status: str
+    primary_type: str
+    primary_type_display_name: str
+    services: List[str]
+    operating_hours: Dict[str, str]
+    last_updated: str
+    data_source: str
+    collection_timestamp: str
+    fuel_types: List[str]
+    price_data: Dict[str, Any]
+    facilities: Dict[str, Any]
+    fuel_options: Dict[str, Any]
+    ev_charge_options: Dict[str, Any]
+    secondary_opening_hours: Dict[str, Any]
+    sub_destinations: List[Any]
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StationRow':
+        """
+        Zenginleştirilmiş mekan sözlüğünden StationRow oluşturur.
+
+        Args:
+            data (Dict[str, Any]): Tüm sabit alanları içeren mekan sözlüğü.
+
+        Returns:
+            StationRow: Sabit alanlar slotlarda, kalanlar `extra` içinde.
+        """
+        extra = {key: value for key, value in data.items() if key not in _STATION_ROW_FIELD_SET}
+        return cls(**{name: data[name] for name in STATION_ROW_FIELDS}, extra=extra)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get ile aynı: alan yoksa `default` döner."""
+        if key in _STATION_ROW_FIELD_SET:
+            return getattr(self, key)
+        return self.extra.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in _STATION_ROW_FIELD_SET:
+            return getattr(self, key)
+        return self.extra[key]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in _STATION_ROW_FIELD_SET or key in self.extra
+    
+    def keys(self) -> List[str]:
+        """Sabit alanlar ve ardından `extra` anahtarları."""
+        return [*STATION_ROW_FIELDS, *self.extra]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Kaydı düz bir sözlüğe çevirir (`extra` alanları üst seviyeye açılır).
+
+        Returns:
+            Dict[str, Any]: Mekan sözlüğü.
+        """
+        data = {name: getattr(self, name) for name in STATION_ROW_FIELDS}
+        data.update(self.extra)
+        return data
+
+# StationRow'un sabit (slot) alanları, tanım sırasıyla
+STATION_ROW_FIELDS = tuple(f.name for f in fields(StationRow) if f.name != 'extra')
+_STATION_ROW_FIELD_SET = frozenset(STATION_ROW_FIELDS)
+
+@dataclass(slots=True)
 class RouteData:
     """
     Bir rotanın tüm verilerini ve analizlerini temsil eden veri sınıfı (dataclass).
@@ -149,7 +235,7 @@ class RouteData:
             'created_at': self.created_at.isoformat()
         }
 
-@dataclass
+@dataclass(slots=True)
 class TruckServiceData:
     """
     Kamyon ve şoför hizmetlerini temsil eden veri sınıfı.
@@ -213,7 +299,7 @@ class TruckServiceData:
             'last_updated': self.last_updated.isoformat()
         }
 
-@dataclass
+@dataclass(slots=True)
 class DriverAmenityData:
     """
     Şoför konfor hizmetlerini temsil eden veri sınıfı.
@@ -280,7 +366,7 @@ class DriverAmenityData:
             'last_updated': self.last_updated.isoformat()
         }
 
-@dataclass
+@dataclass(slots=True)
 class EmergencyServiceData:
     """
     Acil durum hizmetlerini temsil eden veri sınıfı.
@@ -399,6 +485,38 @@ class DataWarehouse:
         conn.commit()
         conn.close()
     
+    def insert_fuel_stations_bulk(self, stations: List[FuelStationData]) -> int:
+        """
+        Birden fazla benzin istasyonunu tek bir transaction içinde ekler veya günceller.
+        
+        Satırlar `executemany` ile yazılır ve tek `commit` yapılır; istasyon başına
+        ayrı bağlantı ve commit maliyeti oluşmaz.
+        
+        Args:
+            stations (List[FuelStationData]): Eklenecek istasyonlar.
+        
+        Returns:
+            int: Eklenen/güncellenen satır sayısı.
+        """
+        if not stations:
+            return 0
+        
+        rows = [station.to_dict() for station in stations]
+        columns = list(rows[0])
+        query = constants.SQL_INSERT_OR_REPLACE.format(
+            table=constants.TABLE_FUEL_STATIONS,
+            columns=', '.join(columns),
+            placeholders=', '.join(['?' for _ in columns])
+        )
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(query, ([row[column] for column in columns] for row in rows))
+        finally:
+            conn.close()
+        return len(rows)
+    
     def insert_route(self, route: RouteData):
         """
         Veritabanına bir rota kaydı ekler veya mevcut kaydı günceller.
@@ -599,6 +717,7 @@ class RealTimeDataCollector:
         self.warehouse = warehouse
         self.weather_api_key = None  # Meteoroloji API anahtarı
         self.traffic_api_key = None  # Trafik API anahtarı
+        self.rng = np.random.default_rng()  # Mock veriler için örneğe ait üreteç
     
     def collect_weather_data(self, lat: float, lng: float) -> Dict[str, Any]:
         """
@@ -615,13 +734,14 @@ class RealTimeDataCollector:
         """
         # OpenWeatherMap veya benzeri API kullanılabilir
         # Şimdilik mock data
+        rng = self.rng
         return {
-            "temperature": np.random.normal(20, 10),
-            "humidity": np.random.normal(60, 20),
-            "wind_speed": np.random.normal(10, 5),
-            "precipitation": np.random.exponential(2),
-            "visibility": np.random.normal(10, 3),
-            "pressure": np.random.normal(1013, 20)
+            "temperature": float(rng.normal(20, 10)),
+            "humidity": float(rng.normal(60, 20)),
+            "wind_speed": float(rng.normal(10, 5)),
+            "precipitation": float(rng.exponential(2)),
+            "visibility": float(rng.normal(10, 3)),
+            "pressure": float(rng.normal(1013, 20))
         }
     
     def collect_traffic_data(self, route_polyline: str) -> Dict[str, Any]:
@@ -638,12 +758,13 @@ class RealTimeDataCollector:
         """
         # Google Traffic API veya Mapbox Traffic API kullanılabilir
         # Şimdilik mock data
+        rng = self.rng
         return {
-            "traffic_level": np.random.choice(constants.TRAFFIC_LEVELS),
-            "average_speed": np.random.normal(60, 20),
-            "congestion_factor": np.random.uniform(1.0, 3.0),
+            "traffic_level": constants.TRAFFIC_LEVELS[rng.integers(len(constants.TRAFFIC_LEVELS))],
+            "average_speed": float(rng.normal(60, 20)),
+            "congestion_factor": float(rng.uniform(1.0, 3.0)),
             "incidents": [],
-            "construction_zones": np.random.randint(0, 5)
+            "construction_zones": int(rng.integers(0, 5))
         }
     
     def calculate_fuel_consumption(self, distance_km: float, vehicle_type: str, 
@@ -702,12 +823,14 @@ class RealTimeDataCollector:
             RouteData: Tüm hesaplanmış ve toplanmış verileri içeren rota nesnesi.
         """
         
+        created_at = datetime.now()
+        
         # Google Routes API'dan temel rota bilgisi
         # (Mevcut GoogleRoutesClient kullanılabilir)
         
         # Mock data for demonstration
-        distance_km = np.random.uniform(50, 500)
-        base_duration = distance_km / np.random.uniform(50, 100)
+        distance_km = float(self.rng.uniform(50, 500))
+        base_duration = distance_km / float(self.rng.uniform(50, 100))
         
         # Hava durumu verisi
         weather = self.collect_weather_data(origin["latitude"], origin["longitude"])
@@ -744,7 +867,7 @@ class RealTimeDataCollector:
         }
         
         return RouteData(
-            route_id=f"route_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            route_id=f"route_{created_at.strftime('%Y%m%d_%H%M%S')}",
             origin_lat=origin["latitude"],
             origin_lng=origin["longitude"],
             dest_lat=destination["latitude"],
@@ -760,7 +883,7 @@ class RealTimeDataCollector:
             vehicle_type=vehicle_type,
             fuel_stations_en_route=[],
             cost_analysis=cost_analysis,
-            created_at=datetime.now()
+            created_at=created_at
         )
 
 class FuelDB:
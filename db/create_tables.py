@@ -5,12 +5,536 @@ Fuel2go uygulaması için gerekli tüm tabloları oluşturur
 """
 
 import logging
-from datetime import datetime
+import re
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional
 from db.postgresql_config import postgresql_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Konum sorguları geography(Point) kolonları ve SP-GiST indeksleri için PostGIS kullanır.
+# Eklenti şema transaction'ından ayrı kontrol edilir: eklenti oluşturma yetkisi olmayan bir
+# uygulama kullanıcısı, eklenti zaten kuruluysa şemayı yine de oluşturabilir
+POSTGIS_INSTALLED_SQL = """
+    SELECT 1 FROM pg_extension WHERE extname = 'postgis';
+"""
+
+POSTGIS_EXTENSION_SQL = """
+    CREATE EXTENSION IF NOT EXISTS postgis;
+"""
+
+def geography_point(longitude_column: str, latitude_column: str) -> str:
+    """
+    Enlem/boylam kolonlarından türetilen geography(Point) kolon tipini döndürür.
+    
+    Args:
+        longitude_column (str): Boylam kolonu adı
+        latitude_column (str): Enlem kolonu adı
+        
+    Returns:
+        str: GENERATED ALWAYS AS ... STORED kolon tanımı
+    """
+    return (
+        "geography(Point, 4326) GENERATED ALWAYS AS ("
+        f"ST_SetSRID(ST_MakePoint({longitude_column}, {latitude_column}), 4326)::geography"
+        ") STORED"
+    )
+
+# İstasyon adından marka sınıflandırması; satır yazılırken bir kez hesaplanıp saklanır
+FUEL_BRAND_CASE_SQL = (
+    "CASE"
+    " WHEN name ILIKE '%shell%' THEN 'Shell'"
+    " WHEN name ILIKE '%bp%' THEN 'BP'"
+    " WHEN name ILIKE '%total%' THEN 'Total'"
+    " WHEN name ILIKE '%opet%' THEN 'Opet'"
+    " WHEN name ILIKE '%petrol ofisi%' OR name ILIKE '%po%' THEN 'Petrol Ofisi'"
+    " WHEN name ILIKE '%türkiye petrolleri%' OR name ILIKE '%tp%' THEN 'TP'"
+    " ELSE 'Diğer'"
+    " END"
+)
+
+# Tablo şeması: her tablo için kolonlar ve indeksler.
+# Liste sırası oluşturma sırasıdır (foreign key bağımlılıklarına göre).
+# İndeks alanları: name, columns (kolon veya ifade listesi), using (varsayılan B-Tree), where (kısmi indeks),
+# include (index-only scan için kapsayıcı kolonlar), with (indeks depolama parametreleri)
+#
+# Ekleme sırasıyla ilişkili zaman kolonları (append-only tablolar) B-Tree yerine çok daha
+# küçük BRIN indeksleriyle indekslenir.
+# İsteğe bağlı tablo alanları: primary_key (bileşik birincil anahtar), partition_by (aylık bölümleme),
+# added_columns (ilk şemadan sonra eklenen kolonlar; CREATE TABLE IF NOT EXISTS var olan tabloyu
+# atladığından bunlar ALTER TABLE ... ADD COLUMN IF NOT EXISTS ile indekslerden önce eklenir)
+#
+# place_id UNIQUE olan tablolar (fuel_stations, truck_services, driver_amenities,
+# emergency_services) önce SELECT yapıp sonra INSERT etmek yerine tek ifadeyle upsert edilir:
+#   INSERT INTO fuel_stations (...) VALUES %s
+#   ON CONFLICT (place_id) DO UPDATE SET name = EXCLUDED.name, ..., updated_at = CURRENT_TIMESTAMP
+#   RETURNING id
+# ON CONFLICT, UNIQUE kısıtının kendi indeksini kullanır; place_id için ayrıca indeks tanımlanmaz.
+SCHEMA = [
+    {
+        'name': 'fuel_stations',
+        'label': 'Fuel stations',
+        'columns': [
+            ('id', 'SERIAL PRIMARY KEY'),
+            ('place_id', 'VARCHAR(255) UNIQUE NOT NULL'),
+            ('name', 'VARCHAR(255) NOT NULL'),
+            ('brand', f"VARCHAR(50) GENERATED ALWAYS AS ({FUEL_BRAND_CASE_SQL}) STORED"),
+            ('address', 'TEXT'),
+            ('short_formatted_address', 'TEXT'),
+            ('latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('geom', geography_point('longitude', 'latitude')),
+            ('primary_type', 'VARCHAR(100)'),
+            ('primary_type_display_name', 'VARCHAR(255)'),
+            ('fuel_types', 'JSONB'),
+            ('fuel_options', 'JSONB'),
+            ('ev_charge_options', 'JSONB'),
+            ('parking_options', 'JSONB'),
+            ('payment_options', 'JSONB'),
+            ('accessibility_options', 'JSONB'),
+            ('secondary_opening_hours', 'JSONB'),
+            ('sub_destinations', 'JSONB'),
+            ('amenities', 'JSONB'),
+            ('opening_hours', 'JSONB'),
+            ('phone_number', 'VARCHAR(50)'),
+            ('website', 'VARCHAR(255)'),
+            ('rating', 'DECIMAL(3, 2)'),
+            ('price_level', 'INTEGER'),
+            ('business_status', 'VARCHAR(50)'),
+            ('types', 'JSONB'),
+            ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        'added_columns': ('brand', 'geom'),
+        'indexes': [
+            {'name': 'idx_fuel_stations_geom', 'using': 'SPGIST', 'columns': 'geom'},
+            {'name': 'idx_fuel_stations_name', 'columns': 'name'},
+            {'name': 'idx_fuel_stations_brand', 'columns': 'brand'},
+            {'name': 'idx_fuel_stations_ev_charge', 'using': 'GIN', 'columns': 'ev_charge_options', 'where': "ev_charge_options->>'available' = 'true'"},
+            {'name': 'idx_fuel_stations_accessibility', 'using': 'GIN', 'columns': 'accessibility_options'},
+            {'name': 'idx_fuel_stations_fuel_options', 'using': 'GIN', 'columns': 'fuel_options'},
+            # @> containment sorguları için jsonb_path_ops (daha küçük ve hızlı GIN)
+            {'name': 'idx_fuel_stations_fuel_types_gin', 'using': 'GIN', 'columns': 'fuel_types jsonb_path_ops'},
+            {'name': 'idx_fuel_stations_amenities_gin', 'using': 'GIN', 'columns': 'amenities jsonb_path_ops'},
+            # İç içe yol indeksi: ev_charge_options -> 'connector_aggregation' @> '[{"type": ...}]'
+            {'name': 'idx_fuel_stations_ev_connectors_gin', 'using': 'GIN', 'columns': "(ev_charge_options -> 'connector_aggregation') jsonb_path_ops"},
+            # Analitik sayımlarındaki JSONB boolean filtreleri için kısmi indeksler: filtre indeks
+            # koşulunda, anahtar en küçük kolon; COUNT(*) küçük bir index-only scan'e dönüşür
+            {'name': 'idx_fuel_stations_ev_available', 'columns': 'id', 'where': "ev_charge_options->>'available' = 'true'"},
+            {'name': 'idx_fuel_stations_wheelchair', 'columns': 'id', 'where': "accessibility_options->>'wheelchair_accessible_entrance' = 'true'"},
+            {'name': 'idx_fuel_stations_parking', 'columns': 'id', 'where': "parking_options->>'free_parking_lot' = 'true' OR parking_options->>'paid_parking_lot' = 'true'"},
+            {'name': 'idx_fuel_stations_credit_cards', 'columns': 'id', 'where': "payment_options->>'accepts_credit_cards' = 'true'"},
+            {'name': 'idx_fuel_stations_nfc', 'columns': 'id', 'where': "payment_options->>'accepts_nfc' = 'true'"},
+        ],
+    },
+    {
+        'name': 'routes',
+        'label': 'Routes',
+        'columns': [
+            ('id', 'SERIAL'),
+            ('origin_latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('origin_longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('destination_latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('destination_longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('origin_address', 'TEXT'),
+            ('destination_address', 'TEXT'),
+            ('distance_meters', 'INTEGER'),
+            ('duration_seconds', 'INTEGER'),
+            ('polyline_encoded', 'TEXT'),
+            ('polyline_decoded', 'JSONB'),
+            ('route_legs', 'JSONB'),
+            ('route_steps', 'JSONB'),
+            ('route_instructions', 'JSONB'),
+            ('toll_info', 'JSONB'),
+            ('fuel_consumption_liters', 'DECIMAL(8, 2)'),
+            ('fuel_cost_estimate', 'DECIMAL(10, 2)'),
+            ('carbon_emissions_kg', 'DECIMAL(8, 2)'),
+            ('route_type', 'VARCHAR(50)'),
+            ('traffic_info', 'JSONB'),
+            ('created_at', 'TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+            ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        # Bölüm anahtarı birincil anahtarın parçası olmak zorunda. Bu yüzden routes(id) tek
+        # başına benzersiz değildir ve diğer tablolardaki route_id kolonları foreign key değildir.
+        'primary_key': 'id, created_at',
+        'partition_by': 'RANGE (created_at)',
+        'indexes': [
+            {'name': 'idx_routes_origin', 'columns': 'origin_latitude, origin_longitude'},
+            {'name': 'idx_routes_destination', 'columns': 'destination_latitude, destination_longitude'},
+            {'name': 'idx_routes_created_at_brin', 'using': 'BRIN', 'columns': 'created_at', 'with': 'pages_per_range = 32'},
+        ],
+    },
+    {
+        'name': 'truck_services',
+        'label': 'Truck services',
+        'columns': [
+            ('id', 'SERIAL PRIMARY KEY'),
+            ('place_id', 'VARCHAR(255) UNIQUE NOT NULL'),
+            ('name', 'VARCHAR(255) NOT NULL'),
+            ('address', 'TEXT'),
+            ('latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('geom', geography_point('longitude', 'latitude')),
+            ('service_type', 'VARCHAR(100) NOT NULL'),
+            ('services_offered', 'JSONB'),
+            ('truck_parking_available', 'BOOLEAN DEFAULT FALSE'),
+            ('adblue_available', 'BOOLEAN DEFAULT FALSE'),
+            ('mechanical_services', 'BOOLEAN DEFAULT FALSE'),
+            ('restaurant_available', 'BOOLEAN DEFAULT FALSE'),
+            ('shower_facilities', 'BOOLEAN DEFAULT FALSE'),
+            ('wifi_available', 'BOOLEAN DEFAULT FALSE'),
+            ('truck_washing', 'BOOLEAN DEFAULT FALSE'),
+            ('fuel_types', 'JSONB'),
+            ('opening_hours', 'JSONB'),
+            ('phone_number', 'VARCHAR(50)'),
+            ('website', 'VARCHAR(255)'),
+            ('rating', 'DECIMAL(3, 2)'),
+            ('price_level', 'INTEGER'),
+            ('business_status', 'VARCHAR(50)'),
+            ('is_24_hours', 'BOOLEAN DEFAULT FALSE'),
+            ('truck_accessibility_info', 'JSONB'),
+            ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        'added_columns': ('geom',),
+        'indexes': [
+            {'name': 'idx_truck_services_geom', 'using': 'SPGIST', 'columns': 'geom'},
+            {'name': 'idx_truck_services_type', 'columns': 'service_type'},
+            {'name': 'idx_truck_services_adblue', 'columns': 'latitude, longitude', 'include': 'name, phone_number', 'where': 'adblue_available = TRUE'},
+            {'name': 'idx_truck_services_24h', 'columns': 'latitude, longitude', 'include': 'name, phone_number', 'where': 'is_24_hours = TRUE'},
+            {'name': 'idx_truck_services_offered_gin', 'using': 'GIN', 'columns': 'services_offered jsonb_path_ops'},
+            {'name': 'idx_truck_services_fuel_types_gin', 'using': 'GIN', 'columns': 'fuel_types jsonb_path_ops'},
+        ],
+    },
+    {
+        'name': 'driver_amenities',
+        'label': 'Driver amenities',
+        'columns': [
+            ('id', 'SERIAL PRIMARY KEY'),
+            ('place_id', 'VARCHAR(255) UNIQUE NOT NULL'),
+            ('name', 'VARCHAR(255) NOT NULL'),
+            ('address', 'TEXT'),
+            ('latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('geom', geography_point('longitude', 'latitude')),
+            ('amenity_type', 'VARCHAR(100) NOT NULL'),
+            ('amenity_category', 'VARCHAR(100)'),
+            ('sleep_facilities', 'BOOLEAN DEFAULT FALSE'),
+            ('rest_area_type', 'VARCHAR(50)'),
+            ('food_services', 'JSONB'),
+            ('accommodation_type', 'VARCHAR(50)'),
+            ('parking_capacity', 'INTEGER'),
+            ('security_features', 'JSONB'),
+            ('shower_facilities', 'BOOLEAN DEFAULT FALSE'),
+            ('laundry_facilities', 'BOOLEAN DEFAULT FALSE'),
+            ('wifi_available', 'BOOLEAN DEFAULT FALSE'),
+            ('entertainment_facilities', 'JSONB'),
+            ('accessibility_features', 'JSONB'),
+            ('pricing_info', 'JSONB'),
+            ('opening_hours', 'JSONB'),
+            ('phone_number', 'VARCHAR(50)'),
+            ('website', 'VARCHAR(255)'),
+            ('rating', 'DECIMAL(3, 2)'),
+            ('price_level', 'INTEGER'),
+            ('business_status', 'VARCHAR(50)'),
+            ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        'added_columns': ('geom',),
+        'indexes': [
+            {'name': 'idx_driver_amenities_geom', 'using': 'SPGIST', 'columns': 'geom'},
+            {'name': 'idx_driver_amenities_type', 'columns': 'amenity_type'},
+            {'name': 'idx_driver_amenities_sleep', 'columns': 'latitude, longitude', 'include': 'name, phone_number', 'where': 'sleep_facilities = TRUE'},
+        ],
+    },
+    {
+        'name': 'emergency_services',
+        'label': 'Emergency services',
+        'columns': [
+            ('id', 'SERIAL PRIMARY KEY'),
+            ('place_id', 'VARCHAR(255) UNIQUE NOT NULL'),
+            ('name', 'VARCHAR(255) NOT NULL'),
+            ('address', 'TEXT'),
+            ('latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('geom', geography_point('longitude', 'latitude')),
+            ('service_type', 'VARCHAR(100) NOT NULL'),
+            ('emergency_type', 'VARCHAR(100)'),
+            ('is_24_hours', 'BOOLEAN DEFAULT FALSE'),
+            ('phone_number', 'VARCHAR(50)'),
+            ('emergency_phone', 'VARCHAR(50)'),
+            ('website', 'VARCHAR(255)'),
+            ('services_offered', 'JSONB'),
+            ('equipment_available', 'JSONB'),
+            ('specializations', 'JSONB'),
+            ('response_time_minutes', 'INTEGER'),
+            ('coverage_area_km', 'INTEGER'),
+            ('rating', 'DECIMAL(3, 2)'),
+            ('business_status', 'VARCHAR(50)'),
+            ('opening_hours', 'JSONB'),
+            ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('updated_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        'added_columns': ('geom',),
+        'indexes': [
+            {'name': 'idx_emergency_services_geom', 'using': 'SPGIST', 'columns': 'geom'},
+            {'name': 'idx_emergency_services_type', 'columns': 'service_type'},
+            {'name': 'idx_emergency_services_24h', 'columns': 'latitude, longitude', 'include': 'name, phone_number', 'where': 'is_24_hours = TRUE'},
+        ],
+    },
+    {
+        'name': 'route_calculations',
+        'label': 'Route calculations',
+        'columns': [
+            ('id', 'SERIAL'),
+            ('session_id', 'VARCHAR(255)'),
+            ('route_id', 'INTEGER'),  # routes.id (bölümlü tablo, FK yok)
+            ('calculation_type', 'VARCHAR(100)'),
+            ('input_parameters', 'JSONB'),
+            ('results', 'JSONB'),
+            ('fuel_consumption_liters', 'DECIMAL(8, 2)'),
+            ('fuel_cost_total', 'DECIMAL(10, 2)'),
+            ('carbon_emissions_kg', 'DECIMAL(8, 2)'),
+            ('alternative_routes', 'JSONB'),
+            ('optimization_criteria', 'VARCHAR(100)'),
+            ('weather_conditions', 'JSONB'),
+            ('traffic_conditions', 'JSONB'),
+            ('vehicle_specifications', 'JSONB'),
+            ('calculation_duration_ms', 'INTEGER'),
+            ('created_at', 'TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        # Bölüm anahtarı birincil anahtarın parçası olmak zorunda
+        'primary_key': 'id, created_at',
+        'partition_by': 'RANGE (created_at)',
+        'indexes': [
+            {'name': 'idx_route_calculations_session', 'columns': 'session_id'},
+            {'name': 'idx_route_calculations_route', 'columns': 'route_id'},
+            {'name': 'idx_route_calculations_created_at_brin', 'using': 'BRIN', 'columns': 'created_at', 'with': 'pages_per_range = 32'},
+        ],
+    },
+    {
+        'name': 'driver_stops',
+        'label': 'Driver stops',
+        'columns': [
+            ('id', 'SERIAL PRIMARY KEY'),
+            ('route_id', 'INTEGER'),  # routes.id (bölümlü tablo, FK yok)
+            ('stop_sequence', 'INTEGER NOT NULL'),
+            ('stop_latitude', 'DOUBLE PRECISION NOT NULL'),
+            ('stop_longitude', 'DOUBLE PRECISION NOT NULL'),
+            ('geom', geography_point('stop_longitude', 'stop_latitude')),
+            ('stop_address', 'TEXT'),
+            ('distance_from_start_km', 'DECIMAL(8, 2)'),
+            ('estimated_arrival_time', 'TIMESTAMP'),
+            ('stop_duration_minutes', 'INTEGER'),
+            ('stop_type', 'VARCHAR(100)'),
+            ('services_available', 'JSONB'),
+            ('regulatory_compliance', 'JSONB'),
+            ('reason_for_stop', 'VARCHAR(255)'),
+            ('alternative_stops', 'JSONB'),
+            ('created_at', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        'added_columns': ('geom',),
+        'indexes': [
+            {'name': 'idx_driver_stops_route', 'columns': 'route_id'},
+            {'name': 'idx_driver_stops_geom', 'using': 'SPGIST', 'columns': 'geom'},
+            {'name': 'idx_driver_stops_sequence', 'columns': 'route_id, stop_sequence', 'include': 'stop_latitude, stop_longitude, stop_address'},
+        ],
+    },
+    {
+        'name': 'analytics',
+        'label': 'Analytics',
+        'columns': [
+            ('id', 'SERIAL'),
+            ('event_type', 'VARCHAR(100) NOT NULL'),
+            ('event_category', 'VARCHAR(100)'),
+            ('user_session_id', 'VARCHAR(255)'),
+            ('route_id', 'INTEGER'),  # routes.id (bölümlü tablo, FK yok)
+            ('event_data', 'JSONB'),
+            ('location_data', 'JSONB'),
+            ('performance_metrics', 'JSONB'),
+            ('user_interaction_data', 'JSONB'),
+            ('api_usage_data', 'JSONB'),
+            ('error_information', 'JSONB'),
+            ('timestamp', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+            ('created_at', 'TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+        ],
+        # Bölüm anahtarı birincil anahtarın parçası olmak zorunda
+        'primary_key': 'id, created_at',
+        'partition_by': 'RANGE (created_at)',
+        'indexes': [
+            {'name': 'idx_analytics_event_type', 'columns': 'event_type'},
+            {'name': 'idx_analytics_timestamp_brin', 'using': 'BRIN', 'columns': 'timestamp', 'with': 'pages_per_range = 32'},
+            {'name': 'idx_analytics_session', 'columns': 'user_session_id'},
+            {'name': 'idx_analytics_route', 'columns': 'route_id'},
+            {'name': 'idx_analytics_event_data_gin', 'using': 'GIN', 'columns': 'event_data jsonb_path_ops'},
+        ],
+    },
+]
+
+SCHEMA_BY_NAME = {table['name']: table for table in SCHEMA}
+
+# Bugünden itibaren kaç aylık bölüm (partition) hazır tutulacağı (bu ay + gelecek ay)
+PARTITION_MONTHS_AHEAD = 2
+
+# Bölümlenmiş bir tablonun alt bölümlerinin adları
+PARTITION_LIST_SQL = """
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    WHERE i.inhparent = %s::regclass;
+"""
+
+# Verilen tablolardan gerçekten bölümlenmiş olanlar (relkind = 'p'). Eski şemayla düz tablo
+# olarak oluşturulmuş tablolara PARTITION OF ifadesi "is not partitioned" hatası verir
+PARTITIONED_TABLES_SQL = """
+    SELECT relname
+    FROM pg_class
+    WHERE relkind = 'p' AND oid = ANY(ARRAY(SELECT to_regclass(name) FROM unnest(%s::text[]) AS name));
+"""
+
+def emit_index_ddl(table_name: str, index: Dict[str, str]) -> str:
+    """
+    Tek bir indeks tanımından CREATE INDEX ifadesi üretir.
+    
+    Args:
+        table_name (str): Tablo adı
+        index (Dict[str, str]): İndeks tanımı
+        
+    Returns:
+        str: CREATE INDEX ifadesi
+    """
+    using = f" USING {index['using']}" if index.get('using') else ""
+    include = f" INCLUDE ({index['include']})" if index.get('include') else ""
+    storage = f" WITH ({index['with']})" if index.get('with') else ""
+    where = f" WHERE {index['where']}" if index.get('where') else ""
+    return (
+        f"CREATE INDEX IF NOT EXISTS {index['name']}\n"
+        f"ON {table_name}{using} ({index['columns']}){include}{storage}{where};"
+    )
+
+def emit_add_column_ddl(table_name: str, column_name: str, definition: str) -> str:
+    """
+    Var olan tabloya sonradan eklenen bir kolon için ALTER TABLE ifadesi üretir.
+    
+    Args:
+        table_name (str): Tablo adı
+        column_name (str): Kolon adı
+        definition (str): SCHEMA'daki kolon tanımı
+        
+    Returns:
+        str: ALTER TABLE ... ADD COLUMN IF NOT EXISTS ifadesi
+    """
+    return f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column_name} {definition};"
+
+def emit_table_ddl(table: Dict[str, Any]) -> str:
+    """
+    Şema tanımından CREATE TABLE ve CREATE INDEX ifadelerini üretir.
+    
+    Args:
+        table (Dict[str, Any]): SCHEMA içindeki tablo tanımı
+        
+    Returns:
+        str: Tablo ve indekslerine ait DDL
+    """
+    column_lines = [f"    {name} {definition}" for name, definition in table['columns']]
+    if table.get('primary_key'):
+        column_lines.append(f"    PRIMARY KEY ({table['primary_key']})")
+    columns_sql = ",\n".join(column_lines)
+    partition_sql = f" PARTITION BY {table['partition_by']}" if table.get('partition_by') else ""
+    statements = [f"CREATE TABLE IF NOT EXISTS {table['name']} (\n{columns_sql}\n){partition_sql};"]
+    column_definitions = dict(table['columns'])
+    statements.extend(
+        emit_add_column_ddl(table['name'], name, column_definitions[name])
+        for name in table.get('added_columns', ())
+    )
+    statements.extend(emit_index_ddl(table['name'], index) for index in table['indexes'])
+    return "\n\n".join(statements) + "\n"
+
+def next_month_start(month_start: date) -> date:
+    """
+    Verilen ayı izleyen ayın ilk gününü döndürür.
+    
+    Args:
+        month_start (date): Herhangi bir ayın ilk günü
+        
+    Returns:
+        date: Sonraki ayın ilk günü
+    """
+    return (month_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+def partition_name(table_name: str, month_start: date) -> str:
+    """
+    Aylık bölüm tablosunun adını döndürür.
+    
+    Args:
+        table_name (str): Bölümlenmiş ana tablo adı
+        month_start (date): Bölümün başladığı ayın ilk günü
+        
+    Returns:
+        str: Bölüm adı (ör. analytics_y2025m01)
+    """
+    return f"{table_name}_y{month_start.year}m{month_start.month:02d}"
+
+def default_partition_name(table_name: str) -> str:
+    """
+    Bölümlenmiş tablonun DEFAULT bölümünün adını döndürür.
+    
+    Args:
+        table_name (str): Bölümlenmiş ana tablo adı
+        
+    Returns:
+        str: DEFAULT bölüm adı (ör. analytics_default)
+    """
+    return f"{table_name}_default"
+
+def partition_month(table_name: str, name: str) -> Optional[date]:
+    """
+    partition_name ile üretilmiş bir bölüm adından ayın ilk gününü çözer.
+    
+    Args:
+        table_name (str): Bölümlenmiş ana tablo adı
+        name (str): Bölüm tablosu adı
+        
+    Returns:
+        Optional[date]: Bölümün başladığı ay veya ad tanınmazsa None
+    """
+    match = re.fullmatch(rf"{re.escape(table_name)}_y(\d{{4}})m(\d{{2}})", name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+def emit_partition_ddl(table_name: str, month_start: date) -> str:
+    """
+    Aylık RANGE bölümü (partition) için CREATE TABLE ... PARTITION OF ifadesi üretir.
+    
+    Args:
+        table_name (str): Bölümlenmiş ana tablo adı
+        month_start (date): Bölümün başladığı ayın ilk günü
+        
+    Returns:
+        str: Bölüm DDL'i (ör. analytics_y2025m01)
+    """
+    next_month = next_month_start(month_start)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, month_start)} PARTITION OF {table_name}\n"
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}');"
+    )
+
+def emit_default_partition_ddl(table_name: str) -> str:
+    """
+    Bölümlenmiş tablo için DEFAULT bölüm DDL'i üretir.
+    
+    Aylık bölümü henüz oluşturulmamış satırlar eklemeyi düşürmek yerine buraya yazılır.
+    
+    Args:
+        table_name (str): Bölümlenmiş ana tablo adı
+        
+    Returns:
+        str: CREATE TABLE ... PARTITION OF ... DEFAULT ifadesi
+    """
+    return f"CREATE TABLE IF NOT EXISTS {default_partition_name(table_name)} PARTITION OF {table_name} DEFAULT;"
+
 class TableCreator:
     """
     PostgreSQL tabloları oluşturma ve yönetme sınıfı.
@@ -22,197 +546,199 @@ class TableCreator:
         """
         self.config = postgresql_config
         
+    def _run(self, ddl_sql: str, label: str) -> bool:
+        """
+        Verilen DDL'i tek bir transaction içinde çalıştırır.
+        
+        Args:
+            ddl_sql (str): Çalıştırılacak DDL ifadeleri
+            label (str): Log mesajlarında kullanılacak etiket
+            
+        Returns:
+            bool: Başarılı ise True
+        """
+        try:
+            with self.config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(ddl_sql)
+            return True
+        except Exception as e:
+            logger.error(f"{label} oluşturma hatası: {e}")
+            return False
+    
+    def ensure_postgis(self) -> bool:
+        """
+        PostGIS eklentisinin kurulu olduğunu doğrular, değilse kurmayı dener.
+        
+        Eklenti yalnızca pg_extension'da yoksa ayrı bir transaction'da oluşturulur;
+        yetki yoksa şema DDL'i hiç çalıştırılmadan açık bir mesajla False döner.
+        
+        Returns:
+            bool: PostGIS kullanılabiliyorsa True
+        """
+        installed = self.config.execute_query(POSTGIS_INSTALLED_SQL)
+        if installed:
+            return True
+        if installed is not None and self._run(POSTGIS_EXTENSION_SQL, "PostGIS eklentisi"):
+            return True
+        
+        logger.error("❌ PostGIS eklentisi kurulu değil ve oluşturulamadı; veritabanı yöneticisinin "
+                     "'CREATE EXTENSION postgis;' çalıştırması gerekiyor")
+        return False
+    
+    def _create_table(self, table_name: str) -> bool:
+        """
+        SCHEMA içindeki tek bir tabloyu indeksleriyle birlikte oluşturur.
+        
+        Args:
+            table_name (str): Oluşturulacak tablo adı
+            
+        Returns:
+            bool: Başarılı ise True
+        """
+        table = SCHEMA_BY_NAME[table_name]
+        if not self.ensure_postgis():
+            return False
+        success = self._run(emit_table_ddl(table), f"{table['label']} tablosu")
+        self.config.invalidate_schema_cache()
+        if success and table.get('partition_by'):
+            success = self.ensure_partitions()
+        return success
+    
     def create_all_tables(self) -> bool:
         """
         Tüm tabloları oluşturur.
         
+        PostGIS eklentisi önce ayrı olarak doğrulanır. Ardından tüm DDL ifadeleri tek bir
+        sorgu ve tek bir transaction ile gönderilir; herhangi bir ifade başarısız olursa
+        şema değişikliklerinin tamamı geri alınır. Önceki şemayla oluşturulmuş tablolara
+        eksik kolonlar (added_columns) indekslerden önce eklenir.
+        Bölümler (DEFAULT ve aylık) şema transaction'ı dışında ensure_partitions ile oluşturulur.
+        
         Returns:
             bool: Tüm tablolar başarıyla oluşturulursa True
         """
-        tables_to_create = [
-            self.create_fuel_stations_table,
-            self.create_routes_table,
-            self.create_truck_services_table,
-            self.create_driver_amenities_table,
-            self.create_emergency_services_table,
-            self.create_route_calculations_table,
-            self.create_driver_stops_table,
-            self.create_analytics_table
-        ]
-        
         logger.info("PostgreSQL tabloları oluşturuluyor...")
         
-        for create_function in tables_to_create:
-            try:
-                if create_function():
-                    logger.info(f"✅ {create_function.__name__} başarılı")
-                else:
-                    logger.error(f"❌ {create_function.__name__} başarısız")
-                    return False
-            except Exception as e:
-                logger.error(f"❌ {create_function.__name__} hatası: {e}")
-                return False
+        if not self.ensure_postgis():
+            return False
+        
+        all_sql = "\n".join(emit_table_ddl(table) for table in SCHEMA)
+        
+        if not self._run(all_sql, "Şema"):
+            logger.error("❌ Tablolar oluşturulamadı, değişiklikler geri alındı")
+            return False
+        
+        self.config.invalidate_schema_cache()
+        self.config.prime_table_exists(table['name'] for table in SCHEMA)
+        
+        if not self.ensure_partitions():
+            logger.warning("⚠️ Aylık bölümler oluşturulamadı; bölümlenmiş tablolara ekleme yapılamayabilir")
+        
+        for table in SCHEMA:
+            logger.info(f"✅ {table['name']} tablosu hazır")
         
         logger.info("🎉 Tüm tablolar başarıyla oluşturuldu!")
         return True
     
-    def create_fuel_stations_table(self) -> bool:
+    def ensure_partitions(self, reference_date: Optional[date] = None) -> bool:
         """
-        Yakıt istasyonları tablosunu oluşturur.
+        Bölümlenmiş tablolar için bu ayın ve sonraki ayların bölümlerini oluşturur.
+        
+        Veri ambarı ilk eklemeden önce (ve her ay değiştiğinde) ile cleanup_old_data
+        tarafından çağrılır; var olan bölümler IF NOT EXISTS ile atlanır. Bölümü
+        bulunmayan satırlar DEFAULT bölüme yazılır; o ay için DEFAULT'ta satır varsa
+        aylık bölüm oluşturulamaz, satırların önce taşınması gerekir. Eski şemayla düz
+        tablo olarak oluşturulmuş tablolar (relkind != 'p') uyarıyla atlanır.
         
+        Args:
+            reference_date (date, optional): Başlangıç ayı için referans tarih (varsayılan: bugün)
+            
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS fuel_stations (
-            id SERIAL PRIMARY KEY,
-            place_id VARCHAR(255) UNIQUE NOT NULL,
-            name VARCHAR(255) NOT NULL,
-            address TEXT,
-            short_formatted_address TEXT,
-            latitude DECIMAL(10, 8) NOT NULL,
-            longitude DECIMAL(11, 8) NOT NULL,
-            primary_type VARCHAR(100),
-            primary_type_display_name VARCHAR(255),
-            fuel_types JSONB,
-            fuel_options JSONB,
-            ev_charge_options JSONB,
-            parking_options JSONB,
-            payment_options JSONB,
-            accessibility_options JSONB,
-            secondary_opening_hours JSONB,
-            sub_destinations JSONB,
-            amenities JSONB,
-            opening_hours JSONB,
-            phone_number VARCHAR(50),
-            website VARCHAR(255),
-            rating DECIMAL(3, 2),
-            price_level INTEGER,
-            business_status VARCHAR(50),
-            types JSONB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_fuel_stations_location 
-        ON fuel_stations USING GIST (
-            ll_to_earth(latitude, longitude)
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_fuel_stations_place_id 
-        ON fuel_stations (place_id);
-        
-        CREATE INDEX IF NOT EXISTS idx_fuel_stations_name 
-        ON fuel_stations (name);
+        month_start = (reference_date or date.today()).replace(day=1)
+        months = []
+        for _ in range(PARTITION_MONTHS_AHEAD):
+            months.append(month_start)
+            month_start = next_month_start(month_start)
+        
+        partition_tables = [table['name'] for table in SCHEMA if table.get('partition_by')]
+        rows = self.config.execute_query(PARTITIONED_TABLES_SQL, (partition_tables,))
+        if rows is None:
+            return False
+        partitioned = {row['relname'] for row in rows}
+        
+        # Her tablo ayrı transaction'da: bir tablodaki hata diğerlerini geri almaz
+        success = True
+        for table in SCHEMA:
+            if not table.get('partition_by'):
+                continue
+            if table['name'] not in partitioned:
+                logger.warning(f"⚠️ {table['name']} bölümlenmiş bir tablo değil (eski şema); "
+                               "aylık bölümler oluşturulmadı, tablo olduğu gibi kullanılıyor")
+                continue
+            partition_sql = "\n".join(
+                [emit_default_partition_ddl(table['name'])]
+                + [emit_partition_ddl(table['name'], month) for month in months]
+            )
+            success = self._run(partition_sql, f"{table['name']} aylık bölümleri") and success
+        
+        self.config.invalidate_schema_cache()
+        return success
+    
+    def drop_partitions_before(self, table_name: str, cutoff: date) -> Optional[int]:
         """
+        Tamamı cutoff tarihinden önce kalan aylık bölümleri siler.
         
-        try:
-            # PostGIS extension olmadığı için basit indeks kullanıyoruz
-            create_table_sql = """
-            CREATE TABLE IF NOT EXISTS fuel_stations (
-                id SERIAL PRIMARY KEY,
-                place_id VARCHAR(255) UNIQUE NOT NULL,
-                name VARCHAR(255) NOT NULL,
-                address TEXT,
-                short_formatted_address TEXT,
-                latitude DECIMAL(10, 8) NOT NULL,
-                longitude DECIMAL(11, 8) NOT NULL,
-                primary_type VARCHAR(100),
-                primary_type_display_name VARCHAR(255),
-                fuel_types JSONB,
-                fuel_options JSONB,
-                ev_charge_options JSONB,
-                parking_options JSONB,
-                payment_options JSONB,
-                accessibility_options JSONB,
-                secondary_opening_hours JSONB,
-                sub_destinations JSONB,
-                amenities JSONB,
-                opening_hours JSONB,
-                phone_number VARCHAR(50),
-                website VARCHAR(255),
-                rating DECIMAL(3, 2),
-                price_level INTEGER,
-                business_status VARCHAR(50),
-                types JSONB,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_lat_lng 
-            ON fuel_stations (latitude, longitude);
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_place_id 
-            ON fuel_stations (place_id);
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_name 
-            ON fuel_stations (name);
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_ev_charge 
-            ON fuel_stations USING GIN (ev_charge_options) WHERE ev_charge_options->>'available' = 'true';
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_accessibility 
-            ON fuel_stations USING GIN (accessibility_options);
-            
-            CREATE INDEX IF NOT EXISTS idx_fuel_stations_fuel_options 
-            ON fuel_stations USING GIN (fuel_options);
-            """
+        Satır satır DELETE yerine yalnızca katalog değişikliği yapılır. Cutoff'u içeren
+        ay silinmez; o aydaki eski satırlar çağıran tarafça ayrıca temizlenmelidir.
+        
+        Args:
+            table_name (str): Bölümlenmiş ana tablo adı
+            cutoff (date): Bu tarihten önce biten bölümler silinir
             
-            self.config.execute_query(create_table_sql)
-            return True
+        Returns:
+            Optional[int]: Silinen bölüm sayısı veya hata durumunda None
+        """
+        try:
+            with self.config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(PARTITION_LIST_SQL, (table_name,))
+                    expired = [
+                        row['relname'] for row in cursor.fetchall()
+                        if (month := partition_month(table_name, row['relname'])) is not None
+                        and next_month_start(month) <= cutoff
+                    ]
+                    if expired:
+                        cursor.execute(f"DROP TABLE IF EXISTS {', '.join(expired)};")
         except Exception as e:
-            logger.error(f"Fuel stations tablosu oluşturma hatası: {e}")
-            return False
+            logger.error(f"{table_name} bölümleri silinirken hata: {e}")
+            return None
+        finally:
+            self.config.invalidate_schema_cache()
+        
+        for name in expired:
+            logger.info(f"✅ {name} bölümü silindi")
+        return len(expired)
     
-    def create_routes_table(self) -> bool:
+    def create_fuel_stations_table(self) -> bool:
         """
-        Rotalar tablosunu oluşturur.
+        Yakıt istasyonları tablosunu oluşturur.
         
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS routes (
-            id SERIAL PRIMARY KEY,
-            origin_latitude DECIMAL(10, 8) NOT NULL,
-            origin_longitude DECIMAL(11, 8) NOT NULL,
-            destination_latitude DECIMAL(10, 8) NOT NULL,
-            destination_longitude DECIMAL(11, 8) NOT NULL,
-            origin_address TEXT,
-            destination_address TEXT,
-            distance_meters INTEGER,
-            duration_seconds INTEGER,
-            polyline_encoded TEXT,
-            polyline_decoded JSONB,
-            route_legs JSONB,
-            route_steps JSONB,
-            route_instructions JSONB,
-            toll_info JSONB,
-            fuel_consumption_liters DECIMAL(8, 2),
-            fuel_cost_estimate DECIMAL(10, 2),
-            carbon_emissions_kg DECIMAL(8, 2),
-            route_type VARCHAR(50),
-            traffic_info JSONB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_routes_origin 
-        ON routes (origin_latitude, origin_longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_routes_destination 
-        ON routes (destination_latitude, destination_longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_routes_created_at 
-        ON routes (created_at);
+        return self._create_table('fuel_stations')
+    
+    def create_routes_table(self) -> bool:
         """
+        Rotalar tablosunu oluşturur.
         
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Routes tablosu oluşturma hatası: {e}")
-            return False
+        Returns:
+            bool: Başarılı ise True
+        """
+        return self._create_table('routes')
     
     def create_truck_services_table(self) -> bool:
         """
@@ -221,55 +747,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS truck_services (
-            id SERIAL PRIMARY KEY,
-            place_id VARCHAR(255) UNIQUE NOT NULL,
-            name VARCHAR(255) NOT NULL,
-            address TEXT,
-            latitude DECIMAL(10, 8) NOT NULL,
-            longitude DECIMAL(11, 8) NOT NULL,
-            service_type VARCHAR(100) NOT NULL,
-            services_offered JSONB,
-            truck_parking_available BOOLEAN DEFAULT FALSE,
-            adblue_available BOOLEAN DEFAULT FALSE,
-            mechanical_services BOOLEAN DEFAULT FALSE,
-            restaurant_available BOOLEAN DEFAULT FALSE,
-            shower_facilities BOOLEAN DEFAULT FALSE,
-            wifi_available BOOLEAN DEFAULT FALSE,
-            truck_washing BOOLEAN DEFAULT FALSE,
-            fuel_types JSONB,
-            opening_hours JSONB,
-            phone_number VARCHAR(50),
-            website VARCHAR(255),
-            rating DECIMAL(3, 2),
-            price_level INTEGER,
-            business_status VARCHAR(50),
-            is_24_hours BOOLEAN DEFAULT FALSE,
-            truck_accessibility_info JSONB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_truck_services_location 
-        ON truck_services (latitude, longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_truck_services_type 
-        ON truck_services (service_type);
-        
-        CREATE INDEX IF NOT EXISTS idx_truck_services_adblue 
-        ON truck_services (adblue_available) WHERE adblue_available = TRUE;
-        
-        CREATE INDEX IF NOT EXISTS idx_truck_services_24h 
-        ON truck_services (is_24_hours) WHERE is_24_hours = TRUE;
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Truck services tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('truck_services')
     
     def create_driver_amenities_table(self) -> bool:
         """
@@ -278,54 +756,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS driver_amenities (
-            id SERIAL PRIMARY KEY,
-            place_id VARCHAR(255) UNIQUE NOT NULL,
-            name VARCHAR(255) NOT NULL,
-            address TEXT,
-            latitude DECIMAL(10, 8) NOT NULL,
-            longitude DECIMAL(11, 8) NOT NULL,
-            amenity_type VARCHAR(100) NOT NULL,
-            amenity_category VARCHAR(100),
-            sleep_facilities BOOLEAN DEFAULT FALSE,
-            rest_area_type VARCHAR(50),
-            food_services JSONB,
-            accommodation_type VARCHAR(50),
-            parking_capacity INTEGER,
-            security_features JSONB,
-            shower_facilities BOOLEAN DEFAULT FALSE,
-            laundry_facilities BOOLEAN DEFAULT FALSE,
-            wifi_available BOOLEAN DEFAULT FALSE,
-            entertainment_facilities JSONB,
-            accessibility_features JSONB,
-            pricing_info JSONB,
-            opening_hours JSONB,
-            phone_number VARCHAR(50),
-            website VARCHAR(255),
-            rating DECIMAL(3, 2),
-            price_level INTEGER,
-            business_status VARCHAR(50),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_amenities_location 
-        ON driver_amenities (latitude, longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_amenities_type 
-        ON driver_amenities (amenity_type);
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_amenities_sleep 
-        ON driver_amenities (sleep_facilities) WHERE sleep_facilities = TRUE;
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Driver amenities tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('driver_amenities')
     
     def create_emergency_services_table(self) -> bool:
         """
@@ -334,48 +765,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS emergency_services (
-            id SERIAL PRIMARY KEY,
-            place_id VARCHAR(255) UNIQUE NOT NULL,
-            name VARCHAR(255) NOT NULL,
-            address TEXT,
-            latitude DECIMAL(10, 8) NOT NULL,
-            longitude DECIMAL(11, 8) NOT NULL,
-            service_type VARCHAR(100) NOT NULL,
-            emergency_type VARCHAR(100),
-            is_24_hours BOOLEAN DEFAULT FALSE,
-            phone_number VARCHAR(50),
-            emergency_phone VARCHAR(50),
-            website VARCHAR(255),
-            services_offered JSONB,
-            equipment_available JSONB,
-            specializations JSONB,
-            response_time_minutes INTEGER,
-            coverage_area_km INTEGER,
-            rating DECIMAL(3, 2),
-            business_status VARCHAR(50),
-            opening_hours JSONB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_emergency_services_location 
-        ON emergency_services (latitude, longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_emergency_services_type 
-        ON emergency_services (service_type);
-        
-        CREATE INDEX IF NOT EXISTS idx_emergency_services_24h 
-        ON emergency_services (is_24_hours) WHERE is_24_hours = TRUE;
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Emergency services tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('emergency_services')
     
     def create_route_calculations_table(self) -> bool:
         """
@@ -384,42 +774,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS route_calculations (
-            id SERIAL PRIMARY KEY,
-            session_id VARCHAR(255),
-            route_id INTEGER REFERENCES routes(id),
-            calculation_type VARCHAR(100),
-            input_parameters JSONB,
-            results JSONB,
-            fuel_consumption_liters DECIMAL(8, 2),
-            fuel_cost_total DECIMAL(10, 2),
-            carbon_emissions_kg DECIMAL(8, 2),
-            alternative_routes JSONB,
-            optimization_criteria VARCHAR(100),
-            weather_conditions JSONB,
-            traffic_conditions JSONB,
-            vehicle_specifications JSONB,
-            calculation_duration_ms INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_route_calculations_session 
-        ON route_calculations (session_id);
-        
-        CREATE INDEX IF NOT EXISTS idx_route_calculations_route 
-        ON route_calculations (route_id);
-        
-        CREATE INDEX IF NOT EXISTS idx_route_calculations_created_at 
-        ON route_calculations (created_at);
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Route calculations tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('route_calculations')
     
     def create_driver_stops_table(self) -> bool:
         """
@@ -428,41 +783,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS driver_stops (
-            id SERIAL PRIMARY KEY,
-            route_id INTEGER REFERENCES routes(id),
-            stop_sequence INTEGER NOT NULL,
-            stop_latitude DECIMAL(10, 8) NOT NULL,
-            stop_longitude DECIMAL(11, 8) NOT NULL,
-            stop_address TEXT,
-            distance_from_start_km DECIMAL(8, 2),
-            estimated_arrival_time TIMESTAMP,
-            stop_duration_minutes INTEGER,
-            stop_type VARCHAR(100),
-            services_available JSONB,
-            regulatory_compliance JSONB,
-            reason_for_stop VARCHAR(255),
-            alternative_stops JSONB,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_stops_route 
-        ON driver_stops (route_id);
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_stops_location 
-        ON driver_stops (stop_latitude, stop_longitude);
-        
-        CREATE INDEX IF NOT EXISTS idx_driver_stops_sequence 
-        ON driver_stops (route_id, stop_sequence);
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Driver stops tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('driver_stops')
     
     def create_analytics_table(self) -> bool:
         """
@@ -471,42 +792,7 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS analytics (
-            id SERIAL PRIMARY KEY,
-            event_type VARCHAR(100) NOT NULL,
-            event_category VARCHAR(100),
-            user_session_id VARCHAR(255),
-            route_id INTEGER REFERENCES routes(id),
-            event_data JSONB,
-            location_data JSONB,
-            performance_metrics JSONB,
-            user_interaction_data JSONB,
-            api_usage_data JSONB,
-            error_information JSONB,
-            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_analytics_event_type 
-        ON analytics (event_type);
-        
-        CREATE INDEX IF NOT EXISTS idx_analytics_timestamp 
-        ON analytics (timestamp);
-        
-        CREATE INDEX IF NOT EXISTS idx_analytics_session 
-        ON analytics (user_session_id);
-        
-        CREATE INDEX IF NOT EXISTS idx_analytics_route 
-        ON analytics (route_id);
-        """
-        
-        try:
-            self.config.execute_query(create_table_sql)
-            return True
-        except Exception as e:
-            logger.error(f"Analytics tablosu oluşturma hatası: {e}")
-            return False
+        return self._create_table('analytics')
     
     def drop_all_tables(self) -> bool:
         """
@@ -515,26 +801,26 @@ class TableCreator:
         Returns:
             bool: Başarılı ise True
         """
-        tables_to_drop = [
-            'analytics',
-            'driver_stops',
-            'route_calculations',
-            'emergency_services',
-            'driver_amenities',
-            'truck_services',
-            'routes',
-            'fuel_stations'
-        ]
+        # Oluşturma sırasının tersi (bağımlı tablolar önce)
+        tables_to_drop = [table['name'] for table in reversed(SCHEMA)]
         
         logger.warning("⚠️ Tüm tablolar silinecek!")
         
+        # Tüm tablolar tek DROP ifadesiyle, tek round-trip ve tek transaction içinde silinir
+        drop_sql = f"DROP TABLE IF EXISTS {', '.join(tables_to_drop)} CASCADE;"
+        
+        try:
+            with self.config.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(drop_sql)
+        except Exception as e:
+            logger.error(f"❌ Tablolar silinirken hata: {e}")
+            return False
+        finally:
+            self.config.invalidate_schema_cache()
+        
         for table in tables_to_drop:
-            try:
-                self.config.execute_query(f"DROP TABLE IF EXISTS {table} CASCADE;")
-                logger.info(f"✅ {table} tablosu silindi")
-            except Exception as e:
-                logger.error(f"❌ {table} tablosu silinirken hata: {e}")
-                return False
+            logger.info(f"✅ {table} tablosu silindi")
         
         return True
     
@@ -542,34 +828,51 @@ class TableCreator:
         """
         Veritabanı bilgilerini getirir.
         
+        Sonuç şema cache'inde tutulur; tablo oluşturma/silme işlemleri cache'i temizler.
+        
         Returns:
             dict: Veritabanı bilgileri
         """
+        return self.config.cached_schema_lookup(('database_info',), self._load_database_info) or {}
+    
+    def _load_database_info(self) -> Optional[dict]:
+        """
+        Veritabanı bilgilerini information_schema'dan okur.
+        
+        Returns:
+            Optional[dict]: Veritabanı bilgileri veya hata durumunda None
+        """
         try:
-            tables_query = """
-            SELECT table_name, table_type
-            FROM information_schema.tables
-            WHERE table_schema = 'public'
-            ORDER BY table_name;
+            # Tablo listesi ve veritabanı boyutu tek sorguda, tek round-trip ile alınır
+            info_query = """
+            SELECT
+                pg_size_pretty(pg_database_size(current_database())) as database_size,
+                COALESCE(
+                    (SELECT json_agg(json_build_object(
+                                'table_name', table_name,
+                                'table_type', table_type
+                            ) ORDER BY table_name)
+                     FROM information_schema.tables
+                     WHERE table_schema = 'public'),
+                    '[]'::json
+                ) as tables;
             """
             
-            tables = self.config.execute_query(tables_query)
-            
-            total_size_query = """
-            SELECT pg_size_pretty(pg_database_size(current_database())) as database_size;
-            """
+            result = self.config.execute_query(info_query)
+            if not result:
+                return None
             
-            size_info = self.config.execute_query(total_size_query)
+            tables = result[0]['tables']
             
             return {
                 'tables': tables,
-                'database_size': size_info[0]['database_size'] if size_info else 'N/A',
-                'table_count': len(tables) if tables else 0
+                'database_size': result[0]['database_size'] or 'N/A',
+                'table_count': len(tables)
             }
             
         except Exception as e:
             logger.error(f"Veritabanı bilgileri alınırken hata: {e}")
-            return {}
+            return None
 
 def main():
     """
@@ -6,9 +6,17 @@ PostgreSQL veritabanı bağlantı ayarları ve konfigürasyonu
 
 import psycopg2
 from psycopg2 import sql
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
+import csv
+import io
+import json
 import logging
-from typing import Optional, Dict, Any
+import re
+import threading
+import time
+import weakref
+from typing import Optional, Dict, Any, Callable, Iterable, List, Sequence, Tuple
 import os
 from contextlib import contextmanager
 from dotenv import load_dotenv
@@ -26,6 +34,55 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# INSERT ... VALUES (%s, %s, ...) ifadesindeki tek satırlık değer şablonu
+_VALUES_TEMPLATE_RE = re.compile(r"VALUES\s*(\((?:\s*%s\s*,)*\s*%s\s*\))(?!\s*,)", re.IGNORECASE)
+
+# execute_values'ın doğrudan kullanabileceği INSERT ... VALUES %s biçimi
+_BARE_VALUES_RE = re.compile(r"VALUES\s+%s\b", re.IGNORECASE)
+
+# Bu süreden uzun boşta kalan havuz bağlantıları kullanılmadan önce SELECT 1 ile doğrulanır (saniye)
+STALE_CONNECTION_SECONDS = 30
+
+# information_schema sonuçlarının süreç içinde tutulacağı süre (saniye)
+SCHEMA_CACHE_TTL_SECONDS = 600
+
+# Her havuz bağlantısında bir kez PREPARE edilen sık kullanılan katalog sorguları
+PREPARED_STATEMENTS = {
+    'stmt_table_exists': """
+        PREPARE stmt_table_exists (text) AS
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = $1
+        );
+    """,
+    'stmt_table_info': """
+        PREPARE stmt_table_info (text) AS
+        SELECT column_name, data_type, is_nullable, column_default
+        FROM information_schema.columns
+        WHERE table_name = $1
+        ORDER BY ordinal_position;
+    """
+}
+
+# Hazır ifadeleri çalıştıran EXECUTE metinleri (her çağrıda yeniden üretilmez)
+PREPARED_EXECUTE_SQL = {
+    'stmt_table_exists': "EXECUTE stmt_table_exists (%s);",
+    'stmt_table_info': "EXECUTE stmt_table_info (%s);"
+}
+
+# Sabit kısımları modül yüklenirken derlenen sql.SQL şablonları
+_COPY_CSV_SQL = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+_COPY_STAGING_TABLE_SQL = sql.SQL("CREATE TEMP TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WITH NO DATA")
+_COPY_MERGE_SQL = sql.SQL(
+    "INSERT INTO {table} ({columns}) "
+    "SELECT DISTINCT ON ({key}) {columns} FROM {staging} ORDER BY {key}, ctid DESC "
+    "ON CONFLICT ({key}) DO UPDATE SET {assignments}"
+)
+_EXCLUDED_ASSIGNMENT_SQL = sql.SQL("{0} = EXCLUDED.{0}")
+_TIMESTAMP_ASSIGNMENT_SQL = sql.SQL("{} = CURRENT_TIMESTAMP")
+_CREATE_DATABASE_SQL = sql.SQL("CREATE DATABASE {}")
+_COLUMN_SEPARATOR_SQL = sql.SQL(', ')
+
 class PostgreSQLConfig:
     """
     PostgreSQL veritabanı bağlantı konfigürasyonu ve yönetimi.
@@ -41,18 +98,38 @@ class PostgreSQLConfig:
             'port': int(self._get_config_value('POSTGRES_PORT', '5432')),
             'database': self._get_config_value('POSTGRES_DATABASE', 'fueltwogo'),
             'user': self._get_config_value('POSTGRES_USER', 'fuel_user'),
-            'password': self._get_config_value('POSTGRES_PASSWORD', '')
+            'password': self._get_config_value('POSTGRES_PASSWORD', ''),
+            'connect_timeout': 30,
+            # Uzun süren sorgular sunucu tarafında iptal edilir, böylece havuzdaki
+            # bir bağlantı süresiz meşgul kalmaz; uygulama pg_stat_activity'de görünür
+            'options': (
+                '-c statement_timeout=30000 '
+                '-c idle_in_transaction_session_timeout=60000 '
+                '-c application_name=fuel2go'
+            )
         }
         
         # Bağlantı havuzu ayarları
         self.pool_params = {
             'minconn': 1,
-            'maxconn': 20,
-            'connect_timeout': 30,
-            'command_timeout': 30
+            'maxconn': 20
         }
         
-        self._connection = None
+        # Havuz ilk kullanımda oluşturulur (import sırasında bağlantı açılmaz)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        
+        # PREPARE ifadeleri çalıştırılmış bağlantılar (kapanan bağlantılar otomatik düşer)
+        self._prepared = weakref.WeakSet()
+        
+        # Bağlantı başına ihtiyaç anında PREPARE edilen DML ifadelerinin adları
+        self._prepared_dml = weakref.WeakKeyDictionary()
+        
+        # Havuza geri bırakılan bağlantıların son kullanım zamanı (time.monotonic)
+        self._last_used = weakref.WeakKeyDictionary()
+        
+        # Şema/katalog sorguları için TTL cache: anahtar -> (geçerlilik sonu, değer)
+        self._schema_cache = {}
         
     def _get_config_value(self, key: str, default: str = '') -> str:
         """
@@ -91,29 +168,158 @@ class PostgreSQLConfig:
         """
         return f"postgresql://{self.connection_params['user']}:{self.connection_params['password']}@{self.connection_params['host']}:{self.connection_params['port']}/{self.connection_params['database']}"
     
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """
+        Bağlantı havuzunu döndürür, yoksa thread-safe şekilde oluşturur.
+        
+        Returns:
+            ThreadedConnectionPool: PostgreSQL bağlantı havuzu
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadedConnectionPool(
+                        self.pool_params['minconn'],
+                        self.pool_params['maxconn'],
+                        cursor_factory=RealDictCursor,
+                        **self.connection_params
+                    )
+        return self._pool
+    
+    def _prepare_statements(self, conn):
+        """
+        Bağlantı oturumunda hazır ifadeleri (prepared statements) bir kez oluşturur.
+        
+        Args:
+            conn (psycopg2.connection): Havuzdan alınan bağlantı
+        """
+        if conn in self._prepared:
+            return
+        
+        with conn.cursor() as cursor:
+            for statement_sql in PREPARED_STATEMENTS.values():
+                cursor.execute(statement_sql)
+        conn.commit()
+        self._prepared.add(conn)
+    
+    def _execute_prepared(self, statement_name: str, params: tuple) -> Optional[list]:
+        """
+        Hazır bir ifadeyi EXECUTE ile çalıştırır.
+        
+        Args:
+            statement_name (str): PREPARED_STATEMENTS içindeki ifade adı
+            params (tuple): İfade parametreleri
+            
+        Returns:
+            Optional[list]: Sorgu sonuçları veya None
+        """
+        try:
+            with self.get_connection() as conn:
+                self._prepare_statements(conn)
+                with conn.cursor() as cursor:
+                    cursor.execute(PREPARED_EXECUTE_SQL[statement_name], params)
+                    return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"PostgreSQL hazır ifade hatası ({statement_name}): {e}")
+            return None
+    
+    def execute_prepared_statement(self, statement_name: str, prepare_sql: str,
+                                   execute_sql: str, params: Sequence[Any]) -> Optional[int]:
+        """
+        Bir DML ifadesini bağlantı başına bir kez PREPARE edip EXECUTE ile çalıştırır.
+        
+        Katalog sorgularının aksine bu ifadeler ilgili tablo mevcut olduğunda, ilk
+        kullanımda hazırlanır; sonraki çağrılarda parse/plan adımı atlanır.
+        
+        Args:
+            statement_name (str): Hazır ifadenin adı
+            prepare_sql (str): ``PREPARE <ad> AS ...`` metni
+            execute_sql (str): ``EXECUTE <ad> (%s, ...)`` metni
+            params (Sequence[Any]): İfade parametreleri
+            
+        Returns:
+            Optional[int]: Etkilenen satır sayısı veya None
+        """
+        try:
+            with self.get_connection() as conn:
+                prepared_names = self._prepared_dml.setdefault(conn, set())
+                with conn.cursor() as cursor:
+                    if statement_name not in prepared_names:
+                        cursor.execute(prepare_sql)
+                        prepared_names.add(statement_name)
+                    cursor.execute(execute_sql, params)
+                    return cursor.rowcount
+        except Exception as e:
+            logger.error(f"PostgreSQL hazır ifade hatası ({statement_name}): {e}")
+            return None
+    
     @contextmanager
     def get_connection(self):
         """
         PostgreSQL bağlantısı için context manager.
         
+        Bağlantı havuzdan alınır, işlem sonunda commit edilir ve havuza geri bırakılır.
+        
         Yields:
             psycopg2.connection: PostgreSQL bağlantısı
         """
-        conn = None
+        pool = self._get_pool()
+        conn = self._borrow_connection(pool)
         try:
-            conn = psycopg2.connect(
-                **self.connection_params,
-                cursor_factory=RealDictCursor
-            )
             yield conn
+            conn.commit()
         except Exception as e:
             logger.error(f"PostgreSQL bağlantı hatası: {e}")
-            if conn:
+            if not conn.closed:
                 conn.rollback()
             raise
         finally:
-            if conn:
-                conn.close()
+            self._last_used[conn] = time.monotonic()
+            pool.putconn(conn, close=bool(conn.closed))
+    
+    def _borrow_connection(self, pool: ThreadedConnectionPool):
+        """
+        Havuzdan bağlantı alır; uzun süre boşta kalmış bağlantıyı SELECT 1 ile doğrular.
+        
+        Yeni veya yakın zamanda kullanılmış bağlantılar için ek round-trip yapılmaz.
+        Kopmuş bağlantılar kapatılıp yerine yenisi alınır.
+        
+        Args:
+            pool (ThreadedConnectionPool): PostgreSQL bağlantı havuzu
+            
+        Returns:
+            psycopg2.connection: Kullanıma hazır bağlantı
+        """
+        conn = pool.getconn()
+        last_used = self._last_used.get(conn)
+        
+        if conn.closed:
+            pool.putconn(conn, close=True)
+            return pool.getconn()
+        
+        if last_used is not None and time.monotonic() - last_used > STALE_CONNECTION_SECONDS:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1;")
+                conn.rollback()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                logger.warning("Havuzdaki bağlantı kopmuş, yenisi açılıyor")
+                pool.putconn(conn, close=True)
+                return pool.getconn()
+        
+        return conn
+    
+    def close_pool(self):
+        """
+        Bağlantı havuzundaki tüm bağlantıları kapatır.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+            self._prepared = weakref.WeakSet()
+            self._prepared_dml = weakref.WeakKeyDictionary()
+            self._last_used = weakref.WeakKeyDictionary()
     
     def test_connection(self) -> bool:
         """
@@ -125,48 +331,57 @@ class PostgreSQLConfig:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute("SELECT version();")
-                    version = cursor.fetchone()
-                    logger.info(f"PostgreSQL bağlantısı başarılı: {version}")
+                    cursor.execute("SELECT 1;")
+                    cursor.fetchone()
+                    logger.info("PostgreSQL bağlantısı başarılı")
                     return True
         except Exception as e:
             logger.error(f"PostgreSQL bağlantı testi başarısız: {e}")
             return False
     
-    def execute_query(self, query: str, params: Optional[tuple] = None) -> Optional[list]:
+    def execute_query(self, query: str, params: Optional[tuple] = None,
+                      as_tuples: bool = False) -> Optional[list]:
         """
         PostgreSQL sorgusu çalıştırır.
         
         Args:
             query (str): Çalıştırılacak SQL sorgusu
             params (tuple, optional): Sorgu parametreleri
+            as_tuples (bool): True ise satırlar dict yerine tuple olarak döner
+                (ör. iki kolonlu sonuçlar doğrudan dict(rows) ile çevrilebilir)
             
         Returns:
             Optional[list]: Sorgu sonuçları veya None
         """
+        cursor_factory = psycopg2.extensions.cursor if as_tuples else None
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
+                with conn.cursor(cursor_factory=cursor_factory) as cursor:
                     cursor.execute(query, params)
                     
-                    # SELECT sorgusu ise sonuçları döndür
-                    if query.strip().upper().startswith('SELECT'):
+                    # Satır döndüren ifadeler (SELECT, WITH ... SELECT, RETURNING) için sonuçları döndür;
+                    # commit işlemini bağlantı context manager'ı yapar
+                    if cursor.description is not None:
                         return cursor.fetchall()
-                    else:
-                        conn.commit()
-                        return cursor.rowcount
+                    return cursor.rowcount
                         
         except Exception as e:
             logger.error(f"PostgreSQL sorgu hatası: {e}")
             return None
     
-    def execute_many(self, query: str, params_list: list) -> Optional[int]:
+    def execute_many(self, query: str, params_list: list, page_size: int = 1000) -> Optional[int]:
         """
         Birden fazla veri için toplu işlem yapar.
         
+        INSERT sorguları psycopg2.extras.execute_values ile sayfa başına tek bir
+        çok satırlı INSERT olarak gönderilir. Sorgu ``VALUES %s`` veya yalnızca
+        ``%s`` içeren ``VALUES (%s, %s, ...)`` biçiminde yazılabilir; diğer INSERT'ler
+        (ör. ``VALUES (%s, NOW())``) ve INSERT dışı sorgular executemany ile çalıştırılır.
+        
         Args:
             query (str): Çalıştırılacak SQL sorgusu
             params_list (list): Parametre listesi
+            page_size (int): Tek INSERT ifadesinde gönderilecek maksimum satır sayısı
             
         Returns:
             Optional[int]: Etkilenen satır sayısı veya None
@@ -174,14 +389,171 @@ class PostgreSQLConfig:
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
+                    template = None
+                    bulk_query = None
+                    if query.strip().upper().startswith('INSERT'):
+                        match = _VALUES_TEMPLATE_RE.search(query)
+                        if match:
+                            template = match.group(1)
+                            bulk_query = query[:match.start()] + "VALUES %s" + query[match.end():]
+                        elif _BARE_VALUES_RE.search(query):
+                            bulk_query = query
+                    
+                    if bulk_query is not None:
+                        # Sayfaları tek tek gönder ki rowcount tüm sayfaların toplamı olsun
+                        affected = 0
+                        for start in range(0, len(params_list), page_size):
+                            execute_values(cursor, bulk_query, params_list[start:start + page_size],
+                                           template=template, page_size=page_size)
+                            affected += cursor.rowcount
+                        return affected
+                    
                     cursor.executemany(query, params_list)
-                    conn.commit()
                     return cursor.rowcount
                     
         except Exception as e:
             logger.error(f"PostgreSQL toplu işlem hatası: {e}")
             return None
     
+    def execute_values_batch(self, statements: Sequence[Tuple[str, Sequence[Sequence[Any]]]]) -> bool:
+        """
+        Birden fazla ``VALUES %s`` INSERT ifadesini tek bir sorgu metninde birleştirip
+        tek round-trip ve tek transaction ile gönderir.
+        
+        Birbirine bağlı tablolara (ör. istasyonlar, rotalar, hizmetler) aynı anda yazarken
+        her ifadenin yanıtını beklemeden hepsi sunucuya iletilir.
+        
+        Args:
+            statements (Sequence[Tuple[str, Sequence[Sequence[Any]]]]): (sorgu, satırlar) çiftleri
+            
+        Returns:
+            bool: Tüm ifadeler başarılı ise True
+        """
+        statements = [(query, rows) for query, rows in statements if rows]
+        if not statements:
+            return True
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    script = []
+                    for query, rows in statements:
+                        template = '(' + ', '.join(['%s'] * len(rows[0])) + ')'
+                        values = b', '.join(cursor.mogrify(template, row) for row in rows)
+                        head, tail = query.split('VALUES %s', 1)
+                        script.append(head.encode() + b'VALUES ' + values + tail.encode())
+                    cursor.execute(b'\n'.join(script))
+            return True
+                    
+        except Exception as e:
+            logger.error(f"PostgreSQL toplu ifade hatası: {e}")
+            return False
+    
+    def _csv_buffer(self, rows: Iterable[Sequence[Any]]) -> io.StringIO:
+        """
+        Satırları COPY ... (FORMAT csv) için bellek içi bir CSV tamponuna yazar.
+        
+        Args:
+            rows (Iterable[Sequence[Any]]): Yazılacak satırlar
+            
+        Returns:
+            io.StringIO: Başa sarılmış CSV tamponu
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                '\\N' if value is None
+                else json.dumps(value) if isinstance(value, (dict, list))
+                else value
+                for value in row
+            ])
+        buffer.seek(0)
+        return buffer
+    
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]]) -> Optional[int]:
+        """
+        Satırları COPY FROM STDIN ile tek seferde tabloya aktarır.
+        
+        Toplu veri yüklemede satır satır INSERT'e göre çok daha hızlıdır. dict/list
+        değerleri JSONB kolonları için JSON'a çevrilir, None değerleri NULL olarak yazılır.
+        COPY çakışma (ON CONFLICT) desteklemediği için yalnızca yeni kayıtlar için kullanın.
+        
+        Args:
+            table (str): Hedef tablo adı
+            columns (List[str]): Satır değerlerinin sırasına karşılık gelen kolon adları
+            rows (Iterable[Sequence[Any]]): Aktarılacak satırlar
+            
+        Returns:
+            Optional[int]: Aktarılan satır sayısı veya None
+        """
+        buffer = self._csv_buffer(rows)
+        copy_sql = _COPY_CSV_SQL.format(
+            sql.Identifier(table),
+            _COLUMN_SEPARATOR_SQL.join(sql.Identifier(column) for column in columns)
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.copy_expert(copy_sql.as_string(conn), buffer)
+                    return cursor.rowcount
+                    
+        except Exception as e:
+            logger.error(f"PostgreSQL COPY hatası ({table}): {e}")
+            return None
+    
+    def copy_upsert(self, table: str, columns: List[str], rows: Iterable[Sequence[Any]],
+                    conflict_column: str, timestamp_column: Optional[str] = None) -> Optional[int]:
+        """
+        Satırları COPY ile geçici bir tabloya aktarıp tek bir INSERT ... SELECT ...
+        ON CONFLICT DO UPDATE ile hedef tabloya birleştirir.
+        
+        COPY'nin hızını upsert semantiğiyle birleştirir; aynı anahtara sahip satırlardan
+        yalnızca sonuncusu yazılır.
+        
+        Args:
+            table (str): Hedef tablo adı
+            columns (List[str]): Satır değerlerinin sırasına karşılık gelen kolon adları
+            rows (Iterable[Sequence[Any]]): Aktarılacak satırlar
+            conflict_column (str): ON CONFLICT için kullanılacak benzersiz kolon
+            timestamp_column (str, optional): Güncellemede CURRENT_TIMESTAMP atanacak kolon
+            
+        Returns:
+            Optional[int]: Eklenen/güncellenen satır sayısı veya None
+        """
+        buffer = self._csv_buffer(rows)
+        
+        staging = sql.Identifier(f"_copy_{table}")
+        column_list = _COLUMN_SEPARATOR_SQL.join(sql.Identifier(column) for column in columns)
+        staging_sql = _COPY_STAGING_TABLE_SQL.format(staging, column_list, sql.Identifier(table))
+        copy_sql = _COPY_CSV_SQL.format(staging, column_list)
+        assignments = [
+            _EXCLUDED_ASSIGNMENT_SQL.format(sql.Identifier(column))
+            for column in columns if column != conflict_column
+        ]
+        if timestamp_column:
+            assignments.append(_TIMESTAMP_ASSIGNMENT_SQL.format(sql.Identifier(timestamp_column)))
+        merge_sql = _COPY_MERGE_SQL.format(
+            table=sql.Identifier(table),
+            columns=column_list,
+            key=sql.Identifier(conflict_column),
+            staging=staging,
+            assignments=_COLUMN_SEPARATOR_SQL.join(assignments)
+        )
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(staging_sql)
+                    cursor.copy_expert(copy_sql.as_string(conn), buffer)
+                    cursor.execute(merge_sql)
+                    return cursor.rowcount
+                    
+        except Exception as e:
+            logger.error(f"PostgreSQL COPY upsert hatası ({table}): {e}")
+            return None
+    
     def create_database_if_not_exists(self, database_name: str) -> bool:
         """
         Veritabanı yoksa oluşturur.
@@ -210,7 +582,7 @@ class PostgreSQLConfig:
                 if not cursor.fetchone():
                     # Veritabanı yok, oluştur
                     cursor.execute(
-                        sql.SQL("CREATE DATABASE {}").format(
+                        _CREATE_DATABASE_SQL.format(
                             sql.Identifier(database_name)
                         )
                     )
@@ -227,6 +599,45 @@ class PostgreSQLConfig:
             if conn:
                 conn.close()
     
+    def cached_schema_lookup(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """
+        Şema/katalog sorgusu sonucunu TTL süresince süreç içinde cache'ler.
+        
+        Args:
+            key (tuple): Cache anahtarı (ör. ('table_exists', 'routes'))
+            loader (Callable[[], Any]): Cache'de yoksa değeri üreten fonksiyon;
+                None dönerse (hata) sonuç cache'lenmez
+            
+        Returns:
+            Any: Cache'deki veya yeni yüklenen değer
+        """
+        now = time.monotonic()
+        entry = self._schema_cache.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        
+        value = loader()
+        if value is not None:
+            self._schema_cache[key] = (now + SCHEMA_CACHE_TTL_SECONDS, value)
+        return value
+    
+    def invalidate_schema_cache(self):
+        """
+        Şema değişikliklerinden (CREATE/DROP) sonra şema cache'ini temizler.
+        """
+        self._schema_cache.clear()
+    
+    def prime_table_exists(self, table_names: Iterable[str]):
+        """
+        Var olduğu bilinen tablolar için table_exists cache'ini önceden doldurur.
+        
+        Args:
+            table_names (Iterable[str]): Var olan tablo adları
+        """
+        expires_at = time.monotonic() + SCHEMA_CACHE_TTL_SECONDS
+        for table_name in table_names:
+            self._schema_cache[('table_exists', table_name)] = (expires_at, True)
+    
     def get_table_info(self, table_name: str) -> Optional[list]:
         """
         Tablo bilgilerini getirir.
@@ -237,14 +648,10 @@ class PostgreSQLConfig:
         Returns:
             Optional[list]: Tablo sütun bilgileri veya None
         """
-        query = """
-        SELECT column_name, data_type, is_nullable, column_default
-        FROM information_schema.columns
-        WHERE table_name = %s
-        ORDER BY ordinal_position;
-        """
-        
-        return self.execute_query(query, (table_name,))
+        return self.cached_schema_lookup(
+            ('table_info', table_name),
+            lambda: self._execute_prepared('stmt_table_info', (table_name,))
+        )
     
     def table_exists(self, table_name: str) -> bool:
         """
@@ -256,15 +663,11 @@ class PostgreSQLConfig:
         Returns:
             bool: Tablo varsa True, yoksa False
         """
-        query = """
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_name = %s
-        );
-        """
+        def load():
+            result = self._execute_prepared('stmt_table_exists', (table_name,))
+            return result[0]['exists'] if result else None
         
-        result = self.execute_query(query, (table_name,))
-        return result[0]['exists'] if result else False
+        return bool(self.cached_schema_lookup(('table_exists', table_name), load))
 
 # Global PostgreSQL config instance
 postgresql_config = PostgreSQLConfig()
\ No newline at end of file
@@ -6,18 +6,416 @@ SQLite'ı tamamen değiştiren PostgreSQL tabanlı veri ambarı sınıfı
 
 import pandas as pd
 import numpy as np
+import copy
 import json
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import threading
+import time
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Iterator, Sequence
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
 
+from psycopg2.extensions import cursor as TupleCursor
+
 from db.postgresql_config import postgresql_config
+from db.create_tables import TableCreator
+from utils.json_utils import dumps_json
+
+# Arrow tabanlı okuma (opsiyonel): ADBC sürücüsü binary COPY ile doğrudan Arrow tablosu üretir
+try:
+    import adbc_driver_postgresql.dbapi as adbc_dbapi
+    ADBC_AVAILABLE = True
+except ImportError:
+    ADBC_AVAILABLE = False
 from data_models import FuelStationData, RouteData, TruckServiceData, DriverAmenityData, EmergencyServiceData
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Satır oluştururken dataclass alanlarını tek C çağrısında okuyan erişimciler
+_FUEL_STATION_ATTRS = attrgetter(
+    'station_id', 'name', 'address', 'latitude', 'longitude',
+    'fuel_types', 'services', 'operating_hours', 'rating'
+)
+_ROUTE_ATTRS = attrgetter(
+    'origin_lat', 'origin_lng', 'dest_lat', 'dest_lng', 'distance_km', 'duration_minutes',
+    'fuel_consumption_liters', 'cost_analysis', 'carbon_emission_kg', 'vehicle_type',
+    'traffic_conditions'
+)
+_TRUCK_SERVICE_ATTRS = attrgetter(
+    'service_id', 'name', 'address', 'latitude', 'longitude', 'service_type',
+    'services_offered', 'truck_parking_spaces', 'has_adblue', 'has_truck_repair',
+    'has_restaurant', 'has_shower', 'has_wifi', 'operating_hours', 'rating'
+)
+_DRIVER_AMENITY_ATTRS = attrgetter(
+    'amenity_id', 'name', 'address', 'latitude', 'longitude', 'amenity_type',
+    'room_count', 'meal_types', 'has_shower', 'has_laundry', 'has_wifi', 'has_tv',
+    'price_range', 'rating'
+)
+_EMERGENCY_SERVICE_ATTRS = attrgetter(
+    'emergency_id', 'name', 'address', 'latitude', 'longitude', 'service_type',
+    'is_24h', 'phone_number', 'emergency_services'
+)
+
+# Her satırda yeniden üretilmeyen sabit JSONB değerleri
+_GAS_STATION_TYPES_JSON = json.dumps(['gas_station'])
+_DIESEL_FUEL_JSON = json.dumps(['diesel'])
+_TV_ENTERTAINMENT_JSON = json.dumps(['tv'])
+_EMPTY_LIST_JSON = json.dumps([])
+_EMPTY_DICT_JSON = json.dumps({})
+
+# Yakındaki kamyon hizmetleri: referans nokta bir kez oluşturulur, mesafe satır başına bir kez
+# hesaplanır (ST_Distance, metre); yarıçap filtresi geom üzerindeki indeksi kullanır (ST_DWithin)
+_NEARBY_SERVICES_TEMPLATE = """
+    SELECT place_id, name, address, latitude, longitude, service_type,
+           adblue_available, mechanical_services, restaurant_available,
+           shower_facilities, wifi_available, rating,
+           ST_Distance(geom, ref.point) as distance_meters
+    FROM truck_services,
+         (SELECT ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography AS point) ref
+    WHERE ST_DWithin(geom, ref.point, %s) {service_filter}
+    ORDER BY distance_meters ASC
+    LIMIT 100;
+"""
+NEARBY_SERVICES_SQL = _NEARBY_SERVICES_TEMPLATE.format(service_filter="")
+NEARBY_SERVICES_BY_TYPE_SQL = _NEARBY_SERVICES_TEMPLATE.format(service_filter="AND service_type = %s")
+
+# iter_stations'ın sunucu tarafı cursor'dan her seferde çektiği satır sayısı
+STREAM_CHUNK_SIZE = 10000
+
+# Okuma sorgularında DataFrame kolonlarına uygulanacak sabit tipler (dtype tahmini yapılmaz)
+COORDINATE_DTYPES = {
+    'latitude': 'float64',
+    'longitude': 'float64',
+    'origin_latitude': 'float64',
+    'origin_longitude': 'float64',
+    'destination_latitude': 'float64',
+    'destination_longitude': 'float64',
+    'distance_meters': 'float64',
+    'duration_seconds': 'Int64'
+}
+
+STATIONS_QUERY_SQL = """
+    SELECT id, place_id, name, address, latitude, longitude,
+           fuel_types, amenities, rating, created_at
+    FROM fuel_stations
+    ORDER BY name;
+"""
+
+# get_analytics_summary sonucunun süreç içinde tutulacağı süre (saniye); tüm örnekler paylaşır
+ANALYTICS_CACHE_TTL_SECONDS = 60
+_analytics_cache = {'expires_at': 0.0, 'value': None}
+_analytics_cache_lock = threading.Lock()
+
+# Aylık bölümlerin en son hangi ay için kontrol edildiği; süreç başına ayda bir
+# TableCreator.ensure_partitions çalışır (uzun süre açık kalan süreçler dahil)
+_partition_state = {'month': None}
+_partition_lock = threading.Lock()
+
+# get_analytics_summary'deki tüm skaler metrikler; {distributions} dağılım kolonlarıyla doldurulur.
+# fuel_stations filtreleri create_tables'taki kısmi indekslerin koşullarıyla birebir aynıdır;
+# her alt sorgu kendi kısmi indeksi üzerinde index-only scan ile sayılır.
+_ANALYTICS_SUMMARY_TEMPLATE = """
+    SELECT
+        (SELECT COUNT(*) FROM fuel_stations) AS total_stations,
+        (SELECT COUNT(*) FROM fuel_stations
+         WHERE ev_charge_options->>'available' = 'true') AS ev_charging_stations,
+        (SELECT COUNT(*) FROM fuel_stations
+         WHERE accessibility_options->>'wheelchair_accessible_entrance' = 'true') AS accessible_stations,
+        (SELECT COUNT(*) FROM fuel_stations
+         WHERE parking_options->>'free_parking_lot' = 'true'
+            OR parking_options->>'paid_parking_lot' = 'true') AS stations_with_parking,
+        (SELECT COUNT(*) FROM fuel_stations
+         WHERE payment_options->>'accepts_credit_cards' = 'true') AS credit_card_stations,
+        (SELECT COUNT(*) FROM fuel_stations
+         WHERE payment_options->>'accepts_nfc' = 'true') AS nfc_stations,
+        r.total_routes,
+        r.avg_carbon_emission,
+        r.avg_fuel_consumption,
+        (SELECT COUNT(*) FROM truck_services) AS total_truck_services,
+        (SELECT COUNT(*) FROM driver_amenities) AS total_driver_amenities,
+        (SELECT COUNT(*) FROM emergency_services) AS total_emergency_services,
+{distributions}
+    FROM (
+        SELECT
+            COUNT(*) AS total_routes,
+            AVG(carbon_emissions_kg) AS avg_carbon_emission,
+            AVG(fuel_consumption_liters) AS avg_fuel_consumption
+        FROM routes
+    ) r;
+"""
+
+# get_analytics_summary'deki dağılım sorguları: metrik -> (etiket, sayı) döndüren alt sorgu
+ANALYTICS_DISTRIBUTION_QUERIES = {
+    # Şehir dağılımı (address alanından şehir bilgisini çıkarma)
+    'city_distribution': """
+        SELECT
+            CASE
+                WHEN address LIKE '%İstanbul%' THEN 'İstanbul'
+                WHEN address LIKE '%Ankara%' THEN 'Ankara'
+                WHEN address LIKE '%İzmir%' THEN 'İzmir'
+                WHEN address LIKE '%Bursa%' THEN 'Bursa'
+                WHEN address LIKE '%Antalya%' THEN 'Antalya'
+                ELSE 'Diğer'
+            END as city,
+            COUNT(*) as count
+        FROM fuel_stations
+        GROUP BY
+            CASE
+                WHEN address LIKE '%İstanbul%' THEN 'İstanbul'
+                WHEN address LIKE '%Ankara%' THEN 'Ankara'
+                WHEN address LIKE '%İzmir%' THEN 'İzmir'
+                WHEN address LIKE '%Bursa%' THEN 'Bursa'
+                WHEN address LIKE '%Antalya%' THEN 'Antalya'
+                ELSE 'Diğer'
+            END
+        ORDER BY count DESC
+    """,
+    # Marka dağılımı (fuel_stations.brand, isimden üretilen kolon)
+    'brand_distribution': """
+        SELECT brand, COUNT(*) as count
+        FROM fuel_stations
+        GROUP BY brand
+        ORDER BY count DESC
+    """,
+    # EV şarj türleri dağılımı
+    'ev_charging_distribution': """
+        SELECT
+            CASE
+                WHEN ev_charge_options->>'fast_charging' = 'true' THEN 'Hızlı Şarj'
+                WHEN ev_charge_options->>'available' = 'true' THEN 'Normal Şarj'
+                ELSE 'Şarj Yok'
+            END as ev_type,
+            COUNT(*) as count
+        FROM fuel_stations
+        WHERE ev_charge_options IS NOT NULL
+        GROUP BY 1
+    """,
+    # Hizmet türü dağılımı
+    'services_by_type': """
+        SELECT service_type, COUNT(*) as count
+        FROM truck_services
+        GROUP BY service_type
+        ORDER BY count DESC
+    """
+}
+
+# Tüm analitik özet tek sorgu ve tek satır: skaler metrikler + her dağılım
+# json_object_agg ile tek bir JSON kolonunda (sayıya göre azalan sırada)
+ANALYTICS_SUMMARY_SQL = _ANALYTICS_SUMMARY_TEMPLATE.format(distributions=",\n".join(
+    f"        (SELECT json_object_agg(label, count ORDER BY count DESC) FILTER (WHERE label IS NOT NULL)\n"
+    f"         FROM ({query}) d (label, count)) AS {metric}"
+    for metric, query in ANALYTICS_DISTRIBUTION_QUERIES.items()
+))
+
+# cleanup_old_data'nın her transaction'da sileceği maksimum satır sayısı
+CLEANUP_BATCH_SIZE = 10000
+
+# created_at ile aylık bölümlenmiş tablolar: tamamen eski kalan bölümler DROP edilir
+CLEANUP_PARTITIONED_TABLES = ('route_calculations', 'routes')
+
+# Eski veri temizliği: tablo -> parça parça DELETE sorgusu
+CLEANUP_DELETE_SQL = {
+    table: (
+        f"DELETE FROM {table} WHERE id IN ("
+        f"SELECT id FROM {table} WHERE {column} < %s LIMIT %s);"
+    )
+    for table, column in (
+        ('analytics', 'timestamp'),
+        ('route_calculations', 'created_at'),
+        ('routes', 'created_at')
+    )
+}
+
+# Toplu INSERT'lerde tek ifadeye konacak maksimum satır sayısı
+BULK_PAGE_SIZE = 500
+
+# COPY ile toplu yüklemede satır değerlerinin sırasına karşılık gelen kolonlar
+ROUTE_COLUMNS = [
+    'origin_latitude', 'origin_longitude', 'destination_latitude', 'destination_longitude',
+    'origin_address', 'destination_address', 'distance_meters', 'duration_seconds',
+    'polyline_encoded', 'route_legs', 'route_steps', 'toll_info',
+    'fuel_consumption_liters', 'fuel_cost_estimate', 'carbon_emissions_kg',
+    'route_type', 'traffic_info'
+]
+FUEL_STATION_COLUMNS = [
+    'place_id', 'name', 'address', 'latitude', 'longitude', 'fuel_types',
+    'amenities', 'opening_hours', 'phone_number', 'website', 'rating',
+    'price_level', 'business_status', 'types'
+]
+TRUCK_SERVICE_COLUMNS = [
+    'place_id', 'name', 'address', 'latitude', 'longitude', 'service_type',
+    'services_offered', 'truck_parking_available', 'adblue_available',
+    'mechanical_services', 'restaurant_available', 'shower_facilities',
+    'wifi_available', 'truck_washing', 'fuel_types', 'opening_hours',
+    'phone_number', 'website', 'rating', 'business_status', 'is_24_hours'
+]
+DRIVER_AMENITY_COLUMNS = [
+    'place_id', 'name', 'address', 'latitude', 'longitude', 'amenity_type',
+    'amenity_category', 'sleep_facilities', 'food_services', 'parking_capacity',
+    'shower_facilities', 'laundry_facilities', 'wifi_available',
+    'entertainment_facilities', 'pricing_info', 'opening_hours',
+    'phone_number', 'website', 'rating', 'business_status'
+]
+EMERGENCY_SERVICE_COLUMNS = [
+    'place_id', 'name', 'address', 'latitude', 'longitude', 'service_type',
+    'emergency_type', 'is_24_hours', 'phone_number', 'emergency_phone',
+    'website', 'services_offered', 'rating', 'business_status'
+]
+
+# Upsert sorguları: execute_values ``VALUES %s`` yerine tüm satırları tek ifadede gönderir
+FUEL_STATION_UPSERT_SQL = """
+    INSERT INTO fuel_stations (
+        place_id, name, address, latitude, longitude, fuel_types,
+        amenities, opening_hours, phone_number, website, rating,
+        price_level, business_status, types
+    ) VALUES %s
+    ON CONFLICT (place_id)
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        fuel_types = EXCLUDED.fuel_types,
+        amenities = EXCLUDED.amenities,
+        opening_hours = EXCLUDED.opening_hours,
+        phone_number = EXCLUDED.phone_number,
+        website = EXCLUDED.website,
+        rating = EXCLUDED.rating,
+        price_level = EXCLUDED.price_level,
+        business_status = EXCLUDED.business_status,
+        types = EXCLUDED.types,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+ROUTE_INSERT_SQL = """
+    INSERT INTO routes (
+        origin_latitude, origin_longitude, destination_latitude, destination_longitude,
+        origin_address, destination_address, distance_meters, duration_seconds,
+        polyline_encoded, route_legs, route_steps, toll_info,
+        fuel_consumption_liters, fuel_cost_estimate, carbon_emissions_kg,
+        route_type, traffic_info
+    ) VALUES %s;
+"""
+
+TRUCK_SERVICE_UPSERT_SQL = """
+    INSERT INTO truck_services (
+        place_id, name, address, latitude, longitude, service_type,
+        services_offered, truck_parking_available, adblue_available,
+        mechanical_services, restaurant_available, shower_facilities,
+        wifi_available, truck_washing, fuel_types, opening_hours,
+        phone_number, website, rating, business_status, is_24_hours
+    ) VALUES %s
+    ON CONFLICT (place_id)
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        service_type = EXCLUDED.service_type,
+        services_offered = EXCLUDED.services_offered,
+        truck_parking_available = EXCLUDED.truck_parking_available,
+        adblue_available = EXCLUDED.adblue_available,
+        mechanical_services = EXCLUDED.mechanical_services,
+        restaurant_available = EXCLUDED.restaurant_available,
+        shower_facilities = EXCLUDED.shower_facilities,
+        wifi_available = EXCLUDED.wifi_available,
+        truck_washing = EXCLUDED.truck_washing,
+        fuel_types = EXCLUDED.fuel_types,
+        opening_hours = EXCLUDED.opening_hours,
+        phone_number = EXCLUDED.phone_number,
+        website = EXCLUDED.website,
+        rating = EXCLUDED.rating,
+        business_status = EXCLUDED.business_status,
+        is_24_hours = EXCLUDED.is_24_hours,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+DRIVER_AMENITY_UPSERT_SQL = """
+    INSERT INTO driver_amenities (
+        place_id, name, address, latitude, longitude, amenity_type,
+        amenity_category, sleep_facilities, food_services, parking_capacity,
+        shower_facilities, laundry_facilities, wifi_available,
+        entertainment_facilities, pricing_info, opening_hours,
+        phone_number, website, rating, business_status
+    ) VALUES %s
+    ON CONFLICT (place_id)
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        amenity_type = EXCLUDED.amenity_type,
+        amenity_category = EXCLUDED.amenity_category,
+        sleep_facilities = EXCLUDED.sleep_facilities,
+        food_services = EXCLUDED.food_services,
+        parking_capacity = EXCLUDED.parking_capacity,
+        shower_facilities = EXCLUDED.shower_facilities,
+        laundry_facilities = EXCLUDED.laundry_facilities,
+        wifi_available = EXCLUDED.wifi_available,
+        entertainment_facilities = EXCLUDED.entertainment_facilities,
+        pricing_info = EXCLUDED.pricing_info,
+        opening_hours = EXCLUDED.opening_hours,
+        phone_number = EXCLUDED.phone_number,
+        website = EXCLUDED.website,
+        rating = EXCLUDED.rating,
+        business_status = EXCLUDED.business_status,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+EMERGENCY_SERVICE_UPSERT_SQL = """
+    INSERT INTO emergency_services (
+        place_id, name, address, latitude, longitude, service_type,
+        emergency_type, is_24_hours, phone_number, emergency_phone,
+        website, services_offered, rating, business_status
+    ) VALUES %s
+    ON CONFLICT (place_id)
+    DO UPDATE SET
+        name = EXCLUDED.name,
+        address = EXCLUDED.address,
+        latitude = EXCLUDED.latitude,
+        longitude = EXCLUDED.longitude,
+        service_type = EXCLUDED.service_type,
+        emergency_type = EXCLUDED.emergency_type,
+        is_24_hours = EXCLUDED.is_24_hours,
+        phone_number = EXCLUDED.phone_number,
+        emergency_phone = EXCLUDED.emergency_phone,
+        website = EXCLUDED.website,
+        services_offered = EXCLUDED.services_offered,
+        rating = EXCLUDED.rating,
+        business_status = EXCLUDED.business_status,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+def prepared_insert(statement_name: str, query: str, param_count: int) -> Dict[str, str]:
+    """
+    ``VALUES %s`` içeren bir INSERT sorgusundan PREPARE ve EXECUTE metinlerini üretir.
+    
+    Args:
+        statement_name (str): Hazır ifadenin adı
+        query (str): execute_values için yazılmış INSERT sorgusu
+        param_count (int): Satır başına parametre sayısı
+        
+    Returns:
+        Dict[str, str]: 'name', 'prepare' ve 'execute' anahtarlı sözlük
+    """
+    placeholders = ', '.join(f'${index}' for index in range(1, param_count + 1))
+    return {
+        'name': statement_name,
+        'prepare': f"PREPARE {statement_name} AS " + query.replace('VALUES %s', f'VALUES ({placeholders})'),
+        'execute': f"EXECUTE {statement_name} ({', '.join(['%s'] * param_count)});"
+    }
+
+# Tek satırlık eklemeler için bağlantı başına bir kez hazırlanan ifadeler
+PREPARED_INSERTS = {
+    'fuel_station': prepared_insert('upsert_fuel_station', FUEL_STATION_UPSERT_SQL, len(FUEL_STATION_COLUMNS)),
+    'route': prepared_insert('insert_route', ROUTE_INSERT_SQL, len(ROUTE_COLUMNS)),
+    'truck_service': prepared_insert('upsert_truck_service', TRUCK_SERVICE_UPSERT_SQL, len(TRUCK_SERVICE_COLUMNS)),
+    'driver_amenity': prepared_insert('upsert_driver_amenity', DRIVER_AMENITY_UPSERT_SQL, len(DRIVER_AMENITY_COLUMNS)),
+    'emergency_service': prepared_insert('upsert_emergency_service', EMERGENCY_SERVICE_UPSERT_SQL, len(EMERGENCY_SERVICE_COLUMNS))
+}
+
 class PostgreSQLDataWarehouse:
     """
     PostgreSQL tabanlı veri ambarı yönetimi sınıfı.
@@ -28,9 +426,36 @@ class PostgreSQLDataWarehouse:
     def __init__(self):
         """
         PostgreSQLDataWarehouse sınıfını başlatır.
+        
+        Bağlantı burada test edilmez; paylaşılan havuz ilk sorguda açılır ve havuzdan
+        alınan bağlantılar _borrow_connection içinde doğrulanır. Sağlık kontrolü için
+        test_connection() çağrılabilir.
         """
         self.config = postgresql_config
-        self.test_connection()
+    
+    def ensure_partitions(self) -> bool:
+        """
+        Bölümlenmiş tabloların (routes, route_calculations, analytics) bu ay ve sonraki
+        ay için bölümlerinin var olduğundan emin olur.
+        
+        Süreç içinde ay başına bir kez çalışır; ekleme metotları ilk yazmadan önce çağırır.
+        Başarısız olursa bir sonraki çağrıda tekrar denenir.
+        
+        Returns:
+            bool: Bölümler hazırsa True
+        """
+        current_month = date.today().replace(day=1)
+        if _partition_state['month'] == current_month:
+            return True
+        
+        with _partition_lock:
+            if _partition_state['month'] == current_month:
+                return True
+            if not TableCreator().ensure_partitions():
+                logger.warning("Aylık bölümler oluşturulamadı; satırlar DEFAULT bölüme yazılacak")
+                return False
+            _partition_state['month'] = current_month
+            return True
     
     def test_connection(self) -> bool:
         """
@@ -45,68 +470,195 @@ class PostgreSQLDataWarehouse:
             logger.error(f"PostgreSQL bağlantı testi başarısız: {e}")
             return False
     
-    def insert_fuel_station(self, station: FuelStationData) -> bool:
+    def _dedupe_rows(self, rows: List[tuple], key_index: int = 0) -> List[tuple]:
         """
-        Veritabanına bir benzin istasyonu kaydı ekler veya mevcut kaydı günceller.
+        Aynı ON CONFLICT anahtarına sahip satırlardan yalnızca sonuncusunu tutar.
         
         Args:
-            station (FuelStationData): Eklenecek istasyon verilerini içeren nesne
+            rows (List[tuple]): Satırlar
+            key_index (int): Anahtar kolonunun satırdaki sırası
+            
+        Returns:
+            List[tuple]: Anahtarı benzersiz satırlar
+        """
+        return list({row[key_index]: row for row in rows}.values())
+    
+    def _bulk_upsert(self, query: str, rows: List[tuple], label: str,
+                     key_index: Optional[int] = 0) -> int:
+        """
+        Satırları execute_values ile sayfa başına tek bir çok satırlı INSERT olarak yazar.
+        
+        Args:
+            query (str): ``VALUES %s`` içeren INSERT sorgusu
+            rows (List[tuple]): Eklenecek satırlar
+            label (str): Log mesajlarında kullanılacak kayıt türü
+            key_index (int, optional): ON CONFLICT anahtarının satırdaki sırası; aynı
+                toplu INSERT içinde bir satır iki kez güncellenemeyeceği için son kayıt tutulur
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı (hata durumunda 0)
+        """
+        if not rows:
+            return 0
+        
+        if key_index is not None:
+            rows = self._dedupe_rows(rows, key_index)
+        
+        result = self.config.execute_many(query, rows, page_size=BULK_PAGE_SIZE)
+        if result is None:
+            logger.error(f"{label} toplu ekleme hatası")
+            return 0
+        self._invalidate_analytics_cache()
+        return result
+    
+    def _execute_prepared_insert(self, kind: str, row: tuple, label: str) -> bool:
+        """
+        Tek bir satırı PREPARED_INSERTS içindeki hazır ifadeyle yazar.
+        
+        Args:
+            kind (str): PREPARED_INSERTS anahtarı
+            row (tuple): İfade parametreleri
+            label (str): Log mesajlarında kullanılacak kayıt türü
             
         Returns:
             bool: İşlem başarılı ise True
         """
+        statement = PREPARED_INSERTS[kind]
+        result = self.config.execute_prepared_statement(
+            statement['name'], statement['prepare'], statement['execute'], row
+        )
+        if result is None:
+            logger.error(f"{label} ekleme hatası")
+            return False
+        self._invalidate_analytics_cache()
+        return True
+    
+    def _fuel_station_row(self, station: FuelStationData) -> tuple:
+        """FuelStationData nesnesini FUEL_STATION_UPSERT_SQL satırına dönüştürür."""
+        (station_id, name, address, latitude, longitude,
+         fuel_types, services, operating_hours, rating) = _FUEL_STATION_ATTRS(station)
+        return (
+            station_id,
+            name,
+            address,
+            latitude,
+            longitude,
+            dumps_json(fuel_types),
+            dumps_json(services),
+            dumps_json(operating_hours),
+            None,  # phone_number
+            None,  # website
+            rating,
+            None,  # price_level
+            'operational',  # business_status
+            _GAS_STATION_TYPES_JSON  # types
+        )
+    
+    def insert_fuel_stations_bulk(self, stations: List[FuelStationData]) -> int:
+        """
+        Birden fazla benzin istasyonunu tek round-trip'te ekler veya günceller.
+        
+        Args:
+            stations (List[FuelStationData]): Eklenecek istasyonlar
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
         try:
-            insert_query = """
-            INSERT INTO fuel_stations (
-                place_id, name, address, latitude, longitude, fuel_types, 
-                amenities, opening_hours, phone_number, website, rating, 
-                price_level, business_status, types, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (place_id) 
-            DO UPDATE SET
-                name = EXCLUDED.name,
-                address = EXCLUDED.address,
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                fuel_types = EXCLUDED.fuel_types,
-                amenities = EXCLUDED.amenities,
-                opening_hours = EXCLUDED.opening_hours,
-                phone_number = EXCLUDED.phone_number,
-                website = EXCLUDED.website,
-                rating = EXCLUDED.rating,
-                price_level = EXCLUDED.price_level,
-                business_status = EXCLUDED.business_status,
-                types = EXCLUDED.types,
-                updated_at = CURRENT_TIMESTAMP;
-            """
+            rows = [self._fuel_station_row(station) for station in stations]
+            return self._bulk_upsert(FUEL_STATION_UPSERT_SQL, rows, "Fuel station")
+        except Exception as e:
+            logger.error(f"Fuel station toplu ekleme hatası: {e}")
+            return 0
+    
+    def bulk_copy_fuel_stations(self, stations: List[FuelStationData]) -> int:
+        """
+        Benzin istasyonlarını COPY ile geçici tabloya aktarıp tek sorguda upsert eder.
+        
+        İlk yükleme gibi büyük partilerde execute_values'tan çok daha hızlıdır.
+        
+        Args:
+            stations (List[FuelStationData]): Yüklenecek kayıtlar
             
-            data = (
-                station.station_id,
-                station.name,
-                station.address,
-                station.latitude,
-                station.longitude,
-                json.dumps(station.fuel_types),
-                json.dumps(station.services),
-                json.dumps(station.operating_hours),
-                None,  # phone_number
-                None,  # website
-                station.rating,
-                None,  # price_level
-                'operational',  # business_status
-                json.dumps(['gas_station']),  # types
-                datetime.now()
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        if not stations:
+            return 0
+        
+        try:
+            rows = [self._fuel_station_row(station) for station in stations]
+            result = self.config.copy_upsert(
+                'fuel_stations', FUEL_STATION_COLUMNS, rows, 'place_id', timestamp_column='updated_at'
             )
+            if result is None:
+                logger.error("Fuel station COPY yükleme hatası")
+                return 0
+            self._invalidate_analytics_cache()
+            return result
+        except Exception as e:
+            logger.error(f"Fuel station COPY yükleme hatası: {e}")
+            return 0
+    
+    def insert_fuel_station(self, station: FuelStationData) -> bool:
+        """
+        Veritabanına bir benzin istasyonu kaydı ekler veya mevcut kaydı günceller.
+        
+        Args:
+            station (FuelStationData): Eklenecek istasyon verilerini içeren nesne
             
-            result = self.config.execute_query(insert_query, data)
-            return result is not None
-            
+        Returns:
+            bool: İşlem başarılı ise True
+        """
+        try:
+            return self._execute_prepared_insert('fuel_station', self._fuel_station_row(station), "Fuel station")
         except Exception as e:
             logger.error(f"Fuel station ekleme hatası: {e}")
             return False
     
+    def _route_row(self, route: RouteData) -> tuple:
+        """RouteData nesnesini ROUTE_INSERT_SQL satırına dönüştürür."""
+        (origin_lat, origin_lng, dest_lat, dest_lng, distance_km, duration_minutes,
+         fuel_consumption_liters, cost_analysis, carbon_emission_kg, vehicle_type,
+         traffic_conditions) = _ROUTE_ATTRS(route)
+        return (
+            origin_lat,
+            origin_lng,
+            dest_lat,
+            dest_lng,
+            f"Origin: {origin_lat}, {origin_lng}",
+            f"Destination: {dest_lat}, {dest_lng}",
+            int(distance_km * 1000),  # Convert to meters
+            int(duration_minutes * 60),  # Convert to seconds
+            "",  # polyline_encoded
+            _EMPTY_LIST_JSON,  # route_legs
+            _EMPTY_LIST_JSON,  # route_steps
+            _EMPTY_DICT_JSON,  # toll_info
+            fuel_consumption_liters,
+            cost_analysis.get('fuel_cost', 0),
+            carbon_emission_kg,
+            vehicle_type,
+            dumps_json(traffic_conditions)
+        )
+    
+    def insert_routes_bulk(self, routes: List[RouteData]) -> int:
+        """
+        Birden fazla rota kaydını tek round-trip'te ekler.
+        
+        Args:
+            routes (List[RouteData]): Eklenecek rotalar
+            
+        Returns:
+            int: Eklenen satır sayısı
+        """
+        try:
+            self.ensure_partitions()
+            rows = [self._route_row(route) for route in routes]
+            return self._bulk_upsert(ROUTE_INSERT_SQL, rows, "Route", key_index=None)
+        except Exception as e:
+            logger.error(f"Route toplu ekleme hatası: {e}")
+            return 0
+    
     def insert_route(self, route: RouteData) -> bool:
         """
         Veritabanına bir rota kaydı ekler.
@@ -118,46 +670,87 @@ class PostgreSQLDataWarehouse:
             bool: İşlem başarılı ise True
         """
         try:
-            insert_query = """
-            INSERT INTO routes (
-                origin_latitude, origin_longitude, destination_latitude, destination_longitude,
-                origin_address, destination_address, distance_meters, duration_seconds,
-                polyline_encoded, route_legs, route_steps, toll_info,
-                fuel_consumption_liters, fuel_cost_estimate, carbon_emissions_kg,
-                route_type, traffic_info, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            );
-            """
-            
-            data = (
-                route.origin_lat,
-                route.origin_lng,
-                route.dest_lat,
-                route.dest_lng,
-                f"Origin: {route.origin_lat}, {route.origin_lng}",
-                f"Destination: {route.dest_lat}, {route.dest_lng}",
-                int(route.distance_km * 1000),  # Convert to meters
-                int(route.duration_minutes * 60),  # Convert to seconds
-                "",  # polyline_encoded
-                json.dumps([]),  # route_legs
-                json.dumps([]),  # route_steps
-                json.dumps({}),  # toll_info
-                route.fuel_consumption_liters,
-                route.cost_analysis.get('fuel_cost', 0),
-                route.carbon_emission_kg,
-                route.vehicle_type,
-                json.dumps(route.traffic_conditions),
-                datetime.now()
-            )
-            
-            result = self.config.execute_query(insert_query, data)
-            return result is not None
-            
+            self.ensure_partitions()
+            return self._execute_prepared_insert('route', self._route_row(route), "Route")
         except Exception as e:
             logger.error(f"Route ekleme hatası: {e}")
             return False
     
+    def _truck_service_row(self, service: TruckServiceData) -> tuple:
+        """TruckServiceData nesnesini TRUCK_SERVICE_UPSERT_SQL satırına dönüştürür."""
+        (service_id, name, address, latitude, longitude, service_type,
+         services_offered, truck_parking_spaces, has_adblue, has_truck_repair,
+         has_restaurant, has_shower, has_wifi, operating_hours, rating) = _TRUCK_SERVICE_ATTRS(service)
+        return (
+            service_id,
+            name,
+            address,
+            latitude,
+            longitude,
+            service_type,
+            dumps_json(services_offered),
+            truck_parking_spaces > 0,
+            has_adblue,
+            has_truck_repair,
+            has_restaurant,
+            has_shower,
+            has_wifi,
+            False,  # truck_washing
+            _DIESEL_FUEL_JSON,  # fuel_types
+            dumps_json(operating_hours),
+            None,  # phone_number
+            None,  # website
+            rating,
+            'operational',  # business_status
+            True  # is_24_hours
+        )
+    
+    def insert_truck_services_bulk(self, services: List[TruckServiceData]) -> int:
+        """
+        Birden fazla kamyon hizmetini tek round-trip'te ekler veya günceller.
+        
+        Args:
+            services (List[TruckServiceData]): Eklenecek kamyon hizmetleri
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        try:
+            rows = [self._truck_service_row(service) for service in services]
+            return self._bulk_upsert(TRUCK_SERVICE_UPSERT_SQL, rows, "Truck service")
+        except Exception as e:
+            logger.error(f"Truck service toplu ekleme hatası: {e}")
+            return 0
+    
+    def bulk_copy_truck_services(self, services: List[TruckServiceData]) -> int:
+        """
+        Kamyon hizmetlerini COPY ile geçici tabloya aktarıp tek sorguda upsert eder.
+        
+        İlk yükleme gibi büyük partilerde execute_values'tan çok daha hızlıdır.
+        
+        Args:
+            services (List[TruckServiceData]): Yüklenecek kayıtlar
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        if not services:
+            return 0
+        
+        try:
+            rows = [self._truck_service_row(service) for service in services]
+            result = self.config.copy_upsert(
+                'truck_services', TRUCK_SERVICE_COLUMNS, rows, 'place_id', timestamp_column='updated_at'
+            )
+            if result is None:
+                logger.error("Truck service COPY yükleme hatası")
+                return 0
+            self._invalidate_analytics_cache()
+            return result
+        except Exception as e:
+            logger.error(f"Truck service COPY yükleme hatası: {e}")
+            return 0
+    
     def insert_truck_service(self, service: TruckServiceData) -> bool:
         """
         Veritabanına bir kamyon hizmeti kaydı ekler veya mevcut kaydı günceller.
@@ -169,74 +762,85 @@ class PostgreSQLDataWarehouse:
             bool: İşlem başarılı ise True
         """
         try:
-            insert_query = """
-            INSERT INTO truck_services (
-                place_id, name, address, latitude, longitude, service_type,
-                services_offered, truck_parking_available, adblue_available,
-                mechanical_services, restaurant_available, shower_facilities,
-                wifi_available, truck_washing, fuel_types, opening_hours,
-                phone_number, website, rating, business_status, is_24_hours,
-                updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (place_id) 
-            DO UPDATE SET
-                name = EXCLUDED.name,
-                address = EXCLUDED.address,
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                service_type = EXCLUDED.service_type,
-                services_offered = EXCLUDED.services_offered,
-                truck_parking_available = EXCLUDED.truck_parking_available,
-                adblue_available = EXCLUDED.adblue_available,
-                mechanical_services = EXCLUDED.mechanical_services,
-                restaurant_available = EXCLUDED.restaurant_available,
-                shower_facilities = EXCLUDED.shower_facilities,
-                wifi_available = EXCLUDED.wifi_available,
-                truck_washing = EXCLUDED.truck_washing,
-                fuel_types = EXCLUDED.fuel_types,
-                opening_hours = EXCLUDED.opening_hours,
-                phone_number = EXCLUDED.phone_number,
-                website = EXCLUDED.website,
-                rating = EXCLUDED.rating,
-                business_status = EXCLUDED.business_status,
-                is_24_hours = EXCLUDED.is_24_hours,
-                updated_at = CURRENT_TIMESTAMP;
-            """
-            
-            data = (
-                service.service_id,
-                service.name,
-                service.address,
-                service.latitude,
-                service.longitude,
-                service.service_type,
-                json.dumps(service.services_offered),
-                service.truck_parking_spaces > 0,
-                service.has_adblue,
-                service.has_truck_repair,
-                service.has_restaurant,
-                service.has_shower,
-                service.has_wifi,
-                False,  # truck_washing
-                json.dumps(['diesel']),  # fuel_types
-                json.dumps(service.operating_hours),
-                None,  # phone_number
-                None,  # website
-                service.rating,
-                'operational',  # business_status
-                True,  # is_24_hours
-                datetime.now()
-            )
-            
-            result = self.config.execute_query(insert_query, data)
-            return result is not None
-            
+            return self._execute_prepared_insert('truck_service', self._truck_service_row(service), "Truck service")
         except Exception as e:
             logger.error(f"Truck service ekleme hatası: {e}")
             return False
     
+    def _driver_amenity_row(self, amenity: DriverAmenityData) -> tuple:
+        """DriverAmenityData nesnesini DRIVER_AMENITY_UPSERT_SQL satırına dönüştürür."""
+        (amenity_id, name, address, latitude, longitude, amenity_type,
+         room_count, meal_types, has_shower, has_laundry, has_wifi, has_tv,
+         price_range, rating) = _DRIVER_AMENITY_ATTRS(amenity)
+        return (
+            amenity_id,
+            name,
+            address,
+            latitude,
+            longitude,
+            amenity_type,
+            'accommodation',  # amenity_category
+            room_count is not None and room_count > 0,
+            dumps_json(meal_types),
+            10,  # parking_capacity
+            has_shower,
+            has_laundry,
+            has_wifi,
+            _TV_ENTERTAINMENT_JSON if has_tv else _EMPTY_LIST_JSON,
+            dumps_json({'range': price_range}),
+            _EMPTY_DICT_JSON,  # opening_hours
+            None,  # phone_number
+            None,  # website
+            rating,
+            'operational'  # business_status
+        )
+    
+    def insert_driver_amenities_bulk(self, amenities: List[DriverAmenityData]) -> int:
+        """
+        Birden fazla şoför konfor hizmetini tek round-trip'te ekler veya günceller.
+        
+        Args:
+            amenities (List[DriverAmenityData]): Eklenecek şoför konfor hizmetleri
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        try:
+            rows = [self._driver_amenity_row(amenity) for amenity in amenities]
+            return self._bulk_upsert(DRIVER_AMENITY_UPSERT_SQL, rows, "Driver amenity")
+        except Exception as e:
+            logger.error(f"Driver amenity toplu ekleme hatası: {e}")
+            return 0
+    
+    def bulk_copy_driver_amenities(self, amenities: List[DriverAmenityData]) -> int:
+        """
+        Şoför konfor hizmetlerini COPY ile geçici tabloya aktarıp tek sorguda upsert eder.
+        
+        İlk yükleme gibi büyük partilerde execute_values'tan çok daha hızlıdır.
+        
+        Args:
+            amenities (List[DriverAmenityData]): Yüklenecek kayıtlar
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        if not amenities:
+            return 0
+        
+        try:
+            rows = [self._driver_amenity_row(amenity) for amenity in amenities]
+            result = self.config.copy_upsert(
+                'driver_amenities', DRIVER_AMENITY_COLUMNS, rows, 'place_id', timestamp_column='updated_at'
+            )
+            if result is None:
+                logger.error("Driver amenity COPY yükleme hatası")
+                return 0
+            self._invalidate_analytics_cache()
+            return result
+        except Exception as e:
+            logger.error(f"Driver amenity COPY yükleme hatası: {e}")
+            return 0
+    
     def insert_driver_amenity(self, amenity: DriverAmenityData) -> bool:
         """
         Veritabanına bir şoför konfor hizmeti kaydı ekler veya mevcut kaydı günceller.
@@ -248,71 +852,78 @@ class PostgreSQLDataWarehouse:
             bool: İşlem başarılı ise True
         """
         try:
-            insert_query = """
-            INSERT INTO driver_amenities (
-                place_id, name, address, latitude, longitude, amenity_type,
-                amenity_category, sleep_facilities, food_services, parking_capacity,
-                shower_facilities, laundry_facilities, wifi_available,
-                entertainment_facilities, pricing_info, opening_hours,
-                phone_number, website, rating, business_status, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (place_id) 
-            DO UPDATE SET
-                name = EXCLUDED.name,
-                address = EXCLUDED.address,
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                amenity_type = EXCLUDED.amenity_type,
-                amenity_category = EXCLUDED.amenity_category,
-                sleep_facilities = EXCLUDED.sleep_facilities,
-                food_services = EXCLUDED.food_services,
-                parking_capacity = EXCLUDED.parking_capacity,
-                shower_facilities = EXCLUDED.shower_facilities,
-                laundry_facilities = EXCLUDED.laundry_facilities,
-                wifi_available = EXCLUDED.wifi_available,
-                entertainment_facilities = EXCLUDED.entertainment_facilities,
-                pricing_info = EXCLUDED.pricing_info,
-                opening_hours = EXCLUDED.opening_hours,
-                phone_number = EXCLUDED.phone_number,
-                website = EXCLUDED.website,
-                rating = EXCLUDED.rating,
-                business_status = EXCLUDED.business_status,
-                updated_at = CURRENT_TIMESTAMP;
-            """
-            
-            data = (
-                amenity.amenity_id,
-                amenity.name,
-                amenity.address,
-                amenity.latitude,
-                amenity.longitude,
-                amenity.amenity_type,
-                'accommodation',  # amenity_category
-                amenity.room_count is not None and amenity.room_count > 0,
-                json.dumps(amenity.meal_types),
-                10,  # parking_capacity
-                amenity.has_shower,
-                amenity.has_laundry,
-                amenity.has_wifi,
-                json.dumps(['tv'] if amenity.has_tv else []),
-                json.dumps({'range': amenity.price_range}),
-                json.dumps({}),  # opening_hours
-                None,  # phone_number
-                None,  # website
-                amenity.rating,
-                'operational',  # business_status
-                datetime.now()
-            )
-            
-            result = self.config.execute_query(insert_query, data)
-            return result is not None
-            
+            return self._execute_prepared_insert('driver_amenity', self._driver_amenity_row(amenity), "Driver amenity")
         except Exception as e:
             logger.error(f"Driver amenity ekleme hatası: {e}")
             return False
     
+    def _emergency_service_row(self, emergency: EmergencyServiceData) -> tuple:
+        """EmergencyServiceData nesnesini EMERGENCY_SERVICE_UPSERT_SQL satırına dönüştürür."""
+        (emergency_id, name, address, latitude, longitude, service_type,
+         is_24h, phone_number, emergency_services) = _EMERGENCY_SERVICE_ATTRS(emergency)
+        return (
+            emergency_id,
+            name,
+            address,
+            latitude,
+            longitude,
+            service_type,
+            service_type,  # emergency_type
+            is_24h,
+            phone_number,
+            phone_number,  # emergency_phone
+            None,  # website
+            dumps_json(emergency_services),
+            5.0,  # rating
+            'operational'  # business_status
+        )
+    
+    def insert_emergency_services_bulk(self, emergencies: List[EmergencyServiceData]) -> int:
+        """
+        Birden fazla acil durum hizmetini tek round-trip'te ekler veya günceller.
+        
+        Args:
+            emergencies (List[EmergencyServiceData]): Eklenecek acil durum hizmetleri
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        try:
+            rows = [self._emergency_service_row(emergency) for emergency in emergencies]
+            return self._bulk_upsert(EMERGENCY_SERVICE_UPSERT_SQL, rows, "Emergency service")
+        except Exception as e:
+            logger.error(f"Emergency service toplu ekleme hatası: {e}")
+            return 0
+    
+    def bulk_copy_emergency_services(self, emergencies: List[EmergencyServiceData]) -> int:
+        """
+        Acil durum hizmetlerini COPY ile geçici tabloya aktarıp tek sorguda upsert eder.
+        
+        İlk yükleme gibi büyük partilerde execute_values'tan çok daha hızlıdır.
+        
+        Args:
+            emergencies (List[EmergencyServiceData]): Yüklenecek kayıtlar
+            
+        Returns:
+            int: Eklenen/güncellenen satır sayısı
+        """
+        if not emergencies:
+            return 0
+        
+        try:
+            rows = [self._emergency_service_row(emergency) for emergency in emergencies]
+            result = self.config.copy_upsert(
+                'emergency_services', EMERGENCY_SERVICE_COLUMNS, rows, 'place_id', timestamp_column='updated_at'
+            )
+            if result is None:
+                logger.error("Emergency service COPY yükleme hatası")
+                return 0
+            self._invalidate_analytics_cache()
+            return result
+        except Exception as e:
+            logger.error(f"Emergency service COPY yükleme hatası: {e}")
+            return 0
+    
     def insert_emergency_service(self, emergency: EmergencyServiceData) -> bool:
         """
         Veritabanına bir acil durum hizmeti kaydı ekler veya mevcut kaydı günceller.
@@ -324,56 +935,122 @@ class PostgreSQLDataWarehouse:
             bool: İşlem başarılı ise True
         """
         try:
-            insert_query = """
-            INSERT INTO emergency_services (
-                place_id, name, address, latitude, longitude, service_type,
-                emergency_type, is_24_hours, phone_number, emergency_phone,
-                website, services_offered, rating, business_status, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (place_id) 
-            DO UPDATE SET
-                name = EXCLUDED.name,
-                address = EXCLUDED.address,
-                latitude = EXCLUDED.latitude,
-                longitude = EXCLUDED.longitude,
-                service_type = EXCLUDED.service_type,
-                emergency_type = EXCLUDED.emergency_type,
-                is_24_hours = EXCLUDED.is_24_hours,
-                phone_number = EXCLUDED.phone_number,
-                emergency_phone = EXCLUDED.emergency_phone,
-                website = EXCLUDED.website,
-                services_offered = EXCLUDED.services_offered,
-                rating = EXCLUDED.rating,
-                business_status = EXCLUDED.business_status,
-                updated_at = CURRENT_TIMESTAMP;
-            """
+            return self._execute_prepared_insert('emergency_service', self._emergency_service_row(emergency), "Emergency service")
+        except Exception as e:
+            logger.error(f"Emergency service ekleme hatası: {e}")
+            return False
+    
+    def insert_records(self, stations: Optional[List[FuelStationData]] = None,
+                       routes: Optional[List[RouteData]] = None,
+                       truck_services: Optional[List[TruckServiceData]] = None,
+                       driver_amenities: Optional[List[DriverAmenityData]] = None,
+                       emergency_services: Optional[List[EmergencyServiceData]] = None) -> bool:
+        """
+        Farklı türdeki kayıtları tek round-trip ve tek transaction ile yazar.
+        
+        Her tür için bir çok satırlı INSERT üretilir ve hepsi tek sorgu metninde
+        gönderilir; bir ifade başarısız olursa hiçbir kayıt yazılmaz.
+        
+        Args:
+            stations (List[FuelStationData], optional): Benzin istasyonları
+            routes (List[RouteData], optional): Rotalar
+            truck_services (List[TruckServiceData], optional): Kamyon hizmetleri
+            driver_amenities (List[DriverAmenityData], optional): Şoför konfor hizmetleri
+            emergency_services (List[EmergencyServiceData], optional): Acil durum hizmetleri
             
-            data = (
-                emergency.emergency_id,
-                emergency.name,
-                emergency.address,
-                emergency.latitude,
-                emergency.longitude,
-                emergency.service_type,
-                emergency.service_type,  # emergency_type
-                emergency.is_24h,
-                emergency.phone_number,
-                emergency.phone_number,  # emergency_phone
-                None,  # website
-                json.dumps(emergency.emergency_services),
-                5.0,  # rating
-                'operational',  # business_status
-                datetime.now()
-            )
+        Returns:
+            bool: İşlem başarılı ise True
+        """
+        try:
+            if routes:
+                self.ensure_partitions()
+            statements = [
+                (FUEL_STATION_UPSERT_SQL,
+                 self._dedupe_rows([self._fuel_station_row(item) for item in stations or []])),
+                (ROUTE_INSERT_SQL,
+                 [self._route_row(item) for item in routes or []]),
+                (TRUCK_SERVICE_UPSERT_SQL,
+                 self._dedupe_rows([self._truck_service_row(item) for item in truck_services or []])),
+                (DRIVER_AMENITY_UPSERT_SQL,
+                 self._dedupe_rows([self._driver_amenity_row(item) for item in driver_amenities or []])),
+                (EMERGENCY_SERVICE_UPSERT_SQL,
+                 self._dedupe_rows([self._emergency_service_row(item) for item in emergency_services or []]))
+            ]
+            success = self.config.execute_values_batch(statements)
+            if success:
+                self._invalidate_analytics_cache()
+            return success
+        except Exception as e:
+            logger.error(f"Toplu kayıt ekleme hatası: {e}")
+            return False
+    
+    def _query_df(self, query: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+        """
+        Sorguyu tuple cursor ile çalıştırıp sonucu DataFrame.from_records ile oluşturur.
+        
+        pd.read_sql_query'nin satır başına dict üretimi ve tip tahmini atlanır;
+        bilinen sayısal kolonlara COORDINATE_DTYPES ile doğrudan tip atanır.
+        
+        Args:
+            query (str): Çalıştırılacak SELECT sorgusu
+            params (Sequence, optional): Sorgu parametreleri
             
-            result = self.config.execute_query(insert_query, data)
-            return result is not None
+        Returns:
+            pd.DataFrame: Sorgu sonucu
+        """
+        with self.config.get_connection() as conn:
+            with conn.cursor(cursor_factory=TupleCursor) as cursor:
+                cursor.execute(query, params)
+                rows = cursor.fetchall()
+                columns = [column.name for column in cursor.description]
+        
+        return self._records_df(rows, columns)
+    
+    def _records_df(self, rows: List[tuple], columns: List[str]) -> pd.DataFrame:
+        """
+        Tuple satırlardan DataFrame oluşturur ve COORDINATE_DTYPES tiplerini uygular.
+        
+        Args:
+            rows (List[tuple]): Cursor'dan alınan satırlar
+            columns (List[str]): Kolon adları
             
+        Returns:
+            pd.DataFrame: Tipleri atanmış DataFrame
+        """
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        dtypes = {column: dtype for column, dtype in COORDINATE_DTYPES.items() if column in df.columns}
+        if dtypes and not df.empty:
+            df = df.astype(dtypes)
+        return df
+    
+    def read_stations_arrow(self, country: str):
+        """
+        Benzin istasyonlarını ADBC üzerinden bir pyarrow.Table olarak döndürür.
+        
+        Satırlar Python nesnelerine dönüştürülmeden okunur; pandas'a çevirme işi
+        yalnızca gerektiğinde çağıran tarafta yapılır. Bu yol isteğe bağlıdır ve
+        `get_stations_by_country` ile aynı çıktıyı vermez: JSONB kolonları metin olarak
+        gelir, COORDINATE_DTYPES uygulanmaz ve bağlantı havuzu (statement_timeout,
+        application_name) yerine ayrı bir ADBC bağlantısı açılır.
+        
+        Args:
+            country (str): Sorgulanacak ülkenin adı
+            
+        Returns:
+            Optional[pyarrow.Table]: İstasyon tablosu (ADBC yoksa veya hata olursa None)
+        """
+        if not ADBC_AVAILABLE:
+            return None
+        
+        try:
+            with adbc_dbapi.connect(self.config.get_connection_string()) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(STATIONS_QUERY_SQL)
+                    return cursor.fetch_arrow_table()
+                    
         except Exception as e:
-            logger.error(f"Emergency service ekleme hatası: {e}")
-            return False
+            logger.error(f"Stations Arrow sorgusu hatası: {e}")
+            return None
     
     def get_stations_by_country(self, country: str) -> pd.DataFrame:
         """
@@ -386,21 +1063,44 @@ class PostgreSQLDataWarehouse:
             pd.DataFrame: Ülkedeki istasyonları içeren DataFrame
         """
         try:
-            query = """
-            SELECT id, place_id, name, address, latitude, longitude, 
-                   fuel_types, amenities, rating, created_at
-            FROM fuel_stations
-            ORDER BY name;
-            """
-            
-            with self.config.get_connection() as conn:
-                df = pd.read_sql_query(query, conn)
-                return df
+            return self._query_df(STATIONS_QUERY_SQL)
                 
         except Exception as e:
             logger.error(f"Stations by country sorgusu hatası: {e}")
             return pd.DataFrame()
     
+    def iter_stations(self, country: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """
+        Benzin istasyonlarını sunucu tarafı (named) cursor ile parça parça döndürür.
+        
+        Tüm sonuç istemciye bir kerede alınmaz; bellek kullanımı toplam satır sayısından
+        bağımsız olarak chunk_size ile sınırlı kalır.
+        
+        Generator tüketildiği ya da kapatıldığı ana kadar bir havuz bağlantısı ve açık bir
+        transaction tutar. Parçalar arasında uzun süre beklenebildiğinden bu transaction
+        için idle_in_transaction_session_timeout kapatılır (SET LOCAL, yalnızca bu
+        transaction'da geçerlidir); yarım bırakılan generator'lar close() ile kapatılmalıdır.
+        
+        Args:
+            country (str): Sorgulanacak ülkenin adı
+            chunk_size (int): Her parçadaki maksimum satır sayısı
+            
+        Yields:
+            pd.DataFrame: En fazla chunk_size satırlık istasyon parçası
+        """
+        with self.config.get_connection() as conn:
+            with conn.cursor() as setup_cursor:
+                setup_cursor.execute("SET LOCAL idle_in_transaction_session_timeout = 0;")
+            with conn.cursor(name="stations_stream", cursor_factory=TupleCursor) as cursor:
+                cursor.itersize = chunk_size
+                cursor.execute(STATIONS_QUERY_SQL)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    columns = [column.name for column in cursor.description]
+                    yield self._records_df(rows, columns)
+    
     def get_routes_by_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Belirtilen tarih aralığında oluşturulmuş rotaları bir pandas DataFrame olarak döndürür.
@@ -422,9 +1122,7 @@ class PostgreSQLDataWarehouse:
             ORDER BY created_at DESC;
             """
             
-            with self.config.get_connection() as conn:
-                df = pd.read_sql_query(query, conn, params=(start_date, end_date))
-                return df
+            return self._query_df(query, (start_date, end_date))
                 
         except Exception as e:
             logger.error(f"Routes by date range sorgusu hatası: {e}")
@@ -434,169 +1132,20 @@ class PostgreSQLDataWarehouse:
         """
         Veritabanındaki verilerden genel bir analitik özet oluşturur.
         
+        Sonuç ANALYTICS_CACHE_TTL_SECONDS boyunca tüm örnekler arasında paylaşılır;
+        aynı süre içindeki dashboard yenilemeleri veritabanına gitmez. Başarılı her yazma
+        ve temizlik işlemi önbelleği geçersiz kılar. Çağırana önbellekteki sözlüğün
+        derin kopyası döner; iç içe dağılım sözlükleri değiştirilse de önbellek bozulmaz.
+        
         Returns:
             Dict[str, Any]: Analitik özet metriklerini içeren bir sözlük
         """
-        try:
-            analytics = {}
-            
-            # Fuel stations count
-            count_query = "SELECT COUNT(*) FROM fuel_stations;"
-            result = self.config.execute_query(count_query)
-            analytics['total_stations'] = result[0]['count'] if result else 0
-            
-            # Routes count
-            count_query = "SELECT COUNT(*) FROM routes;"
-            result = self.config.execute_query(count_query)
-            analytics['total_routes'] = result[0]['count'] if result else 0
-            
-            # Average carbon emission
-            avg_query = "SELECT AVG(carbon_emissions_kg) FROM routes WHERE carbon_emissions_kg IS NOT NULL;"
-            result = self.config.execute_query(avg_query)
-            analytics['avg_carbon_emission'] = float(result[0]['avg']) if result and result[0]['avg'] else 0
-            
-            # Average fuel consumption
-            avg_query = "SELECT AVG(fuel_consumption_liters) FROM routes WHERE fuel_consumption_liters IS NOT NULL;"
-            result = self.config.execute_query(avg_query)
-            analytics['avg_fuel_consumption'] = float(result[0]['avg']) if result and result[0]['avg'] else 0
-            
-            # Truck services count
-            count_query = "SELECT COUNT(*) FROM truck_services;"
-            result = self.config.execute_query(count_query)
-            analytics['total_truck_services'] = result[0]['count'] if result else 0
-            
-            # Driver amenities count
-            count_query = "SELECT COUNT(*) FROM driver_amenities;"
-            result = self.config.execute_query(count_query)
-            analytics['total_driver_amenities'] = result[0]['count'] if result else 0
-            
-            # Emergency services count
-            count_query = "SELECT COUNT(*) FROM emergency_services;"
-            result = self.config.execute_query(count_query)
-            analytics['total_emergency_services'] = result[0]['count'] if result else 0
-            
-            # Places API (New) field'ları için analizler
-            # EV şarj istasyonları
-            ev_query = """
-            SELECT COUNT(*) FROM fuel_stations 
-            WHERE ev_charge_options->>'available' = 'true';
-            """
-            result = self.config.execute_query(ev_query)
-            analytics['ev_charging_stations'] = result[0]['count'] if result else 0
-            
-            # Erişilebilir istasyonlar
-            accessible_query = """
-            SELECT COUNT(*) FROM fuel_stations 
-            WHERE accessibility_options->>'wheelchair_accessible_entrance' = 'true';
-            """
-            result = self.config.execute_query(accessible_query)
-            analytics['accessible_stations'] = result[0]['count'] if result else 0
-            
-            # Park imkanı olan istasyonlar
-            parking_query = """
-            SELECT COUNT(*) FROM fuel_stations 
-            WHERE parking_options->>'free_parking_lot' = 'true' 
-               OR parking_options->>'paid_parking_lot' = 'true';
-            """
-            result = self.config.execute_query(parking_query)
-            analytics['stations_with_parking'] = result[0]['count'] if result else 0
-            
-            # Şehir dağılımı (address alanından şehir bilgisini çıkarma)
-            city_query = """
-            SELECT 
-                CASE 
-                    WHEN address LIKE '%İstanbul%' THEN 'İstanbul'
-                    WHEN address LIKE '%Ankara%' THEN 'Ankara'
-                    WHEN address LIKE '%İzmir%' THEN 'İzmir'
-                    WHEN address LIKE '%Bursa%' THEN 'Bursa'
-                    WHEN address LIKE '%Antalya%' THEN 'Antalya'
-                    ELSE 'Diğer'
-                END as city,
-                COUNT(*) as count
-            FROM fuel_stations
-            GROUP BY 
-                CASE 
-                    WHEN address LIKE '%İstanbul%' THEN 'İstanbul'
-                    WHEN address LIKE '%Ankara%' THEN 'Ankara'
-                    WHEN address LIKE '%İzmir%' THEN 'İzmir'
-                    WHEN address LIKE '%Bursa%' THEN 'Bursa'
-                    WHEN address LIKE '%Antalya%' THEN 'Antalya'
-                    ELSE 'Diğer'
-                END
-            ORDER BY count DESC;
-            """
-            result = self.config.execute_query(city_query)
-            analytics['city_distribution'] = {row['city']: row['count'] for row in result} if result else {}
-            
-            # Marka dağılımı
-            brand_query = """
-            SELECT 
-                CASE 
-                    WHEN name ILIKE '%shell%' THEN 'Shell'
-                    WHEN name ILIKE '%bp%' THEN 'BP'
-                    WHEN name ILIKE '%total%' THEN 'Total'
-                    WHEN name ILIKE '%opet%' THEN 'Opet'
-                    WHEN name ILIKE '%petrol ofisi%' OR name ILIKE '%po%' THEN 'Petrol Ofisi'
-                    WHEN name ILIKE '%türkiye petrolleri%' OR name ILIKE '%tp%' THEN 'TP'
-                    ELSE 'Diğer'
-                END as brand,
-                COUNT(*) as count
-            FROM fuel_stations
-            GROUP BY 1
-            ORDER BY count DESC;
-            """
-            result = self.config.execute_query(brand_query)
-            analytics['brand_distribution'] = {row['brand']: row['count'] for row in result} if result else {}
-            
-            # EV şarj türleri dağılımı
-            ev_dist_query = """
-            SELECT 
-                CASE 
-                    WHEN ev_charge_options->>'fast_charging' = 'true' THEN 'Hızlı Şarj'
-                    WHEN ev_charge_options->>'available' = 'true' THEN 'Normal Şarj'
-                    ELSE 'Şarj Yok'
-                END as ev_type,
-                COUNT(*) as count
-            FROM fuel_stations
-            WHERE ev_charge_options IS NOT NULL
-            GROUP BY 1;
-            """
-            result = self.config.execute_query(ev_dist_query)
-            analytics['ev_charging_distribution'] = {row['ev_type']: row['count'] for row in result} if result else {}
-            
-            # Ödeme yöntemleri dağılımı
-            payment_query = """
-            SELECT 
-                'Kredi Kartı' as payment_type,
-                COUNT(*) as count
-            FROM fuel_stations 
-            WHERE payment_options->>'accepts_credit_cards' = 'true'
-            UNION ALL
-            SELECT 
-                'NFC Ödeme' as payment_type,
-                COUNT(*) as count
-            FROM fuel_stations 
-            WHERE payment_options->>'accepts_nfc' = 'true';
-            """
-            result = self.config.execute_query(payment_query)
-            analytics['payment_methods_distribution'] = {row['payment_type']: row['count'] for row in result} if result else {}
-            
-            # Services by type
-            services_query = """
-            SELECT service_type, COUNT(*) as count
-            FROM truck_services
-            GROUP BY service_type
-            ORDER BY count DESC;
-            """
-            result = self.config.execute_query(services_query)
-            analytics['services_by_type'] = {row['service_type']: row['count'] for row in result} if result else {}
-            
-            analytics['last_updated'] = datetime.now().isoformat()
-            
-            return analytics
-            
-        except Exception as e:
-            logger.error(f"Analytics summary hatası: {e}")
+        with _analytics_cache_lock:
+            if _analytics_cache['value'] is not None and _analytics_cache['expires_at'] > time.monotonic():
+                return copy.deepcopy(_analytics_cache['value'])
+        
+        analytics = self._load_analytics_summary()
+        if analytics is None:
             return {
                 'total_stations': 0,
                 'total_routes': 0,
@@ -615,6 +1164,68 @@ class PostgreSQLDataWarehouse:
                 'services_by_type': {},
                 'last_updated': datetime.now().isoformat()
             }
+        
+        with _analytics_cache_lock:
+            _analytics_cache['value'] = analytics
+            _analytics_cache['expires_at'] = time.monotonic() + ANALYTICS_CACHE_TTL_SECONDS
+        return copy.deepcopy(analytics)
+    
+    def _invalidate_analytics_cache(self):
+        """
+        Paylaşılan analitik özet önbelleğini geçersiz kılar.
+        
+        Yazma ve temizlik işlemlerinden sonra çağrılır; sonraki get_analytics_summary
+        çağrısı güncel sayıları veritabanından okur.
+        """
+        with _analytics_cache_lock:
+            _analytics_cache['expires_at'] = 0.0
+    
+    def _load_analytics_summary(self) -> Optional[Dict[str, Any]]:
+        """
+        Analitik özeti veritabanından hesaplar.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Analitik özet veya hata durumunda None
+        """
+        try:
+            analytics = {}
+            
+            # Tek bağlantı, tek transaction, tek round-trip
+            result = self.config.execute_query(ANALYTICS_SUMMARY_SQL)
+            if result is None:
+                return None
+            
+            # Sayılar ve ortalamalar tek satırda
+            totals = result[0] if result else {}
+            analytics['total_stations'] = totals.get('total_stations') or 0
+            analytics['total_routes'] = totals.get('total_routes') or 0
+            analytics['avg_carbon_emission'] = float(totals['avg_carbon_emission']) if totals.get('avg_carbon_emission') else 0
+            analytics['avg_fuel_consumption'] = float(totals['avg_fuel_consumption']) if totals.get('avg_fuel_consumption') else 0
+            analytics['total_truck_services'] = totals.get('total_truck_services') or 0
+            analytics['total_driver_amenities'] = totals.get('total_driver_amenities') or 0
+            analytics['total_emergency_services'] = totals.get('total_emergency_services') or 0
+            
+            # Places API (New) field'ları için analizler
+            analytics['ev_charging_stations'] = totals.get('ev_charging_stations') or 0
+            analytics['accessible_stations'] = totals.get('accessible_stations') or 0
+            analytics['stations_with_parking'] = totals.get('stations_with_parking') or 0
+            
+            for metric in ANALYTICS_DISTRIBUTION_QUERIES:
+                analytics[metric] = totals.get(metric) or {}
+            
+            # Ödeme yöntemleri dağılımı
+            analytics['payment_methods_distribution'] = {
+                'Kredi Kartı': totals.get('credit_card_stations') or 0,
+                'NFC Ödeme': totals.get('nfc_stations') or 0
+            } if totals else {}
+            
+            analytics['last_updated'] = datetime.now().isoformat()
+            
+            return analytics
+            
+        except Exception as e:
+            logger.error(f"Analytics summary hatası: {e}")
+            return None
     
     def get_truck_services_by_type(self, service_type: str, limit: int = 50) -> pd.DataFrame:
         """
@@ -638,9 +1249,7 @@ class PostgreSQLDataWarehouse:
             LIMIT %s;
             """
             
-            with self.config.get_connection() as conn:
-                df = pd.read_sql_query(query, conn, params=(service_type, limit))
-                return df
+            return self._query_df(query, (service_type, limit))
                 
         except Exception as e:
             logger.error(f"Truck services by type sorgusu hatası: {e}")
@@ -661,31 +1270,14 @@ class PostgreSQLDataWarehouse:
             pd.DataFrame: Yakındaki hizmetler listesi
         """
         try:
-            # Basit coğrafi mesafe hesaplama (Haversine yaklaşık)
-            base_query = """
-            SELECT place_id, name, address, latitude, longitude, service_type,
-                   adblue_available, mechanical_services, restaurant_available,
-                   shower_facilities, wifi_available, rating,
-                   (6371 * acos(cos(radians(%s)) * cos(radians(latitude)) * 
-                   cos(radians(longitude) - radians(%s)) + sin(radians(%s)) * 
-                   sin(radians(latitude)))) * 1000 as distance_meters
-            FROM truck_services
-            WHERE (6371 * acos(cos(radians(%s)) * cos(radians(latitude)) * 
-                   cos(radians(longitude) - radians(%s)) + sin(radians(%s)) * 
-                   sin(radians(latitude)))) <= %s
-            """
-            
-            params = [latitude, longitude, latitude, latitude, longitude, latitude, radius_km]
+            params = [longitude, latitude, radius_km * 1000]
+            query = NEARBY_SERVICES_SQL
             
             if service_type:
-                base_query += " AND service_type = %s"
+                query = NEARBY_SERVICES_BY_TYPE_SQL
                 params.append(service_type)
             
-            base_query += " ORDER BY distance_meters ASC LIMIT 100;"
-            
-            with self.config.get_connection() as conn:
-                df = pd.read_sql_query(base_query, conn, params=params)
-                return df
+            return self._query_df(query, params)
                 
         except Exception as e:
             logger.error(f"Services near location sorgusu hatası: {e}")
@@ -702,18 +1294,36 @@ class PostgreSQLDataWarehouse:
             bool: İşlem başarılı ise True
         """
         try:
-            cleanup_queries = [
-                f"DELETE FROM routes WHERE created_at < NOW() - INTERVAL '{days_old} days';",
-                f"DELETE FROM route_calculations WHERE created_at < NOW() - INTERVAL '{days_old} days';",
-                f"DELETE FROM analytics WHERE timestamp < NOW() - INTERVAL '{days_old} days';"
-            ]
+            cutoff = datetime.now() - timedelta(days=days_old)
+            
+            # Gelecek ayların bölümleri her temizlikte yeniden garanti edilir; böylece
+            # periyodik temizlik görevi bölüm penceresini ileri taşır
+            table_creator = TableCreator()
+            if not table_creator.ensure_partitions():
+                logger.warning("Aylık bölümler oluşturulamadı; yeni satırlar DEFAULT bölüme yazılacak")
             
-            for query in cleanup_queries:
-                self.config.execute_query(query)
+            # Tamamı cutoff'tan eski aylık bölümler tek katalog işlemiyle silinir
+            for table in CLEANUP_PARTITIONED_TABLES:
+                if table_creator.drop_partitions_before(table, cutoff.date()) is None:
+                    return False
+            
+            # Cutoff'u içeren aydaki ve bölümlenmemiş tablolardaki eski satırlar
+            # Her parça ayrı bir transaction: WAL ve kilit süresi parça boyutuyla sınırlı kalır
+            for table, delete_query in CLEANUP_DELETE_SQL.items():
+                while True:
+                    deleted = self.config.execute_query(delete_query, (cutoff, CLEANUP_BATCH_SIZE))
+                    if deleted is None:
+                        logger.error(f"Veri temizleme hatası: {table}")
+                        return False
+                    if deleted < CLEANUP_BATCH_SIZE:
+                        break
             
             logger.info(f"Eski veriler temizlendi: {days_old} gün öncesi")
             return True
             
         except Exception as e:
             logger.error(f"Veri temizleme hatası: {e}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            # Yarıda kalan bir temizlik de bölüm veya satır silmiş olabilir
+            self._invalidate_analytics_cache()
\ No newline at end of file
@@ -4,22 +4,51 @@ Driver Assistant Demo
 Şoför asistan özelliklerinin demo kullanımı
 """
 
+import gzip
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from api.driver_assistant import DriverAssistant
+
+from utils.json_utils import dumps_json
+
+# Çıktı dosyasına yazılan servis alanları (ham Places yanıtının geri kalanı atılır)
+SERVICE_FIELDS = ('id', 'displayName', 'types', 'formattedAddress', 'location',
+                  'search_point', 'distance_from_route')
+
+def _slim_service(service: dict) -> dict:
+    """Servis kaydını yalnızca SERVICE_FIELDS alanlarına indirger."""
+    return {key: service.get(key) for key in SERVICE_FIELDS}
+
+def _service_name(service: dict) -> str:
+    """Places kaydının görünen adını döndürür (yoksa 'N/A')."""
+    display_name = service.get('displayName')
+    return display_name.get('text', 'N/A') if display_name else 'N/A'
 
 def main():
     """Şoför asistan demo fonksiyonları"""
     
+    # Demo zamanı bir kez alınır; dosya adı ve JSON zaman damgası aynı anı gösterir
+    now = datetime.now()
+    
     # .env dosyası kontrolü
     if not os.path.exists('.env'):
         print("❌ Error: .env file not found. Please copy .env.example to .env and add your API key.")
         return
     
+    # API modülleri (requests, numpy, config) yalnızca .env varsa yüklenir
+    from api.driver_assistant import DriverAssistant
+    from api.response_cache import response_cache
+    
     print("🚛 Fuel2go Şoför Asistanı Demo")
     print("=" * 50)
     
+    # --no-cache: bu çalıştırmada önbellekten okunmaz, veriler yeniden çekilir
+    if "--no-cache" in sys.argv:
+        response_cache.refresh = True
+        print("🔄 API yanıt önbelleği bu çalıştırmada atlanıyor")
+    
     # Driver Assistant başlat
     assistant = DriverAssistant()
     
@@ -32,17 +61,48 @@ def main():
     print(f"   Ankara: {ankara}")
     
     try:
+        # Acil durum araması rotadan bağımsızdır ve rota hesabıyla aynı anda başlar;
+        # rotaya bağlı aşamalar rota gelir gelmez başlatılır
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                "emergency": executor.submit(
+                    assistant.find_emergency_services,
+                    latitude=ankara["latitude"],
+                    longitude=ankara["longitude"],
+                    radius_km=30
+                ),
+            }
+            
+            # Rota bir kez hesaplanıp rota servisleri ve mola planı tarafından paylaşılır
+            route = executor.submit(assistant.compute_route, istanbul, ankara).result()
+            
+            futures["services"] = executor.submit(
+                assistant.find_services_along_route,
+                origin=istanbul,
+                destination=ankara,
+                service_types=["gas_station", "truck_stop", "restaurant"],
+                search_radius_km=15,
+                interval_km=75,  # Her 75km'de bir ara
+                route=route
+            )
+            futures["stops"] = executor.submit(
+                assistant.plan_driver_stops,
+                origin=istanbul,
+                destination=ankara,
+                driving_hours_limit=4.5,
+                preferred_stop_types=["truck_stop", "rest_stop", "gas_station"],
+                route=route
+            )
+        
+        # Sonuçlar hazır: çıktı satır satır değil, bölüm sonlarında toplu yazılır
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False)
+        
         print("\n🔍 1. Rota Üzerinde Servisleri Bulma")
         print("-" * 30)
         
-        # Rota boyunca servisleri bul
-        services_result = assistant.find_services_along_route(
-            origin=istanbul,
-            destination=ankara,
-            service_types=["gas_station", "truck_stop", "restaurant"],
-            search_radius_km=15,
-            interval_km=75  # Her 75km'de bir ara
-        )
+        # Rota boyunca servisler
+        services_result = futures["services"].result()
         
         print(f"✅ Rota Bilgisi:")
         print(f"   Mesafe: {services_result['route_info']['distance_km']:.1f} km")
@@ -56,20 +116,15 @@ def main():
         # İlk 5 servisi göster
         print(f"\n🏪 İlk 5 Servis:")
         for i, service in enumerate(services_result['services_found'][:5]):
-            display_name = service.get('displayName', {})
-            name = display_name.get('text', 'N/A') if display_name else 'N/A'
             distance = service.get('search_point', {}).get('distance_from_start', 0)
-            print(f"   {i+1}. {name} ({distance:.1f}km)")
+            print(f"   {i+1}. {_service_name(service)} ({distance:.1f}km)")
         
+        sys.stdout.flush()
         print("\n🚨 2. Acil Durum Servisleri (Ankara'ya yakın)")
         print("-" * 30)
         
         # Ankara yakınında acil durum servisleri
-        emergency_services = assistant.find_emergency_services(
-            latitude=ankara["latitude"],
-            longitude=ankara["longitude"],
-            radius_km=30
-        )
+        emergency_services = futures["emergency"].result()
         
         print(f"✅ Acil Durum Servisleri:")
         print(f"   24 Saat Benzin İstasyonu: {emergency_services['summary']['total_24h_stations']} adet")
@@ -77,16 +132,12 @@ def main():
         print(f"   Hastaneler: {emergency_services['summary']['total_hospitals']} adet")
         print(f"   Karakollar: {emergency_services['summary']['total_police_stations']} adet")
         
+        sys.stdout.flush()
         print("\n⏰ 3. Şoför Mola Planlaması")
         print("-" * 30)
         
-        # AB sürücü yönetmeliğine göre mola planla
-        stops_plan = assistant.plan_driver_stops(
-            origin=istanbul,
-            destination=ankara,
-            driving_hours_limit=4.5,
-            preferred_stop_types=["truck_stop", "rest_stop", "gas_station"]
-        )
+        # AB sürücü yönetmeliğine göre mola planı
+        stops_plan = futures["stops"].result()
         
         if 'stops_needed' in stops_plan and stops_plan['stops_needed'] == 0:
             print(f"✅ {stops_plan['message']}")
@@ -104,25 +155,31 @@ def main():
                 
                 # İlk 2 servisi göster
                 for j, service in enumerate(stop['available_services'][:2]):
-                    display_name = service.get('displayName', {})
-                    name = display_name.get('text', 'N/A') if display_name else 'N/A'
-                    print(f"        - {name}")
+                    print(f"        - {_service_name(service)}")
         
         # Sonuçları dosyaya kaydet
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         
-        # Tüm sonuçları birleştir
-        demo_results = {
-            "timestamp": datetime.now().isoformat(),
-            "route": "Istanbul_to_Ankara",
-            "services_along_route": services_result,
-            "emergency_services": emergency_services,
-            "driver_stops_plan": stops_plan
-        }
+        # Sonuçlar tek bir büyük sözlükte birleştirilmeden aşama aşama yazılır
+        demo_sections = [
+            ("timestamp", now.isoformat()),
+            ("route", "Istanbul_to_Ankara"),
+            ("services_along_route", {
+                **services_result,
+                "services_found": [_slim_service(s) for s in services_result['services_found']]
+            }),
+            ("emergency_services", emergency_services),
+            ("driver_stops_plan", stops_plan)
+        ]
         
-        output_file = f"driver_assistant_demo_{timestamp}.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(demo_results, f, indent=2, ensure_ascii=False)
+        # Servis listeleri çok tekrarlı; dosya gzip ile sıkıştırılarak yazılır
+        output_file = f"driver_assistant_demo_{timestamp}.json.gz"
+        with gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=3) as f:
+            f.write("{")
+            for i, (key, value) in enumerate(demo_sections):
+                f.write(f"{',' if i else ''}\n  {json.dumps(key)}: ")
+                f.write(dumps_json(value, indent=True))
+            f.write("\n}\n")
         
         print(f"\n💾 Sonuçlar kaydedildi: {output_file}")
         print(f"\n🎉 Demo tamamlandı! Şoför asistan özellikleri çalışıyor.")
@@ -130,6 +187,8 @@ def main():
     except Exception as e:
         print(f"❌ Hata: {str(e)}")
         print("💡 API anahtarınızın .env dosyasında doğru ayarlandığından emin olun")
+    finally:
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
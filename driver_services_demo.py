@@ -4,23 +4,54 @@
 Mevcut API özelliklerini kullanarak şoförler için kapsamlı servis bulma demo'su
 """
 
-import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from api.driver_assistant import DriverAssistant
-from api.places_client import GooglePlacesClient
+
+from utils.json_utils import dumps_json
+
+# Ekranda ve çıktı dosyasında gösterilen adres uzunluğu
+ADDRESS_PREVIEW_LENGTH = 60
+
+def _service_name(service: dict) -> str:
+    """Places kaydının görünen adını döndürür (yoksa 'N/A')."""
+    display_name = service.get('displayName')
+    return display_name.get('text', 'N/A') if display_name else 'N/A'
+
+def _service_summary(service: dict) -> dict:
+    """Ekrana ve JSON'a yazılan servis alanlarını (ad, kısa adres, ilk 3 tür, mesafe) bir kez çıkarır."""
+    return {
+        "name": _service_name(service),
+        "address": (service.get('formattedAddress') or 'N/A')[:ADDRESS_PREVIEW_LENGTH],
+        "types": (service.get('types') or [])[:3],
+        "distance_km": service.get('search_point', {}).get('distance_from_start', 0)
+    }
 
 def main():
     """İstanbul-Ankara rotası üzerinde şoför servisleri demo"""
     
+    # Demo zamanı bir kez alınır; dosya adı ve JSON zaman damgası aynı anı gösterir
+    now = datetime.now()
+    
     # .env dosyası kontrolü
     if not os.path.exists('.env'):
         print("❌ Error: .env file not found. Please copy .env.example to .env and add your API key.")
         return
     
+    # API modülleri (requests, numpy, config) yalnızca .env varsa yüklenir
+    from api.driver_assistant import DriverAssistant
+    from api.places_client import GooglePlacesClient
+    from api.response_cache import response_cache
+    
     print("🚛 Fuel2go - İstanbul-Ankara Şoför Servisleri Demo")
     print("=" * 60)
     
+    # --no-cache: bu çalıştırmada önbellekten okunmaz, veriler yeniden çekilir
+    if "--no-cache" in sys.argv:
+        response_cache.refresh = True
+        print("🔄 API yanıt önbelleği bu çalıştırmada atlanıyor")
+    
     # API istemcilerini başlat
     try:
         assistant = DriverAssistant()
@@ -33,6 +64,8 @@ def main():
     # İstanbul-Ankara koordinatları
     istanbul = {"latitude": 41.0082, "longitude": 28.9784}
     ankara = {"latitude": 39.9334, "longitude": 32.8597}
+    # Rota ortası (Bolu civarı) - acil durum servisleri için
+    bolu_coords = {"latitude": 40.7369, "longitude": 31.6061}
     
     print(f"\n📍 Demo Rotası: İstanbul ({istanbul['latitude']}, {istanbul['longitude']}) → Ankara ({ankara['latitude']}, {ankara['longitude']})")
     
@@ -41,25 +74,65 @@ def main():
             "route": "Istanbul → Ankara",
             "distance_approx": "450 km",
             "duration_approx": "4.5 hours",
-            "demo_timestamp": datetime.now().isoformat()
+            "demo_timestamp": now.isoformat()
         },
         "services": {}
     }
     
     try:
+        # Aşamalar bir bağımlılık grafiği olarak çalışır: rotadan bağımsız aramalar
+        # (AdBlue, acil durum) rota hesabıyla aynı anda başlar; rota gelir gelmez de
+        # rotaya bağlı aşamalar (rota servisleri, mola planı) başlatılır
+        print("\n📡 Rota servisleri, AdBlue istasyonları, acil durum servisleri ve mola planı eşzamanlı sorgulanıyor...")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = {
+                "adblue_stations": executor.submit(
+                    places_client.search_adblue_stations_batch,
+                    points=[istanbul, ankara],
+                    radius_meters=30000  # 30km
+                ),
+                "emergency_services": executor.submit(
+                    assistant.find_emergency_services,
+                    latitude=bolu_coords["latitude"],
+                    longitude=bolu_coords["longitude"],
+                    radius_km=40
+                ),
+            }
+            
+            # Rota bir kez hesaplanıp rota servisleri ve mola planı tarafından paylaşılır
+            route = executor.submit(assistant.compute_route, istanbul, ankara).result()
+            
+            futures["route_services"] = executor.submit(
+                assistant.find_services_along_route,
+                origin=istanbul,
+                destination=ankara,
+                service_types=["truck_stop", "gas_station", "rest_stop"],
+                search_radius_km=20,
+                interval_km=80,  # Her 80km'de bir ara
+                route=route
+            )
+            futures["break_plan"] = executor.submit(
+                assistant.plan_driver_stops,
+                origin=istanbul,
+                destination=ankara,
+                driving_hours_limit=4.5,  # AB standartı
+                preferred_stop_types=["truck_stop", "rest_stop", "gas_station"],
+                route=route
+            )
+        
+        # Sonuçlar hazır: çıktı satır satır değil, bölüm sonlarında toplu yazılır
+        if hasattr(sys.stdout, "reconfigure"):
+            sys.stdout.reconfigure(line_buffering=False)
+        
+        # Toplam servis sayısı her aşamada biriktirilir
+        total_services = 0
+        
         print("\n" + "="*60)
         print("🔍 1. ROTA ÜZERİNDE KAMYON SERVİSLERİ")
         print("="*60)
         
-        # Rota üzerinde truck stop'lar ve benzin istasyonları bul
-        print("📍 Kamyon dostu servisleri arıyoruz...")
-        route_services = assistant.find_services_along_route(
-            origin=istanbul,
-            destination=ankara,
-            service_types=["truck_stop", "gas_station", "rest_stop"],
-            search_radius_km=20,
-            interval_km=80  # Her 80km'de bir ara
-        )
+        # Rota üzerinde truck stop'lar ve benzin istasyonları
+        route_services = futures["route_services"].result()
         
         print(f"✅ Rota Bilgisi:")
         print(f"   📏 Mesafe: {route_services['route_info']['distance_km']:.1f} km")
@@ -71,89 +144,61 @@ def main():
         for service_type, count in route_services['summary']['services_by_type'].items():
             print(f"   {service_type}: {count} adet")
         
-        # En önemli 10 servisi listele
+        # En önemli 10 servis: alanlar bir kez çıkarılıp hem ekrana hem dosyaya yazılır
+        top_10_services = [_service_summary(service) for service in route_services['services_found'][:10]]
+        
         print(f"\n🏪 Rota Üzerindeki Önemli Servisler:")
-        for i, service in enumerate(route_services['services_found'][:10]):
-            display_name = service.get('displayName', {})
-            name = display_name.get('text', 'N/A') if display_name else 'N/A'
-            distance = service.get('search_point', {}).get('distance_from_start', 0)
-            types = service.get('types', [])
-            print(f"   {i+1:2d}. {name}")
-            print(f"       📍 Rotadan {distance:.1f} km | Türler: {', '.join(types[:3])}")
+        for i, service in enumerate(top_10_services):
+            print(f"   {i+1:2d}. {service['name']}")
+            print(f"       📍 Rotadan {service['distance_km']:.1f} km | Türler: {', '.join(service['types'])}")
         
         demo_results["services"]["route_services"] = {
             "total_found": route_services['summary']['total_services'],
             "by_type": route_services['summary']['services_by_type'],
-            "top_10_services": [
-                {
-                    "name": service.get('displayName', {}).get('text', 'N/A'),
-                    "distance_km": service.get('search_point', {}).get('distance_from_start', 0),
-                    "types": service.get('types', [])[:3]
-                }
-                for service in route_services['services_found'][:10]
-            ]
+            "top_10_services": top_10_services
         }
         
+        total_services += route_services['summary']['total_services']
+        print(f"\n📈 Aşama 1/4 tamamlandı, şu ana kadar {total_services} servis")
+        
+        sys.stdout.flush()
         print("\n" + "="*60)
         print("🔵 2. ADBLUE İSTASYONLARI")
         print("="*60)
         
-        # İstanbul çevresinde AdBlue istasyonları
-        print("🔍 İstanbul çevresinde AdBlue istasyonları arıyoruz...")
-        istanbul_adblue = places_client.search_adblue_stations(
-            latitude=istanbul["latitude"],
-            longitude=istanbul["longitude"],
-            radius_meters=30000  # 30km
-        )
+        # İstanbul ve Ankara çevresindeki AdBlue istasyonları (tek toplu arama)
+        all_adblue = futures["adblue_stations"].result()
+        istanbul_adblue = [s for s in all_adblue if s["search_point"] == istanbul]
+        ankara_adblue = [s for s in all_adblue if s["search_point"] == ankara]
         
         print(f"✅ İstanbul çevresinde {len(istanbul_adblue)} AdBlue istasyonu bulundu")
-        
-        # Ankara çevresinde AdBlue istasyonları
-        print("🔍 Ankara çevresinde AdBlue istasyonları arıyoruz...")
-        ankara_adblue = places_client.search_adblue_stations(
-            latitude=ankara["latitude"],
-            longitude=ankara["longitude"],
-            radius_meters=30000  # 30km
-        )
-        
         print(f"✅ Ankara çevresinde {len(ankara_adblue)} AdBlue istasyonu bulundu")
         
         # AdBlue istasyonlarından örnekler
+        adblue_examples = [_service_summary(station) for station in all_adblue[:5]]
+        
         print(f"\n🔵 Örnek AdBlue İstasyonları:")
-        all_adblue = istanbul_adblue + ankara_adblue
-        for i, station in enumerate(all_adblue[:5]):
-            display_name = station.get('displayName', {})
-            name = display_name.get('text', 'N/A') if display_name else 'N/A'
-            address = station.get('formattedAddress', 'Adres bulunamadı')[:60]
-            print(f"   {i+1}. {name}")
-            print(f"      📍 {address}")
+        for i, station in enumerate(adblue_examples):
+            print(f"   {i+1}. {station['name']}")
+            print(f"      📍 {station['address']}")
         
         demo_results["services"]["adblue_stations"] = {
             "istanbul_count": len(istanbul_adblue),
             "ankara_count": len(ankara_adblue),
             "total_count": len(all_adblue),
-            "examples": [
-                {
-                    "name": station.get('displayName', {}).get('text', 'N/A'),
-                    "address": station.get('formattedAddress', 'N/A')[:60]
-                }
-                for station in all_adblue[:5]
-            ]
+            "examples": adblue_examples
         }
         
+        total_services += len(all_adblue)
+        print(f"\n📈 Aşama 2/4 tamamlandı, şu ana kadar {total_services} servis")
+        
+        sys.stdout.flush()
         print("\n" + "="*60)
         print("🚨 3. ACİL DURUM SERVİSLERİ")
         print("="*60)
         
         # Rota ortasında (Bolu civarı) acil durum servisleri
-        bolu_coords = {"latitude": 40.7369, "longitude": 31.6061}
-        print(f"🚨 Rota ortasında (Bolu civarı) acil durum servisleri arıyoruz...")
-        
-        emergency_services = assistant.find_emergency_services(
-            latitude=bolu_coords["latitude"],
-            longitude=bolu_coords["longitude"],
-            radius_km=40
-        )
+        emergency_services = futures["emergency_services"].result()
         
         print(f"✅ Acil Durum Servisleri (Bolu civarı):")
         print(f"   ⛽ 24 Saat Benzin İstasyonu: {emergency_services['summary']['total_24h_stations']} adet")
@@ -170,27 +215,23 @@ def main():
                 for service in services[:2]:  # Her kategoriden en fazla 2 tane
                     if service_count >= 5:
                         break
-                    display_name = service.get('displayName', {})
-                    name = display_name.get('text', 'N/A') if display_name else 'N/A'
-                    address = service.get('formattedAddress', 'Adres bulunamadı')[:50]
-                    print(f"   {service_count+1}. [{category_name}] {name}")
-                    print(f"      📍 {address}")
+                    summary = _service_summary(service)
+                    print(f"   {service_count+1}. [{category_name}] {summary['name']}")
+                    print(f"      📍 {summary['address']}")
                     service_count += 1
         
         demo_results["services"]["emergency_services"] = emergency_services['summary']
         
+        total_services += sum(emergency_services['summary'].values())
+        print(f"\n📈 Aşama 3/4 tamamlandı, şu ana kadar {total_services} servis")
+        
+        sys.stdout.flush()
         print("\n" + "="*60)
         print("⏰ 4. ŞOFÖR MOLA PLANI (AB YÖNETMELİĞİ)")
         print("="*60)
         
         # AB sürücü yönetmeliğine göre mola planı
-        print("📅 AB Sürücü Yönetmeliği'ne göre mola planı hazırlanıyor...")
-        break_plan = assistant.plan_driver_stops(
-            origin=istanbul,
-            destination=ankara,
-            driving_hours_limit=4.5,  # AB standartı
-            preferred_stop_types=["truck_stop", "rest_stop", "gas_station"]
-        )
+        break_plan = futures["break_plan"].result()
         
         if 'stops_needed' in break_plan and break_plan['stops_needed'] == 0:
             print(f"✅ {break_plan['message']}")
@@ -210,9 +251,7 @@ def main():
                 
                 # İlk 2 hizmeti göster
                 for i, service in enumerate(stop['available_services'][:2]):
-                    display_name = service.get('displayName', {})
-                    name = display_name.get('text', 'N/A') if display_name else 'N/A'
-                    print(f"       {i+1}. {name}")
+                    print(f"       {i+1}. {_service_name(service)}")
         
         demo_results["services"]["break_plan"] = {
             "total_distance_km": break_plan.get('route_info', {}).get('total_distance_km', 0),
@@ -221,6 +260,9 @@ def main():
             "compliance": break_plan.get('regulation_info', {}).get('compliance', 'N/A')
         }
         
+        print(f"\n📈 Aşama 4/4 tamamlandı, şu ana kadar {total_services} servis")
+        
+        sys.stdout.flush()
         print("\n" + "="*60)
         print("📊 5. DEMO ÖZETİ")
         print("="*60)
@@ -231,21 +273,15 @@ def main():
         print("   🚨 Acil durum servisleri analizi")
         print("   ⏰ AB yönetmeliğine uygun mola planlaması")
         
-        total_services = (
-            demo_results["services"]["route_services"]["total_found"] +
-            demo_results["services"]["adblue_stations"]["total_count"] +
-            sum(demo_results["services"]["emergency_services"].values())
-        )
-        
         print(f"\n📈 Toplam Bulunan Servis: {total_services} adet")
         print(f"🎯 Şoförler için kapsamlı destek sağlandı")
         
         # Sonuçları dosyaya kaydet
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         output_file = f"istanbul_ankara_driver_services_demo_{timestamp}.json"
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(demo_results, f, indent=2, ensure_ascii=False)
+            f.write(dumps_json(demo_results, indent=True))
         
         print(f"\n💾 Demo sonuçları kaydedildi: {output_file}")
         
@@ -259,6 +295,8 @@ def main():
     except Exception as e:
         print(f"❌ Demo sırasında hata oluştu: {str(e)}")
         print("💡 API anahtarlarınızın .env dosyasında doğru ayarlandığından emin olun")
+    finally:
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
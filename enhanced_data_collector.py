@@ -4,27 +4,442 @@ Enhanced Data Collection System
 Türkiye geneli kapsamlı mekan verisi toplama sistemi
 """
 
-import json
-import pandas as pd
+import math
+import re
 import numpy as np
 from datetime import datetime, timezone
-import time
 import logging
-from typing import Dict, List, Any, Optional
+import threading
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, defaultdict
+from itertools import chain, combinations
 from dataclasses import dataclass
 import psycopg2
 from pathlib import Path
+from types import MappingProxyType
+from openpyxl import Workbook
+from openpyxl.xml import LXML
 
 from api.routes_client import GoogleRoutesClient
 from api.places_client import GooglePlacesClient
 from api.geocoding_client import GeocodingClient
-from data_models import FuelStationData, RouteData, RealTimeDataCollector
+from data_models import FuelStationData, RouteData, RealTimeDataCollector, StationRow, STATION_ROW_FIELDS
 from db.postgresql_data_warehouse import PostgreSQLDataWarehouse
 from config import constants
+from utils.json_utils import dumps_json, dumps_json_bytes
+
+# Hızlı Excel yazıcı (opsiyonel): xlsxwriter varsa sayfalar onunla, yoksa
+# openpyxl'in write-only moduyla yazılır
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Mock alanların True olma olasılıkları. Şehir başına tek bir (istasyon x alan)
+# matrisi çekilir; istasyon başına ayrı np.random çağrısı yapılmaz
+RANDOM_FLAG_PROBABILITIES = {
+    # Yakıt seçenekleri
+    'midgrade': 0.7, 'premium': 0.8, 'sp91': 0.4, 'sp91_e10': 0.3, 'sp95_e10': 0.6,
+    'lpg': 0.3, 'e85': 0.1, 'biodiesel': 0.2, 'truck_diesel': 0.4,
+    # Ek yakıt türleri
+    'fuel_type_e10': 0.3, 'fuel_type_e85': 0.1,
+    # EV şarj
+    'ev_available': 0.3, 'fast_charging': 0.6,
+    # Park
+    'free_parking_lot': 0.4, 'paid_parking_lot': 0.3, 'free_street_parking': 0.5,
+    'paid_street_parking': 0.2, 'valet_parking': 0.1, 'free_garage_parking': 0.2,
+    'paid_garage_parking': 0.3,
+    # Ödeme
+    'accepts_nfc': 0.7,
+    # Erişilebilirlik
+    'wheelchair_accessible_parking': 0.8, 'wheelchair_accessible_entrance': 0.9,
+    'wheelchair_accessible_restroom': 0.7, 'wheelchair_accessible_seating': 0.6,
+    # Tesisler
+    'facility_accessibility': 0.8, 'facility_ev_charging': 0.3, 'truck_friendly': 0.4,
+    'loyalty_program': 0.6,
+    # Çalışma saatleri
+    'open_24h': 0.8, 'drive_through': 0.4, 'car_wash': 0.3, 'convenience_store': 0.5
+}
+RANDOM_FLAG_NAMES = tuple(RANDOM_FLAG_PROBABILITIES)
+_RANDOM_FLAG_THRESHOLDS = np.array(list(RANDOM_FLAG_PROBABILITIES.values()))
+
+# İstasyon başına 3-6 hizmet. Her boyut için olası tüm hizmet kombinasyonları bir
+# kez hesaplanır; seçim, boyut ve kombinasyon sırası için iki sayıya indirgenir
+MIN_SERVICES, MAX_SERVICES = 3, 6
+SERVICE_COMBINATIONS = {
+    size: tuple(combinations(constants.POSSIBLE_SERVICES, size))
+    for size in range(MIN_SERVICES, MAX_SERVICES + 1)
+}
+
+# Mekan türüne özgü mock alanlar. Her tür için şehir başına tek bir uniform matris
+# çekilir ve her kolon alan tanımına göre dönüştürülür:
+#   ('flag', p)                  -> p olasılıkla True
+#   ('choice', seçenekler, olas.) -> olasılıklara göre (None ise eşit) seçim
+#   ('int', alt, üst)            -> [alt, üst) aralığında tamsayı
+#   ('uniform', alt, üst)        -> [alt, üst) aralığında ondalık
+PLACE_RANDOM_FIELDS = {
+    'hospital': {
+        'emergency_services': ('flag', 0.8),
+        'accepts_insurance': ('flag', 0.9),
+        'appointment_required': ('flag', 0.7),
+        'has_ambulance': ('flag', 0.6),
+        'has_pharmacy_inside': ('flag', 0.8)
+    },
+    'restaurant': {
+        'menu_for_children': ('flag', 0.6),
+        'serves_cocktails': ('flag', 0.3),
+        'serves_beer': ('flag', 0.5),
+        'serves_wine': ('flag', 0.4),
+        'serves_vegetarian_food': ('flag', 0.7),
+        'serves_breakfast': ('flag', 0.4),
+        'serves_brunch': ('flag', 0.3),
+        'serves_lunch': ('flag', 0.9),
+        'serves_dinner': ('flag', 0.8),
+        'reservable': ('flag', 0.6),
+        'takeout': ('flag', 0.7),
+        'delivery': ('flag', 0.5),
+        'dine_in': ('flag', 0.9),
+        'curbside_pickup': ('flag', 0.3),
+        'outdoor_seating': ('flag', 0.4),
+        'live_music': ('flag', 0.2),
+        'good_for_children': ('flag', 0.6),
+        'good_for_groups': ('flag', 0.7),
+        'cuisine_type': ('choice', ('Turkish', 'International', 'Fast Food', 'Italian', 'Chinese'), None),
+        'price_range': ('choice', ('$', '$$', '$$$', '$$$$'), (0.3, 0.4, 0.2, 0.1))
+    },
+    'lodging': {
+        'pet_friendly': ('flag', 0.3),
+        'pool_available': ('flag', 0.4),
+        'fitness_center': ('flag', 0.5),
+        'business_center': ('flag', 0.6),
+        'free_wifi': ('flag', 0.9),
+        'room_service': ('flag', 0.4),
+        'spa_services': ('flag', 0.2),
+        'restaurant_on_site': ('flag', 0.7),
+        'bar_on_site': ('flag', 0.5),
+        'conference_rooms': ('flag', 0.4),
+        'laundry_service': ('flag', 0.8),
+        'concierge_service': ('flag', 0.3),
+        'airport_shuttle': ('flag', 0.3),
+        'smoking_allowed': ('flag', 0.1),
+        'air_conditioning': ('flag', 0.9),
+        'heating': ('flag', 0.95),
+        'star_rating': ('int', 1, 6)
+    },
+    'bank': {
+        'atm_available': ('flag', 0.9),
+        'drive_through': ('flag', 0.6),
+        'foreign_exchange': ('flag', 0.4),
+        'safe_deposit_boxes': ('flag', 0.7),
+        'mortgage_services': ('flag', 0.8),
+        'investment_services': ('flag', 0.6),
+        'business_banking': ('flag', 0.8),
+        'notary_services': ('flag', 0.3)
+    },
+    'pharmacy': {
+        'health_screenings': ('flag', 0.6),
+        'vaccinations': ('flag', 0.7),
+        'delivery_service': ('flag', 0.4),
+        'consultation_services': ('flag', 0.5),
+        'medical_equipment': ('flag', 0.3)
+    },
+    'supermarket': {
+        'grocery_pickup': ('flag', 0.5),
+        'grocery_delivery': ('flag', 0.6),
+        'pharmacy_inside': ('flag', 0.3),
+        'bakery': ('flag', 0.7),
+        'deli': ('flag', 0.6),
+        'butcher': ('flag', 0.5),
+        'seafood_counter': ('flag', 0.4),
+        'organic_products': ('flag', 0.6),
+        'self_checkout': ('flag', 0.7)
+    },
+    'shopping_mall': {
+        'number_of_stores': ('int', 20, 200),
+        'food_court': ('flag', 0.9),
+        'movie_theater': ('flag', 0.6),
+        'department_stores': ('flag', 0.8),
+        'children_play_area': ('flag', 0.5),
+        'valet_parking': ('flag', 0.3),
+        'customer_service': ('flag', 0.9)
+    },
+    'tourist_attraction': {
+        'entrance_fee': ('flag', 0.6),
+        'guided_tours': ('flag', 0.5),
+        'audio_guide': ('flag', 0.4),
+        'gift_shop': ('flag', 0.7),
+        'photography_allowed': ('flag', 0.8),
+        'historical_significance': ('flag', 0.6),
+        'family_friendly': ('flag', 0.8)
+    },
+    'atm': {
+        'bank_network': ('choice', ('Akbank', 'Garanti', 'İş Bankası', 'Yapı Kredi', 'Ziraat'), None),
+        'deposit_available': ('flag', 0.6),
+        'international_cards': ('flag', 0.8),
+        'indoor_location': ('flag', 0.4)
+    },
+    'car_repair': {
+        'oil_change': ('flag', 0.9),
+        'tire_service': ('flag', 0.8),
+        'brake_service': ('flag', 0.7),
+        'engine_repair': ('flag', 0.6),
+        'transmission_service': ('flag', 0.5),
+        'air_conditioning_service': ('flag', 0.6),
+        'electrical_service': ('flag', 0.5),
+        'towing_service': ('flag', 0.4),
+        'inspection_service': ('flag', 0.7)
+    },
+    'parking': {
+        'parking_type': ('choice', ('surface', 'garage', 'street'), None),
+        'hourly_rate': ('uniform', 2.0, 15.0),
+        'daily_rate': ('uniform', 20.0, 100.0),
+        'monthly_rate': ('uniform', 200.0, 800.0),
+        'covered_parking': ('flag', 0.4),
+        'security_cameras': ('flag', 0.7),
+        'attendant_on_site': ('flag', 0.5),
+        'electric_vehicle_charging': ('flag', 0.3)
+    }
+}
+
+# Varsayılan toplama seçenekleri (tüm gelişmiş alanlar açık); salt okunur,
+# çağrılar arasında paylaşılır
+DEFAULT_COLLECTION_OPTIONS = MappingProxyType({
+    'fuel_options': True,
+    'ev_charge_options': True,
+    'parking_options': True,
+    'payment_options': True,
+    'accessibility': True,
+    'secondary_hours': True
+})
+
+# Gelişmiş alanların üretildiği mekan türleri
+FUEL_OPTION_PLACE_TYPES = frozenset({'gas_station', 'car_repair'})
+EV_CHARGE_PLACE_TYPES = frozenset({'gas_station', 'lodging', 'shopping_mall', 'parking'})
+SECONDARY_HOURS_PLACE_TYPES = frozenset({'gas_station', 'restaurant', 'bank', 'pharmacy', 'supermarket'})
+
+# Gelişmiş alan üreticileri, çıktıdaki sırayla:
+# (seçenek, çıktı alanı, Places alanı, üretici metot, geçerli mekan türleri, kapalıyken değer)
+# Places alanı None ise üreticiye ham mekan kaydı verilir; mekan türü None ise tüm
+# türler için üretilir; kapalıyken değer None ise alan hiç eklenmez
+OPTIONAL_ENRICHERS = (
+    ('fuel_options', 'fuel_options', 'fuelOptions', 'generate_fuel_options',
+     FUEL_OPTION_PLACE_TYPES, {}),
+    ('ev_charge_options', 'ev_charge_options', 'evChargeOptions', 'generate_ev_charge_options',
+     EV_CHARGE_PLACE_TYPES, {'available': False}),
+    ('parking_options', 'parking_options', 'parkingOptions', 'generate_parking_options',
+     None, None),
+    ('payment_options', 'payment_options', 'paymentOptions', 'generate_payment_options',
+     None, None),
+    ('accessibility', 'accessibility_options', None, 'generate_accessibility_options',
+     None, None),
+    ('secondary_hours', 'secondary_opening_hours', 'regularSecondaryOpeningHours', 'generate_secondary_hours',
+     SECONDARY_HOURS_PLACE_TYPES, {}),
+)
+
+# Şehir arama ızgarası: Places tek sorguda en fazla 20 sonuç döndürdüğünden şehir
+# merkezi etrafındaki kare alan hücrelere bölünür ve her hücre ayrı sorgulanır
+GRID_HALF_EXTENT_KM = 40
+DENSE_CITY_GRID_SIZE = 8  # 8x8 = 64 hücre
+DEFAULT_GRID_SIZE = 4     # 4x4 = 16 hücre
+DENSE_CITIES = frozenset({'istanbul', 'ankara', 'izmir'})
+GRID_SEARCH_WORKERS = 4  # Aynı anda gönderilen hücre sayısı (dalga boyu)
+KM_PER_DEGREE_LATITUDE = 111.32
+
+# Aynı anda veri toplanacak en fazla şehir sayısı
+CITY_COLLECTION_WORKERS = 5
+
+# Toplanan mekanların ülkesi
+STATION_COUNTRY = 'Turkey'
+STATION_COUNTRY_CODE = 'TR'
+
+# Excel 'Prices' sayfasının kolonları
+EXCEL_PRICE_COLUMNS = ['station_id', 'gasoline_price', 'diesel_price', 'premium_gasoline_price', 'currency']
+
+def write_excel_sheets(filename: str, sheets: List[Tuple[str, List[str], Any]]) -> None:
+    """
+    Sayfaları başlık satırı ve veri satırlarıyla bir Excel dosyasına yazar.
+
+    xlsxwriter kuruluysa `constant_memory` modunda kullanılır (satırlar yazıldıkça
+    diske aktarılır); değilse openpyxl write-only çalışma kitabı kullanılır. openpyxl
+    yolu lxml kurulu değilse uyarı verir.
+
+    Args:
+        filename (str): Oluşturulacak Excel dosyasının adı.
+        sheets (List[Tuple[str, List[str], Any]]): (sayfa adı, kolonlar, satırlar) listesi.
+                                                   Satırlar sırayla bir kez okunur.
+    """
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        try:
+            for sheet_name, columns, rows in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, columns)
+                for row_index, row in enumerate(rows, 1):
+                    worksheet.write_row(row_index, 0, row)
+        finally:
+            workbook.close()
+        return
+    
+    # openpyxl write-only modu lxml olmadan XML'i çok daha yavaş üretir
+    if not LXML:
+        logger.warning("lxml is not installed; openpyxl write-only export will be slow (pip install lxml)")
+    
+    workbook = Workbook(write_only=True)
+    for sheet_name, columns, rows in sheets:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(columns)
+        for row in rows:
+            worksheet.append(row)
+    workbook.save(filename)
+
+# Doğrudan XML ile yazılan .xlsx paketinin sabit parçaları (stil, paylaşılan
+# metin tablosu yok; metinler hücre içinde tutulur)
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{overrides}</Types>'
+)
+_XLSX_SHEET_OVERRIDE = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+_XLSX_WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{index}" r:id="rId{index}"/>'
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{relationships}</Relationships>'
+)
+_XLSX_WORKBOOK_REL = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{index}.xml"/>'
+)
+_XLSX_SHEET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_XLSX_SHEET_FOOTER = '</sheetData></worksheet>'
+
+# XML 1.0'da izin verilmeyen kontrol karakterleri
+_XML_ILLEGAL_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _xlsx_column_letters(index: int) -> str:
+    """0 tabanlı kolon numarasını Excel kolon harflerine çevirir (0 -> 'A', 26 -> 'AA')."""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+def _xlsx_cell(reference: str, value: Any) -> str:
+    """Tek bir hücre değerini SpreadsheetML <c> öğesine çevirir (boş değerler atlanır)."""
+    if value is None:
+        return ''
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, np.number)) and math.isfinite(value):
+        return f'<c r="{reference}"><v>{value}</v></c>'
+    text = xml_escape(_XML_ILLEGAL_CHARS.sub('', str(value)))
+    return f'<c r="{reference}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def write_xlsx_fast(filename: str, sheets: List[Tuple[str, List[str], Any]]) -> None:
+    """
+    Sayfaları Excel kütüphanesi kullanmadan doğrudan SpreadsheetML olarak yazar.
+
+    Her satır tek bir metin parçası olarak zip içindeki sayfa dosyasına akıtılır;
+    hücre nesnesi oluşturulmaz, stil ve paylaşılan metin tablosu yoktur. Parametreler
+    `write_excel_sheets` ile aynıdır.
+
+    Args:
+        filename (str): Oluşturulacak Excel dosyasının adı.
+        sheets (List[Tuple[str, List[str], Any]]): (sayfa adı, kolonlar, satırlar) listesi.
+    """
+    sheet_names = []
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for index, (sheet_name, columns, rows) in enumerate(sheets, 1):
+            sheet_names.append(sheet_name)
+            with archive.open(f'xl/worksheets/sheet{index}.xml', 'w') as sheet_file:
+                sheet_file.write(_XLSX_SHEET_HEADER.encode('utf-8'))
+                column_letters = [_xlsx_column_letters(i) for i in range(len(columns))]
+                for row_number, row in enumerate(chain([columns], rows), 1):
+                    if len(row) > len(column_letters):
+                        column_letters.extend(_xlsx_column_letters(i) for i in range(len(column_letters), len(row)))
+                    cells = ''.join(
+                        _xlsx_cell(f'{letters}{row_number}', value)
+                        for letters, value in zip(column_letters, row)
+                    )
+                    sheet_file.write(f'<row r="{row_number}">{cells}</row>'.encode('utf-8'))
+                sheet_file.write(_XLSX_SHEET_FOOTER.encode('utf-8'))
+        
+        indices = range(1, len(sheet_names) + 1)
+        archive.writestr('[Content_Types].xml', _XLSX_CONTENT_TYPES.format(
+            overrides=''.join(_XLSX_SHEET_OVERRIDE.format(index=index) for index in indices)))
+        archive.writestr('_rels/.rels', _XLSX_ROOT_RELS)
+        archive.writestr('xl/workbook.xml', _XLSX_WORKBOOK.format(sheets=''.join(
+            _XLSX_WORKBOOK_SHEET.format(name=xml_escape(name, {'"': '&quot;'}), index=index)
+            for index, name in zip(indices, sheet_names))))
+        archive.writestr('xl/_rels/workbook.xml.rels', _XLSX_WORKBOOK_RELS.format(
+            relationships=''.join(_XLSX_WORKBOOK_REL.format(index=index) for index in indices)))
+
+def city_search_grid(latitude: float, longitude: float,
+                     half_extent_km: float = GRID_HALF_EXTENT_KM,
+                     grid_size: int = DEFAULT_GRID_SIZE) -> List[Tuple[float, float, int]]:
+    """
+    Şehir merkezi etrafındaki kare alanı `grid_size` x `grid_size` hücreye böler.
+
+    Her hücre, hücreyi tamamen kapsayan (köşegenin yarısı) yarıçapla aranır.
+    Hücreler merkeze yakınlığa göre sıralanır; böylece istasyon sınırına
+    ulaşıldığında merkeze en yakın sonuçlar korunur.
+
+    Args:
+        latitude (float): Şehir merkezinin enlemi.
+        longitude (float): Şehir merkezinin boylamı.
+        half_extent_km (float): Merkezden kare kenarına uzaklık (km).
+        grid_size (int): Bir kenardaki hücre sayısı.
+
+    Returns:
+        List[Tuple[float, float, int]]: (enlem, boylam, yarıçap_metre) listesi.
+    """
+    cell_km = 2 * half_extent_km / grid_size
+    radius_m = math.ceil(cell_km * math.sqrt(2) * 1000 / 2)
+    lat_step = cell_km / KM_PER_DEGREE_LATITUDE
+    lon_step = cell_km / (KM_PER_DEGREE_LATITUDE * math.cos(math.radians(latitude)))
+    
+    # Hücre merkezlerinin şehir merkezine göre indeks ofsetleri (-3.5 ... 3.5 gibi)
+    offsets = [i - (grid_size - 1) / 2 for i in range(grid_size)]
+    cells = sorted(
+        ((row, col) for row in offsets for col in offsets),
+        key=lambda cell: cell[0] ** 2 + cell[1] ** 2
+    )
+    return [
+        (latitude + row * lat_step, longitude + col * lon_step, radius_m)
+        for row, col in cells
+    ]
+
 class EnhancedDataCollector:
     """
     Türkiye geneli mekanlar için kapsamlı veri toplama ve işleme sistemi.
@@ -46,10 +461,30 @@ class EnhancedDataCollector:
         self.geocoding_client = GeocodingClient()
         self.warehouse = PostgreSQLDataWarehouse()
         self.real_time_collector = RealTimeDataCollector(self.warehouse)
+        self.rng = np.random.default_rng()
+        self._rng_lock = threading.Lock()  # Şehirler paralel toplanırken rng paylaşılır
+        self._city_cache: Dict[str, Dict[str, Any]] = {}  # küçük harfli şehir adı -> şehir bilgisi
         
         # Sabitler constants.py dosyasından alınıyor ve Türkiye şehirleri
         self.turkish_cities = self.geocoding_client.get_predefined_turkish_cities()
         self.fuel_brands = constants.FUEL_BRANDS
+        
+        # Marka anahtar kelimeleri bir kez küçük harfe çevrilir (tekrarlar atılır)
+        self._fuel_brands_lc = [
+            (brand, tuple(dict.fromkeys(keyword.lower() for keyword in keywords)))
+            for brand, keywords in self.fuel_brands.items()
+            if brand != constants.UNKNOWN_BRAND and keywords
+        ]
+        self._brand_names = [brand for brand, _ in self._fuel_brands_lc]
+        
+        # Tüm anahtar kelimeler tek bir regex'te derlenir. Her konumda gruplar
+        # marka sırasıyla denenir; böylece en küçük grup numarası, marka x anahtar
+        # kelime döngüsünün döndüreceği markayı verir
+        brand_groups = (
+            '(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')'
+            for _, keywords in self._fuel_brands_lc
+        )
+        self._brand_pattern = re.compile('(?=' + '|'.join(brand_groups) + ')')
     
     def identify_fuel_brand(self, station_name: str) -> str:
         """
@@ -64,32 +499,58 @@ class EnhancedDataCollector:
         Returns:
             str: Belirlenen marka adı veya 'Other'.
         """
-        station_name_lower = station_name.lower()
-        
-        for brand, keywords in self.fuel_brands.items():
-            if brand == constants.UNKNOWN_BRAND:
-                continue
-            for keyword in keywords:
-                if keyword.lower() in station_name_lower:
-                    return brand
+        best_group = None
+        for match in self._brand_pattern.finditer(station_name.lower()):
+            if best_group is None or match.lastindex < best_group:
+                best_group = match.lastindex
+                if best_group == 1:
+                    break
         
-        return constants.UNKNOWN_BRAND
+        if best_group is None:
+            return constants.UNKNOWN_BRAND
+        return self._brand_names[best_group - 1]
+    
+    def find_city(self, city_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Şehir bilgisini döndürür; aynı şehir için tekrar geocoding yapılmaz.
+
+        Sonuçlar şehir adının küçük harfli hâliyle bellekte tutulur. Önceden tanımlı
+        listede olmayan şehirlerin API sonuçları ayrıca disk önbelleğine yazılır
+        (bkz. `GeocodingClient.get_city_coordinates`).
+
+        Args:
+            city_name (str): Şehir adı.
+
+        Returns:
+            Optional[Dict[str, Any]]: Şehir bilgileri veya bulunamazsa None.
+        """
+        key = city_name.strip().lower()
+        city_info = self._city_cache.get(key)
+        if city_info is None:
+            city_info = self.geocoding_client.find_city_by_name(city_name)
+            if city_info:
+                self._city_cache[key] = city_info
+        return city_info
     
-    def collect_stations_by_city(self, city_name: str, max_stations: int = 50, collection_options: Dict[str, bool] = None, place_types: List[str] = None) -> List[Dict[str, Any]]:
+    def collect_stations_by_city(self, city_name: str, max_stations: int = 50, collection_options: Dict[str, bool] = None, place_types: List[str] = None,
+                                 ts: Optional[str] = None) -> List[StationRow]:
         """
         Belirtilen şehir için mekan verilerini toplar.
 
-        Şehri merkez alarak, farklı yarıçaplarda resmi veri kaynakları üzerinden belirtilen türde mekan araması yapar.
-        Belirtilen `max_stations` sayısına ulaşana kadar veya tüm yarıçaplar taranana kadar devam eder.
+        Şehir merkezi etrafındaki alanı ızgara hücrelerine böler ve her hücre için resmi veri
+        kaynakları üzerinden belirtilen türde mekan araması yapar (büyük şehirlerde 8x8,
+        diğerlerinde 4x4). Hücreler merkezden dışa doğru dalgalar halinde sorgulanır ve
+        `max_stations` sayısına ulaşıldığında kalan hücreler için istek gönderilmez.
 
         Args:
             city_name (str): Veri toplanacak şehirin adı (örn: 'Istanbul', 'Ankara').
             max_stations (int, optional): Şehir başına toplanacak maksimum mekan sayısı.
             collection_options (Dict[str, bool]): Hangi veri türlerinin toplanacağını belirten seçenekler.
             place_types (List[str], optional): Aranacak mekan türleri (örn: ['gas_station', 'restaurant']).
+            ts (str, optional): Toplama turunun ISO zaman damgası. Verilmezse o an kullanılır.
 
         Returns:
-            List[Dict[str, Any]]: Toplanan ve zenginleştirilmiş mekan verilerinin listesi.
+            List[StationRow]: Toplanan ve zenginleştirilmiş mekan kayıtlarının listesi.
         """
         # Varsayılan mekan türü
         if place_types is None:
@@ -97,47 +558,194 @@ class EnhancedDataCollector:
             
         logger.info(f"🏙️ {city_name} şehri için {', '.join(place_types)} verisi toplama başlatılıyor...")
         
-        # Şehir koordinatlarını bul
-        city_info = self.geocoding_client.find_city_by_name(city_name)
+        # Şehir koordinatlarını bul (aynı şehir tekrar istenirse önbellekten)
+        city_info = self.find_city(city_name)
         if not city_info:
             logger.error(f"❌ {city_name} şehri bulunamadı!")
             return []
         
-        collected_stations = []
-        search_radii = [5000, 10000, 15000, 25000, 40000]  # 5km'den 40km'ye
-        collected_station_ids = set()
+        grid_size = DENSE_CITY_GRID_SIZE if city_name.lower() in DENSE_CITIES else DEFAULT_GRID_SIZE
+        grid_cells = city_search_grid(city_info['latitude'], city_info['longitude'], grid_size=grid_size)
+        logger.info(f"📍 {city_name} çevresinde {grid_size}x{grid_size} ızgara ({len(grid_cells)} hücre) ile {', '.join(place_types)} arama yapılıyor...")
         
-        for radius in search_radii:
-            if len(collected_stations) >= max_stations:
-                break
-                
-            logger.info(f"📍 {city_name} çevresinde {radius/1000:.0f}km yarıçapında {', '.join(place_types)} arama yapılıyor...")
-            
-            nearby_stations = self.places_client.search_nearby(
-                latitude=city_info['latitude'],
-                longitude=city_info['longitude'],
-                radius_meters=radius,
+        def search_cell(cell: Tuple[float, float, int]) -> List[Dict[str, Any]]:
+            cell_latitude, cell_longitude, radius_meters = cell
+            return self.places_client.search_nearby(
+                latitude=cell_latitude,
+                longitude=cell_longitude,
+                radius_meters=radius_meters,
                 place_types=place_types
             )
-            
-            for station in nearby_stations:
-                if len(collected_stations) >= max_stations:
+        
+        # Hücreler merkezden dışa doğru GRID_SEARCH_WORKERS'lık dalgalar halinde eşzamanlı
+        # sorgulanır; `max_stations` dolunca kalan hücreler için istek gönderilmez.
+        # station_id -> ham mekan; tekilleştirme ve sıralama tek sözlükle yapılır
+        raw_stations: Dict[str, Dict[str, Any]] = {}
+        searched_cells = 0
+        with ThreadPoolExecutor(max_workers=GRID_SEARCH_WORKERS) as executor:
+            for wave_start in range(0, len(grid_cells), GRID_SEARCH_WORKERS):
+                wave = grid_cells[wave_start:wave_start + GRID_SEARCH_WORKERS]
+                searched_cells += len(wave)
+                for nearby_stations in executor.map(search_cell, wave):
+                    for station in nearby_stations:
+                        station_id = station.get('id', '')
+                        if not station_id or station_id in raw_stations:
+                            continue
+                        location = station.get('location', {})
+                        if not location.get('latitude') or not location.get('longitude'):
+                            continue
+                        raw_stations[station_id] = station
+                        if len(raw_stations) >= max_stations:
+                            break
+                    if len(raw_stations) >= max_stations:
+                        break
+                if len(raw_stations) >= max_stations:
                     break
-                    
-                station_id = station.get('id', '')
-                if station_id and station_id not in collected_station_ids:
-                    # İstasyon detaylarını ekle
-                    enhanced_station = self.enhance_station_data(station, city_name, collection_options)
-                    if enhanced_station:
-                        collected_stations.append(enhanced_station)
-                        collected_station_ids.add(station_id)
-            
-            time.sleep(2)  # Rate limiting
+        logger.info(f"🔎 {city_name}: {len(grid_cells)} hücreden {searched_cells} tanesi sorgulandı")
+        
+        # İstasyon detaylarını şehir bazında tek partide ekle
+        collected_stations = self._enrich_batch(list(raw_stations.values()), city_name, collection_options, ts)
         
         logger.info(f"✅ {city_name} için {len(collected_stations)} istasyon verisi toplandı")
         return collected_stations
     
-    def enhance_station_data(self, station: Dict[str, Any], city_name: str, collection_options: Dict[str, bool] = None) -> Optional[Dict[str, Any]]:
+    def _draw_random_batch(self, count: int) -> List[Dict[str, Any]]:
+        """
+        `count` istasyon için tüm rastgele mock değerleri tek seferde üretir.
+        
+        Bayraklar tek bir `rng.random((count, alan_sayısı))` matrisinden, fiyat
+        varyasyonları tek bir `rng.uniform(0.95, 1.05, (count, 3))` matrisinden
+        ve sayısal değerler tek `rng.integers` çağrılarından türetilir.
+
+        Args:
+            count (int): İstasyon sayısı.
+
+        Returns:
+            List[Dict[str, Any]]: İstasyon başına 'flags', 'price_factors',
+                                  'pump_count', 'connector_count',
+                                  'power_level_count' ve 'services' değerleri.
+        """
+        rng = self.rng
+        service_combinations = SERVICE_COMBINATIONS
+        
+        with self._rng_lock:
+            flags = rng.random((count, len(RANDOM_FLAG_NAMES))) < _RANDOM_FLAG_THRESHOLDS
+            price_factors = rng.uniform(0.95, 1.05, (count, 3))
+            pump_counts = rng.integers(4, 16, count)
+            connector_counts = rng.integers(2, 8, count)
+            power_level_counts = rng.integers(1, 4, count)
+            # Rastgele 3-6 hizmet: önce boyut, sonra o boyuttaki kombinasyonlardan biri
+            service_counts = rng.integers(MIN_SERVICES, MAX_SERVICES + 1, count)
+            service_picks = rng.random(count)
+        
+        return [
+            {
+                'flags': dict(zip(RANDOM_FLAG_NAMES, flag_row)),
+                'price_factors': price_row,
+                'pump_count': pump_count,
+                'connector_count': connector_count,
+                'power_level_count': power_level_count,
+                'services': service_combinations[service_count][int(service_pick * len(service_combinations[service_count]))]
+            }
+            for flag_row, price_row, pump_count, connector_count, power_level_count, service_count, service_pick in zip(
+                flags.tolist(), price_factors.tolist(), pump_counts.tolist(), connector_counts.tolist(),
+                power_level_counts.tolist(), service_counts.tolist(), service_picks.tolist()
+            )
+        ]
+    
+    def _draw_place_fields(self, primary_type: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Bir mekan türünün `PLACE_RANDOM_FIELDS` alanlarını `count` mekan için tek seferde üretir.
+
+        Args:
+            primary_type (str): Mekan türü (örn: 'restaurant').
+            count (int): Mekan sayısı.
+
+        Returns:
+            List[Dict[str, Any]]: Mekan başına alan adı -> değer sözlükleri.
+        """
+        field_specs = PLACE_RANDOM_FIELDS.get(primary_type)
+        if not field_specs:
+            return [{} for _ in range(count)]
+        
+        with self._rng_lock:
+            uniforms = self.rng.random((count, len(field_specs)))
+        
+        columns = []
+        for column, spec in zip(uniforms.T, field_specs.values()):
+            kind = spec[0]
+            if kind == 'flag':
+                values = column < spec[1]
+            elif kind == 'choice':
+                options, probabilities = spec[1], spec[2]
+                if probabilities is None:
+                    option_indices = (column * len(options)).astype(np.int64)
+                else:
+                    option_indices = np.searchsorted(np.cumsum(probabilities), column, side='right')
+                option_indices = np.minimum(option_indices, len(options) - 1)
+                columns.append([options[i] for i in option_indices.tolist()])
+                continue
+            elif kind == 'int':
+                values = spec[1] + (column * (spec[2] - spec[1])).astype(np.int64)
+            else:  # 'uniform'
+                values = spec[1] + column * (spec[2] - spec[1])
+            columns.append(values.tolist())
+        
+        return [dict(zip(field_specs, row)) for row in zip(*columns)]
+    
+    def _city_context(self, city_name: str) -> Dict[str, Any]:
+        """
+        Bir şehrin tüm istasyonlarında aynı kalan değerleri bir kez hesaplar.
+
+        Args:
+            city_name (str): Şehir adı.
+
+        Returns:
+            Dict[str, Any]: 'region' ve 'base_prices' değerleri.
+        """
+        return {
+            'region': f"{city_name}_region",
+            'base_prices': constants.BASE_PRICES.get(STATION_COUNTRY_CODE, constants.DEFAULT_PRICES)
+        }
+    
+    def _enrich_batch(self, stations: List[Dict[str, Any]], city_name: str, collection_options: Dict[str, bool] = None,
+                      ts: Optional[str] = None) -> List[StationRow]:
+        """
+        Bir şehrin ham mekan listesini tek partide zenginleştirir.
+
+        Args:
+            stations (List[Dict[str, Any]]): Ham mekan verileri.
+            city_name (str): Şehir adı.
+            collection_options (Dict[str, bool]): Hangi veri türlerinin toplanacağını belirten seçenekler.
+            ts (str, optional): Toplama turunun ISO zaman damgası.
+
+        Returns:
+            List[StationRow]: Zenginleştirilmiş mekan kayıtları.
+        """
+        if ts is None:
+            ts = datetime.now(timezone.utc).isoformat()
+        draws = self._draw_random_batch(len(stations))
+        
+        # Mekana özgü alanlar tür bazında tek seferde çekilir
+        indices_by_type = defaultdict(list)
+        for index, station in enumerate(stations):
+            indices_by_type[station.get('primaryType', 'gas_station')].append(index)
+        for primary_type, indices in indices_by_type.items():
+            if primary_type not in PLACE_RANDOM_FIELDS:
+                continue
+            for index, place_fields in zip(indices, self._draw_place_fields(primary_type, len(indices))):
+                draws[index]['place_fields'] = place_fields
+        
+        city_context = self._city_context(city_name)
+        enriched = (
+            self.enhance_station_data(station, city_name, collection_options, station_draws, ts, city_context)
+            for station, station_draws in zip(stations, draws)
+        )
+        return [station for station in enriched if station]
+    
+    def enhance_station_data(self, station: Dict[str, Any], city_name: str, collection_options: Dict[str, bool] = None,
+                             draws: Optional[Dict[str, Any]] = None, ts: Optional[str] = None,
+                             city_context: Optional[Dict[str, Any]] = None) -> Optional[StationRow]:
         """
         Ham istasyon verisini ek bilgilerle zenginleştirir.
 
@@ -149,45 +757,53 @@ class EnhancedDataCollector:
             station (Dict[str, Any]): Resmi veri kaynaklarından gelen ham mekan verisi.
             city_name (str): İstasyonun bulunduğu şehirin adı.
             collection_options (Dict[str, bool]): Hangi veri türlerinin toplanacağını belirten seçenekler.
+            draws (Dict[str, Any], optional): `_draw_random_batch` ile önceden üretilmiş
+                                              rastgele değerler. Verilmezse tek istasyon için üretilir.
+            ts (str, optional): `last_updated` ve `collection_timestamp` için ISO zaman
+                                damgası. Verilmezse o an kullanılır.
+            city_context (Dict[str, Any], optional): `_city_context` ile şehir başına bir kez
+                                                     hesaplanan değerler. Verilmezse hesaplanır.
 
         Returns:
-            Optional[Dict[str, Any]]: Zenginleştirilmiş istasyon verisi. Gerekli temel bilgiler
+            Optional[StationRow]: Zenginleştirilmiş istasyon kaydı. Gerekli temel bilgiler
                                       (örn: enlem/boylam) eksikse None dönebilir.
         """
-        if collection_options is None:
-            collection_options = {
-                'fuel_options': True,
-                'ev_charge_options': True,
-                'parking_options': True,
-                'payment_options': True,
-                'accessibility': True,
-                'secondary_hours': True
-            }
+        collection_options = collection_options or DEFAULT_COLLECTION_OPTIONS
+        if draws is None:
+            draws = self._draw_random_batch(1)[0]
+        if ts is None:
+            ts = datetime.now(timezone.utc).isoformat()
+        if city_context is None:
+            city_context = self._city_context(city_name)
             
         try:
+            unknown_name = constants.UNKNOWN_NAME
             display_name = station.get('displayName', {})
-            name = display_name.get('text', constants.UNKNOWN_NAME) if display_name else constants.UNKNOWN_NAME
+            name = display_name.get('text', unknown_name) if display_name else unknown_name
             
             location = station.get('location', {})
-            if not location.get('latitude') or not location.get('longitude'):
+            latitude = location.get('latitude')
+            longitude = location.get('longitude')
+            if not latitude or not longitude:
                 return None
             
-            # Marka belirle
-            brand = self.identify_fuel_brand(name)
-            
             # Mekan türünü belirle
             primary_type = station.get('primaryType', 'gas_station')
+            is_gas_station = primary_type == 'gas_station'
+            
+            # Marka yalnızca benzin istasyonları için belirlenir
+            brand = self.identify_fuel_brand(name) if is_gas_station else 'N/A'
             
             # Temel veriler
             enhanced_data = {
                 'station_id': station.get('id', ''),
                 'name': name,
-                'brand': brand if primary_type == 'gas_station' else 'N/A',
-                'country': 'Turkey',
+                'brand': brand,
+                'country': STATION_COUNTRY,
                 'city': city_name,
-                'region': f"{city_name}_region",
-                'latitude': location.get('latitude'),
-                'longitude': location.get('longitude'),
+                'region': city_context['region'],
+                'latitude': latitude,
+                'longitude': longitude,
                 'address': station.get('formattedAddress', ''),
                 'short_formatted_address': station.get('shortFormattedAddress', ''),
                 'rating': station.get('rating', constants.DEFAULT_RATING),
@@ -195,68 +811,47 @@ class EnhancedDataCollector:
                 'business_status': station.get('businessStatus', constants.BUSINESS_STATUS_OPERATIONAL),
                 'primary_type': primary_type,
                 'primary_type_display_name': station.get('primaryTypeDisplayName', {}).get('text', 'Place'),
-                'services': self.generate_services(),
-                'operating_hours': self.generate_operating_hours(),
-                'last_updated': datetime.now(timezone.utc).isoformat(),
+                'services': self.generate_services(draws),
+                'operating_hours': self.generate_operating_hours(draws),
+                'last_updated': ts,
                 'data_source': constants.DATA_SOURCE_GOOGLE,
-                'collection_timestamp': datetime.now(timezone.utc).isoformat()
+                'collection_timestamp': ts
             }
             
             # Mekan türüne göre spesifik alanları ekle
-            if primary_type == 'gas_station':
+            if is_gas_station:
                 # Sadece benzin istasyonları için yakıt bilgileri
-                enhanced_data['fuel_types'] = self.generate_fuel_types(brand)
-                enhanced_data['price_data'] = self.generate_price_data('TR')
-                enhanced_data['facilities'] = self.generate_facilities()
+                enhanced_data['fuel_types'] = self.generate_fuel_types(brand, draws)
+                enhanced_data['price_data'] = self.generate_price_data(STATION_COUNTRY_CODE, draws, city_context['base_prices'])
+                enhanced_data['facilities'] = self.generate_facilities(draws)
             else:
                 # Diğer mekanlar için yakıt bilgisi yok
                 enhanced_data['fuel_types'] = []
                 enhanced_data['price_data'] = {}
                 enhanced_data['facilities'] = {}
             
-            # Gelişmiş veri alanlarını mekan türüne göre ekle
-            if primary_type in ['gas_station', 'car_repair'] and collection_options.get('fuel_options', True):
-                enhanced_data['fuel_options'] = self.generate_fuel_options(station.get('fuelOptions', {}))
-            else:
-                enhanced_data['fuel_options'] = {}
-                
-            # EV şarj - benzin istasyonu, otel, alışveriş merkezi için
-            if primary_type in ['gas_station', 'lodging', 'shopping_mall', 'parking'] and collection_options.get('ev_charge_options', True):
-                enhanced_data['ev_charge_options'] = self.generate_ev_charge_options(station.get('evChargeOptions', {}))
-            else:
-                enhanced_data['ev_charge_options'] = {'available': False}
-                
-            # Park - çoğu mekan için geçerli
-            if collection_options.get('parking_options', True):
-                enhanced_data['parking_options'] = self.generate_parking_options(station.get('parkingOptions', {}))
-                
-            # Ödeme - çoğu mekan için geçerli
-            if collection_options.get('payment_options', True):
-                enhanced_data['payment_options'] = self.generate_payment_options(station.get('paymentOptions', {}))
-                
-            # Erişilebilirlik - tüm mekanlar için geçerli
-            if collection_options.get('accessibility', True):
-                enhanced_data['accessibility_options'] = self.generate_accessibility_options(station)
-                
-            # İkincil saatler - benzin istasyonu ve bazı ticari mekanlar için
-            if primary_type in ['gas_station', 'restaurant', 'bank', 'pharmacy', 'supermarket'] and collection_options.get('secondary_hours', True):
-                enhanced_data['secondary_opening_hours'] = self.generate_secondary_hours(station.get('regularSecondaryOpeningHours', []))
-            else:
-                enhanced_data['secondary_opening_hours'] = {}
+            # Gelişmiş veri alanlarını seçeneklere ve mekan türüne göre ekle
+            for option, field_name, api_field, method_name, place_types, disabled_value in OPTIONAL_ENRICHERS:
+                if (place_types is None or primary_type in place_types) and collection_options.get(option, True):
+                    source = station if api_field is None else station.get(api_field, {})
+                    enhanced_data[field_name] = getattr(self, method_name)(source, draws)
+                elif disabled_value is not None:
+                    enhanced_data[field_name] = dict(disabled_value)
                 
             # Sub destinations
             enhanced_data['sub_destinations'] = station.get('subDestinations', [])
             
             # Mekan türüne özgü spesifik alanları ekle
-            enhanced_data.update(self.get_place_specific_fields(station, primary_type))
+            enhanced_data.update(self.get_place_specific_fields(station, primary_type, draws.get('place_fields')))
             
-            return enhanced_data
+            # Sabit alanlar slotlu kayda, isteğe bağlı/türe özgü alanlar extra'ya
+            return StationRow.from_dict(enhanced_data)
             
         except Exception as e:
             logger.error(constants.LOG_MSG_ENRICHMENT_ERROR.format(error=e))
             return None
     
-    def generate_fuel_types(self, brand: str) -> List[str]:
+    def generate_fuel_types(self, brand: str, draws: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Verilen markaya göre mock yakıt türleri listesi oluşturur.
         
@@ -266,10 +861,13 @@ class EnhancedDataCollector:
 
         Args:
             brand (str): Yakıt markası.
+            draws (Dict[str, Any], optional): Önceden üretilmiş rastgele değerler.
 
         Returns:
             List[str]: Oluşturulan yakıt türleri listesi.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         base_types = constants.BASE_FUEL_TYPES.copy()
         
         if brand in constants.PREMIUM_FUEL_BRANDS:
@@ -279,93 +877,102 @@ class EnhancedDataCollector:
             base_types.append('LPG')
         
         # E10/E85 yakıtları (tablolardaki gibi)
-        if np.random.random() > 0.7:  # %30 şans
+        if flags['fuel_type_e10']:  # %30 şans
             base_types.append('E10')
         
-        if np.random.random() > 0.9:  # %10 şans
+        if flags['fuel_type_e85']:  # %10 şans
             base_types.append('E85')
         
         return base_types
     
-    def generate_fuel_options(self, fuel_options_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_fuel_options(self, fuel_options_data: Dict[str, Any], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Yakıt seçenekleri veri alanından veri üretir.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         return {
             'diesel': fuel_options_data.get('diesel', True),
             'regular_unleaded': fuel_options_data.get('regularUnleaded', True),
-            'midgrade': fuel_options_data.get('midgrade', np.random.choice([True, False], p=[0.7, 0.3])),
-            'premium': fuel_options_data.get('premium', np.random.choice([True, False], p=[0.8, 0.2])),
-            'sp91': fuel_options_data.get('sp91', np.random.choice([True, False], p=[0.4, 0.6])),
-            'sp91_e10': fuel_options_data.get('sp91E10', np.random.choice([True, False], p=[0.3, 0.7])),
-            'sp95_e10': fuel_options_data.get('sp95E10', np.random.choice([True, False], p=[0.6, 0.4])),
-            'lpg': fuel_options_data.get('lpg', np.random.choice([True, False], p=[0.3, 0.7])),
-            'e85': fuel_options_data.get('e85', np.random.choice([True, False], p=[0.1, 0.9])),
-            'biodiesel': fuel_options_data.get('biodiesel', np.random.choice([True, False], p=[0.2, 0.8])),
-            'truck_diesel': fuel_options_data.get('truckDiesel', np.random.choice([True, False], p=[0.4, 0.6]))
+            'midgrade': fuel_options_data.get('midgrade', flags['midgrade']),
+            'premium': fuel_options_data.get('premium', flags['premium']),
+            'sp91': fuel_options_data.get('sp91', flags['sp91']),
+            'sp91_e10': fuel_options_data.get('sp91E10', flags['sp91_e10']),
+            'sp95_e10': fuel_options_data.get('sp95E10', flags['sp95_e10']),
+            'lpg': fuel_options_data.get('lpg', flags['lpg']),
+            'e85': fuel_options_data.get('e85', flags['e85']),
+            'biodiesel': fuel_options_data.get('biodiesel', flags['biodiesel']),
+            'truck_diesel': fuel_options_data.get('truckDiesel', flags['truck_diesel'])
         }
     
-    def generate_ev_charge_options(self, ev_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_ev_charge_options(self, ev_data: Dict[str, Any], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         EV şarj seçenekleri veri alanından bilgileri üretir.
         """
-        has_ev = np.random.choice([True, False], p=[0.3, 0.7])
-        if not has_ev:
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
+        if not flags['ev_available']:
             return {'available': False}
             
         return {
             'available': True,
-            'connector_count': ev_data.get('connectorCount', np.random.randint(2, 8)),
+            'connector_count': ev_data.get('connectorCount', draws['connector_count']),
             'connector_aggregation': ev_data.get('connectorAggregation', []),
-            'fast_charging': np.random.choice([True, False], p=[0.6, 0.4]),
-            'power_levels': ['22kW', '50kW', '150kW'][:np.random.randint(1, 4)]
+            'fast_charging': flags['fast_charging'],
+            'power_levels': ['22kW', '50kW', '150kW'][:draws['power_level_count']]
         }
     
-    def generate_parking_options(self, parking_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_parking_options(self, parking_data: Dict[str, Any], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Park seçenekleri veri alanından bilgileri üretir.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         return {
-            'free_parking_lot': parking_data.get('freeParkingLot', np.random.choice([True, False], p=[0.4, 0.6])),
-            'paid_parking_lot': parking_data.get('paidParkingLot', np.random.choice([True, False], p=[0.3, 0.7])),
-            'free_street_parking': parking_data.get('freeStreetParking', np.random.choice([True, False], p=[0.5, 0.5])),
-            'paid_street_parking': parking_data.get('paidStreetParking', np.random.choice([True, False], p=[0.2, 0.8])),
-            'valet_parking': parking_data.get('valetParking', np.random.choice([True, False], p=[0.1, 0.9])),
-            'free_garage_parking': parking_data.get('freeGarageParking', np.random.choice([True, False], p=[0.2, 0.8])),
-            'paid_garage_parking': parking_data.get('paidGarageParking', np.random.choice([True, False], p=[0.3, 0.7]))
+            'free_parking_lot': parking_data.get('freeParkingLot', flags['free_parking_lot']),
+            'paid_parking_lot': parking_data.get('paidParkingLot', flags['paid_parking_lot']),
+            'free_street_parking': parking_data.get('freeStreetParking', flags['free_street_parking']),
+            'paid_street_parking': parking_data.get('paidStreetParking', flags['paid_street_parking']),
+            'valet_parking': parking_data.get('valetParking', flags['valet_parking']),
+            'free_garage_parking': parking_data.get('freeGarageParking', flags['free_garage_parking']),
+            'paid_garage_parking': parking_data.get('paidGarageParking', flags['paid_garage_parking'])
         }
     
-    def generate_payment_options(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_payment_options(self, payment_data: Dict[str, Any], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Ödeme seçenekleri veri alanından bilgileri üretir.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         return {
             'accepts_credit_cards': payment_data.get('acceptsCreditCards', True),
             'accepts_debit_cards': payment_data.get('acceptsDebitCards', True),
             'accepts_cash_only': payment_data.get('acceptsCashOnly', False),
-            'accepts_nfc': payment_data.get('acceptsNfc', np.random.choice([True, False], p=[0.7, 0.3]))
+            'accepts_nfc': payment_data.get('acceptsNfc', flags['accepts_nfc'])
         }
     
-    def generate_accessibility_options(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_accessibility_options(self, station: Dict[str, Any], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Erişilebilirlik veri alanlarından bilgileri üretir.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         return {
-            'wheelchair_accessible_parking': station.get('wheelchairAccessibleParking', np.random.choice([True, False], p=[0.8, 0.2])),
-            'wheelchair_accessible_entrance': station.get('wheelchairAccessibleEntrance', np.random.choice([True, False], p=[0.9, 0.1])),
-            'wheelchair_accessible_restroom': station.get('wheelchairAccessibleRestroom', np.random.choice([True, False], p=[0.7, 0.3])),
-            'wheelchair_accessible_seating': station.get('wheelchairAccessibleSeating', np.random.choice([True, False], p=[0.6, 0.4]))
+            'wheelchair_accessible_parking': station.get('wheelchairAccessibleParking', flags['wheelchair_accessible_parking']),
+            'wheelchair_accessible_entrance': station.get('wheelchairAccessibleEntrance', flags['wheelchair_accessible_entrance']),
+            'wheelchair_accessible_restroom': station.get('wheelchairAccessibleRestroom', flags['wheelchair_accessible_restroom']),
+            'wheelchair_accessible_seating': station.get('wheelchairAccessibleSeating', flags['wheelchair_accessible_seating'])
         }
     
-    def generate_secondary_hours(self, secondary_hours_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_secondary_hours(self, secondary_hours_data: List[Dict[str, Any]], draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         İkincil çalışma saatleri veri alanından bilgileri üretir.
         """
         if not secondary_hours_data:
             return {
-                'drive_through': self.generate_drive_through_hours(),
-                'car_wash': self.generate_car_wash_hours(),
-                'convenience_store': self.generate_convenience_store_hours()
+                'drive_through': self.generate_drive_through_hours(draws),
+                'car_wash': self.generate_car_wash_hours(draws),
+                'convenience_store': self.generate_convenience_store_hours(draws)
             }
         
         return {
@@ -374,245 +981,266 @@ class EnhancedDataCollector:
             'convenience_store': secondary_hours_data[2] if len(secondary_hours_data) > 2 else {}
         }
     
-    def generate_drive_through_hours(self) -> Dict[str, str]:
+    def generate_drive_through_hours(self, draws: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """Drive-through saatleri üretir."""
-        if np.random.random() > 0.6:  # %40 şans drive-through var
+        draws = draws or self._draw_random_batch(1)[0]
+        if draws['flags']['drive_through']:  # %40 şans drive-through var
             return {"all_days": "06:00-23:00"}
         return {}
     
-    def generate_car_wash_hours(self) -> Dict[str, str]:
+    def generate_car_wash_hours(self, draws: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """Araç yıkama saatleri üretir."""
-        if np.random.random() > 0.7:  # %30 şans car wash var
+        draws = draws or self._draw_random_batch(1)[0]
+        if draws['flags']['car_wash']:  # %30 şans car wash var
             return {"monday_friday": "08:00-20:00", "weekend": "09:00-18:00"}
         return {}
     
-    def generate_convenience_store_hours(self) -> Dict[str, str]:
+    def generate_convenience_store_hours(self, draws: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """Market saatleri üretir."""
-        if np.random.random() > 0.5:  # %50 şans market var
+        draws = draws or self._draw_random_batch(1)[0]
+        if draws['flags']['convenience_store']:  # %50 şans market var
             return {"all_days": "05:00-23:00"}
         return {}
     
-    def get_place_specific_fields(self, station: Dict[str, Any], primary_type: str) -> Dict[str, Any]:
+    def get_place_specific_fields(self, station: Dict[str, Any], primary_type: str,
+                                  values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Mekan türüne özgü spesifik alanları standart veri şemasına göre döndürür.
+        
+        `values` verilirse (`_draw_place_fields` çıktısı) mock alanlar ondan okunur.
         """
         specific_fields = {}
         
         if primary_type == 'hospital':
-            specific_fields.update(self.get_hospital_fields(station))
+            specific_fields.update(self.get_hospital_fields(station, values))
         elif primary_type == 'restaurant':
-            specific_fields.update(self.get_restaurant_fields(station))
+            specific_fields.update(self.get_restaurant_fields(station, values))
         elif primary_type == 'lodging':
-            specific_fields.update(self.get_lodging_fields(station))
+            specific_fields.update(self.get_lodging_fields(station, values))
         elif primary_type == 'bank':
-            specific_fields.update(self.get_bank_fields(station))
+            specific_fields.update(self.get_bank_fields(station, values))
         elif primary_type == 'pharmacy':
-            specific_fields.update(self.get_pharmacy_fields(station))
+            specific_fields.update(self.get_pharmacy_fields(station, values))
         elif primary_type == 'supermarket':
-            specific_fields.update(self.get_supermarket_fields(station))
+            specific_fields.update(self.get_supermarket_fields(station, values))
         elif primary_type == 'shopping_mall':
-            specific_fields.update(self.get_shopping_mall_fields(station))
+            specific_fields.update(self.get_shopping_mall_fields(station, values))
         elif primary_type == 'tourist_attraction':
-            specific_fields.update(self.get_tourist_attraction_fields(station))
+            specific_fields.update(self.get_tourist_attraction_fields(station, values))
         elif primary_type == 'atm':
-            specific_fields.update(self.get_atm_fields(station))
+            specific_fields.update(self.get_atm_fields(station, values))
         elif primary_type == 'car_repair':
-            specific_fields.update(self.get_car_repair_fields(station))
+            specific_fields.update(self.get_car_repair_fields(station, values))
         elif primary_type == 'parking':
-            specific_fields.update(self.get_parking_fields(station))
+            specific_fields.update(self.get_parking_fields(station, values))
             
         return specific_fields
     
-    def get_hospital_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_hospital_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Hastane için spesifik alanlar"""
+        values = values or self._draw_place_fields('hospital', 1)[0]
         return {
             'hospital_departments': station.get('hospitalDepartments', []),
             'medical_services': station.get('medicalServices', []),
-            'emergency_services': station.get('emergencyServices', np.random.choice([True, False], p=[0.8, 0.2])),
-            'accepts_insurance': station.get('acceptsInsurance', np.random.choice([True, False], p=[0.9, 0.1])),
-            'appointment_required': station.get('appointmentRequired', np.random.choice([True, False], p=[0.7, 0.3])),
-            'has_ambulance': np.random.choice([True, False], p=[0.6, 0.4]),
-            'has_pharmacy_inside': np.random.choice([True, False], p=[0.8, 0.2]),
+            'emergency_services': station.get('emergencyServices', values['emergency_services']),
+            'accepts_insurance': station.get('acceptsInsurance', values['accepts_insurance']),
+            'appointment_required': station.get('appointmentRequired', values['appointment_required']),
+            'has_ambulance': values['has_ambulance'],
+            'has_pharmacy_inside': values['has_pharmacy_inside'],
             'visiting_hours': station.get('visitingHours', {'weekdays': '08:00-20:00', 'weekend': '10:00-18:00'})
         }
     
-    def get_restaurant_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_restaurant_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Restoran için spesifik alanlar"""
+        values = values or self._draw_place_fields('restaurant', 1)[0]
         return {
-            'menu_for_children': station.get('menuForChildren', np.random.choice([True, False], p=[0.6, 0.4])),
-            'serves_cocktails': station.get('servesCocktails', np.random.choice([True, False], p=[0.3, 0.7])),
-            'serves_beer': station.get('servesBeer', np.random.choice([True, False], p=[0.5, 0.5])),
-            'serves_wine': station.get('servesWine', np.random.choice([True, False], p=[0.4, 0.6])),
-            'serves_vegetarian_food': station.get('servesVegetarianFood', np.random.choice([True, False], p=[0.7, 0.3])),
-            'serves_breakfast': station.get('servesBreakfast', np.random.choice([True, False], p=[0.4, 0.6])),
-            'serves_brunch': station.get('servesBrunch', np.random.choice([True, False], p=[0.3, 0.7])),
-            'serves_lunch': station.get('servesLunch', np.random.choice([True, False], p=[0.9, 0.1])),
-            'serves_dinner': station.get('servesDinner', np.random.choice([True, False], p=[0.8, 0.2])),
-            'reservable': station.get('reservable', np.random.choice([True, False], p=[0.6, 0.4])),
-            'takeout': station.get('takeout', np.random.choice([True, False], p=[0.7, 0.3])),
-            'delivery': station.get('delivery', np.random.choice([True, False], p=[0.5, 0.5])),
-            'dine_in': station.get('dineIn', np.random.choice([True, False], p=[0.9, 0.1])),
-            'curbside_pickup': station.get('curbsidePickup', np.random.choice([True, False], p=[0.3, 0.7])),
-            'outdoor_seating': station.get('outdoorSeating', np.random.choice([True, False], p=[0.4, 0.6])),
-            'live_music': station.get('liveMusic', np.random.choice([True, False], p=[0.2, 0.8])),
-            'good_for_children': station.get('goodForChildren', np.random.choice([True, False], p=[0.6, 0.4])),
-            'good_for_groups': station.get('goodForGroups', np.random.choice([True, False], p=[0.7, 0.3])),
-            'cuisine_type': station.get('cuisineType', ['Turkish', 'International', 'Fast Food', 'Italian', 'Chinese'][np.random.randint(0, 5)]),
-            'price_range': station.get('priceRange', np.random.choice(['$', '$$', '$$$', '$$$$'], p=[0.3, 0.4, 0.2, 0.1]))
+            'menu_for_children': station.get('menuForChildren', values['menu_for_children']),
+            'serves_cocktails': station.get('servesCocktails', values['serves_cocktails']),
+            'serves_beer': station.get('servesBeer', values['serves_beer']),
+            'serves_wine': station.get('servesWine', values['serves_wine']),
+            'serves_vegetarian_food': station.get('servesVegetarianFood', values['serves_vegetarian_food']),
+            'serves_breakfast': station.get('servesBreakfast', values['serves_breakfast']),
+            'serves_brunch': station.get('servesBrunch', values['serves_brunch']),
+            'serves_lunch': station.get('servesLunch', values['serves_lunch']),
+            'serves_dinner': station.get('servesDinner', values['serves_dinner']),
+            'reservable': station.get('reservable', values['reservable']),
+            'takeout': station.get('takeout', values['takeout']),
+            'delivery': station.get('delivery', values['delivery']),
+            'dine_in': station.get('dineIn', values['dine_in']),
+            'curbside_pickup': station.get('curbsidePickup', values['curbside_pickup']),
+            'outdoor_seating': station.get('outdoorSeating', values['outdoor_seating']),
+            'live_music': station.get('liveMusic', values['live_music']),
+            'good_for_children': station.get('goodForChildren', values['good_for_children']),
+            'good_for_groups': station.get('goodForGroups', values['good_for_groups']),
+            'cuisine_type': station.get('cuisineType', values['cuisine_type']),
+            'price_range': station.get('priceRange', values['price_range'])
         }
     
-    def get_lodging_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_lodging_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Konaklama için spesifik alanlar"""
+        values = values or self._draw_place_fields('lodging', 1)[0]
         return {
-            'pet_friendly': station.get('petFriendly', np.random.choice([True, False], p=[0.3, 0.7])),
-            'pool_available': station.get('poolAvailable', np.random.choice([True, False], p=[0.4, 0.6])),
-            'fitness_center': station.get('fitnessCenter', np.random.choice([True, False], p=[0.5, 0.5])),
-            'business_center': station.get('businessCenter', np.random.choice([True, False], p=[0.6, 0.4])),
-            'free_wifi': station.get('freeWifi', np.random.choice([True, False], p=[0.9, 0.1])),
-            'room_service': station.get('roomService', np.random.choice([True, False], p=[0.4, 0.6])),
-            'spa_services': station.get('spaServices', np.random.choice([True, False], p=[0.2, 0.8])),
-            'restaurant_on_site': station.get('restaurantOnSite', np.random.choice([True, False], p=[0.7, 0.3])),
-            'bar_on_site': station.get('barOnSite', np.random.choice([True, False], p=[0.5, 0.5])),
-            'conference_rooms': station.get('conferenceRooms', np.random.choice([True, False], p=[0.4, 0.6])),
-            'laundry_service': station.get('laundryService', np.random.choice([True, False], p=[0.8, 0.2])),
-            'concierge_service': station.get('conciergeService', np.random.choice([True, False], p=[0.3, 0.7])),
-            'airport_shuttle': station.get('airportShuttle', np.random.choice([True, False], p=[0.3, 0.7])),
-            'smoking_allowed': station.get('smokingAllowed', np.random.choice([True, False], p=[0.1, 0.9])),
-            'air_conditioning': station.get('airConditioning', np.random.choice([True, False], p=[0.9, 0.1])),
-            'heating': station.get('heating', np.random.choice([True, False], p=[0.95, 0.05])),
+            'pet_friendly': station.get('petFriendly', values['pet_friendly']),
+            'pool_available': station.get('poolAvailable', values['pool_available']),
+            'fitness_center': station.get('fitnessCenter', values['fitness_center']),
+            'business_center': station.get('businessCenter', values['business_center']),
+            'free_wifi': station.get('freeWifi', values['free_wifi']),
+            'room_service': station.get('roomService', values['room_service']),
+            'spa_services': station.get('spaServices', values['spa_services']),
+            'restaurant_on_site': station.get('restaurantOnSite', values['restaurant_on_site']),
+            'bar_on_site': station.get('barOnSite', values['bar_on_site']),
+            'conference_rooms': station.get('conferenceRooms', values['conference_rooms']),
+            'laundry_service': station.get('laundryService', values['laundry_service']),
+            'concierge_service': station.get('conciergeService', values['concierge_service']),
+            'airport_shuttle': station.get('airportShuttle', values['airport_shuttle']),
+            'smoking_allowed': station.get('smokingAllowed', values['smoking_allowed']),
+            'air_conditioning': station.get('airConditioning', values['air_conditioning']),
+            'heating': station.get('heating', values['heating']),
             'check_in_time': station.get('checkInTime', '14:00'),
             'check_out_time': station.get('checkOutTime', '12:00'),
-            'star_rating': station.get('starRating', np.random.randint(1, 6))
+            'star_rating': station.get('starRating', values['star_rating'])
         }
     
-    def get_bank_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_bank_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Banka için spesifik alanlar"""
+        values = values or self._draw_place_fields('bank', 1)[0]
         return {
-            'atm_available': station.get('atmAvailable', np.random.choice([True, False], p=[0.9, 0.1])),
-            'drive_through': station.get('driveThrough', np.random.choice([True, False], p=[0.6, 0.4])),
-            'foreign_exchange': station.get('foreignExchange', np.random.choice([True, False], p=[0.4, 0.6])),
-            'safe_deposit_boxes': station.get('safeDepositBoxes', np.random.choice([True, False], p=[0.7, 0.3])),
-            'mortgage_services': station.get('mortgageServices', np.random.choice([True, False], p=[0.8, 0.2])),
-            'investment_services': station.get('investmentServices', np.random.choice([True, False], p=[0.6, 0.4])),
-            'business_banking': station.get('businessBanking', np.random.choice([True, False], p=[0.8, 0.2])),
-            'notary_services': station.get('notaryServices', np.random.choice([True, False], p=[0.3, 0.7]))
+            'atm_available': station.get('atmAvailable', values['atm_available']),
+            'drive_through': station.get('driveThrough', values['drive_through']),
+            'foreign_exchange': station.get('foreignExchange', values['foreign_exchange']),
+            'safe_deposit_boxes': station.get('safeDepositBoxes', values['safe_deposit_boxes']),
+            'mortgage_services': station.get('mortgageServices', values['mortgage_services']),
+            'investment_services': station.get('investmentServices', values['investment_services']),
+            'business_banking': station.get('businessBanking', values['business_banking']),
+            'notary_services': station.get('notaryServices', values['notary_services'])
         }
     
-    def get_pharmacy_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_pharmacy_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Eczane için spesifik alanlar"""
+        values = values or self._draw_place_fields('pharmacy', 1)[0]
         return {
             'prescription_filling': station.get('prescriptionFilling', True),
             'otc_medications': station.get('otcMedications', True),
-            'health_screenings': station.get('healthScreenings', np.random.choice([True, False], p=[0.6, 0.4])),
-            'vaccinations': station.get('vaccinations', np.random.choice([True, False], p=[0.7, 0.3])),
-            'delivery_service': station.get('deliveryService', np.random.choice([True, False], p=[0.4, 0.6])),
-            'consultation_services': station.get('consultationServices', np.random.choice([True, False], p=[0.5, 0.5])),
-            'medical_equipment': station.get('medicalEquipment', np.random.choice([True, False], p=[0.3, 0.7]))
+            'health_screenings': station.get('healthScreenings', values['health_screenings']),
+            'vaccinations': station.get('vaccinations', values['vaccinations']),
+            'delivery_service': station.get('deliveryService', values['delivery_service']),
+            'consultation_services': station.get('consultationServices', values['consultation_services']),
+            'medical_equipment': station.get('medicalEquipment', values['medical_equipment'])
         }
     
-    def get_supermarket_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_supermarket_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Süpermarket için spesifik alanlar"""
+        values = values or self._draw_place_fields('supermarket', 1)[0]
         return {
-            'grocery_pickup': station.get('groceryPickup', np.random.choice([True, False], p=[0.5, 0.5])),
-            'grocery_delivery': station.get('groceryDelivery', np.random.choice([True, False], p=[0.6, 0.4])),
-            'pharmacy_inside': station.get('pharmacyInside', np.random.choice([True, False], p=[0.3, 0.7])),
-            'bakery': station.get('bakery', np.random.choice([True, False], p=[0.7, 0.3])),
-            'deli': station.get('deli', np.random.choice([True, False], p=[0.6, 0.4])),
-            'butcher': station.get('butcher', np.random.choice([True, False], p=[0.5, 0.5])),
-            'seafood_counter': station.get('seafoodCounter', np.random.choice([True, False], p=[0.4, 0.6])),
-            'organic_products': station.get('organicProducts', np.random.choice([True, False], p=[0.6, 0.4])),
-            'self_checkout': station.get('selfCheckout', np.random.choice([True, False], p=[0.7, 0.3]))
+            'grocery_pickup': station.get('groceryPickup', values['grocery_pickup']),
+            'grocery_delivery': station.get('groceryDelivery', values['grocery_delivery']),
+            'pharmacy_inside': station.get('pharmacyInside', values['pharmacy_inside']),
+            'bakery': station.get('bakery', values['bakery']),
+            'deli': station.get('deli', values['deli']),
+            'butcher': station.get('butcher', values['butcher']),
+            'seafood_counter': station.get('seafoodCounter', values['seafood_counter']),
+            'organic_products': station.get('organicProducts', values['organic_products']),
+            'self_checkout': station.get('selfCheckout', values['self_checkout'])
         }
     
-    def get_shopping_mall_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_shopping_mall_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Alışveriş merkezi için spesifik alanlar"""
+        values = values or self._draw_place_fields('shopping_mall', 1)[0]
         return {
-            'number_of_stores': station.get('numberOfStores', np.random.randint(20, 200)),
-            'food_court': station.get('foodCourt', np.random.choice([True, False], p=[0.9, 0.1])),
-            'movie_theater': station.get('movieTheater', np.random.choice([True, False], p=[0.6, 0.4])),
-            'department_stores': station.get('departmentStores', np.random.choice([True, False], p=[0.8, 0.2])),
-            'children_play_area': station.get('childrenPlayArea', np.random.choice([True, False], p=[0.5, 0.5])),
-            'valet_parking': station.get('valetParking', np.random.choice([True, False], p=[0.3, 0.7])),
-            'customer_service': station.get('customerService', np.random.choice([True, False], p=[0.9, 0.1]))
+            'number_of_stores': station.get('numberOfStores', values['number_of_stores']),
+            'food_court': station.get('foodCourt', values['food_court']),
+            'movie_theater': station.get('movieTheater', values['movie_theater']),
+            'department_stores': station.get('departmentStores', values['department_stores']),
+            'children_play_area': station.get('childrenPlayArea', values['children_play_area']),
+            'valet_parking': station.get('valetParking', values['valet_parking']),
+            'customer_service': station.get('customerService', values['customer_service'])
         }
     
-    def get_tourist_attraction_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_tourist_attraction_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Turistik yer için spesifik alanlar"""
+        values = values or self._draw_place_fields('tourist_attraction', 1)[0]
         return {
-            'entrance_fee': station.get('entranceFee', np.random.choice([True, False], p=[0.6, 0.4])),
-            'guided_tours': station.get('guidedTours', np.random.choice([True, False], p=[0.5, 0.5])),
-            'audio_guide': station.get('audioGuide', np.random.choice([True, False], p=[0.4, 0.6])),
-            'gift_shop': station.get('giftShop', np.random.choice([True, False], p=[0.7, 0.3])),
-            'photography_allowed': station.get('photographyAllowed', np.random.choice([True, False], p=[0.8, 0.2])),
-            'historical_significance': station.get('historicalSignificance', np.random.choice([True, False], p=[0.6, 0.4])),
-            'family_friendly': station.get('familyFriendly', np.random.choice([True, False], p=[0.8, 0.2]))
+            'entrance_fee': station.get('entranceFee', values['entrance_fee']),
+            'guided_tours': station.get('guidedTours', values['guided_tours']),
+            'audio_guide': station.get('audioGuide', values['audio_guide']),
+            'gift_shop': station.get('giftShop', values['gift_shop']),
+            'photography_allowed': station.get('photographyAllowed', values['photography_allowed']),
+            'historical_significance': station.get('historicalSignificance', values['historical_significance']),
+            'family_friendly': station.get('familyFriendly', values['family_friendly'])
         }
     
-    def get_atm_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_atm_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """ATM için spesifik alanlar"""
+        values = values or self._draw_place_fields('atm', 1)[0]
         return {
-            'bank_network': station.get('bankNetwork', ['Akbank', 'Garanti', 'İş Bankası', 'Yapı Kredi', 'Ziraat'][np.random.randint(0, 5)]),
+            'bank_network': station.get('bankNetwork', values['bank_network']),
             'cash_withdrawal': station.get('cashWithdrawal', True),
             'balance_inquiry': station.get('balanceInquiry', True),
-            'deposit_available': station.get('depositAvailable', np.random.choice([True, False], p=[0.6, 0.4])),
-            'international_cards': station.get('internationalCards', np.random.choice([True, False], p=[0.8, 0.2])),
-            'indoor_location': station.get('indoorLocation', np.random.choice([True, False], p=[0.4, 0.6]))
+            'deposit_available': station.get('depositAvailable', values['deposit_available']),
+            'international_cards': station.get('internationalCards', values['international_cards']),
+            'indoor_location': station.get('indoorLocation', values['indoor_location'])
         }
     
-    def get_car_repair_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_car_repair_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Oto tamir için spesifik alanlar"""
+        values = values or self._draw_place_fields('car_repair', 1)[0]
         return {
-            'oil_change': station.get('oilChange', np.random.choice([True, False], p=[0.9, 0.1])),
-            'tire_service': station.get('tireService', np.random.choice([True, False], p=[0.8, 0.2])),
-            'brake_service': station.get('brakeService', np.random.choice([True, False], p=[0.7, 0.3])),
-            'engine_repair': station.get('engineRepair', np.random.choice([True, False], p=[0.6, 0.4])),
-            'transmission_service': station.get('transmissionService', np.random.choice([True, False], p=[0.5, 0.5])),
-            'air_conditioning_service': station.get('airConditioningService', np.random.choice([True, False], p=[0.6, 0.4])),
-            'electrical_service': station.get('electricalService', np.random.choice([True, False], p=[0.5, 0.5])),
-            'towing_service': station.get('towingService', np.random.choice([True, False], p=[0.4, 0.6])),
-            'inspection_service': station.get('inspectionService', np.random.choice([True, False], p=[0.7, 0.3]))
+            'oil_change': station.get('oilChange', values['oil_change']),
+            'tire_service': station.get('tireService', values['tire_service']),
+            'brake_service': station.get('brakeService', values['brake_service']),
+            'engine_repair': station.get('engineRepair', values['engine_repair']),
+            'transmission_service': station.get('transmissionService', values['transmission_service']),
+            'air_conditioning_service': station.get('airConditioningService', values['air_conditioning_service']),
+            'electrical_service': station.get('electricalService', values['electrical_service']),
+            'towing_service': station.get('towingService', values['towing_service']),
+            'inspection_service': station.get('inspectionService', values['inspection_service'])
         }
     
-    def get_parking_fields(self, station: Dict[str, Any]) -> Dict[str, Any]:
+    def get_parking_fields(self, station: Dict[str, Any], values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Park alanı için spesifik alanlar"""
+        values = values or self._draw_place_fields('parking', 1)[0]
         return {
-            'parking_type': station.get('parkingType', np.random.choice(['surface', 'garage', 'street'])),
-            'hourly_rate': station.get('hourlyRate', np.random.uniform(2.0, 15.0)),
-            'daily_rate': station.get('dailyRate', np.random.uniform(20.0, 100.0)),
-            'monthly_rate': station.get('monthlyRate', np.random.uniform(200.0, 800.0)),
-            'covered_parking': station.get('coveredParking', np.random.choice([True, False], p=[0.4, 0.6])),
-            'security_cameras': station.get('securityCameras', np.random.choice([True, False], p=[0.7, 0.3])),
-            'attendant_on_site': station.get('attendantOnSite', np.random.choice([True, False], p=[0.5, 0.5])),
-            'electric_vehicle_charging': station.get('electricVehicleCharging', np.random.choice([True, False], p=[0.3, 0.7]))
+            'parking_type': station.get('parkingType', values['parking_type']),
+            'hourly_rate': station.get('hourlyRate', values['hourly_rate']),
+            'daily_rate': station.get('dailyRate', values['daily_rate']),
+            'monthly_rate': station.get('monthlyRate', values['monthly_rate']),
+            'covered_parking': station.get('coveredParking', values['covered_parking']),
+            'security_cameras': station.get('securityCameras', values['security_cameras']),
+            'attendant_on_site': station.get('attendantOnSite', values['attendant_on_site']),
+            'electric_vehicle_charging': station.get('electricVehicleCharging', values['electric_vehicle_charging'])
         }
     
-    def generate_services(self) -> List[str]:
+    def generate_services(self, draws: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Rastgele mock istasyon hizmetleri listesi oluşturur.
         
         `constants.POSSIBLE_SERVICES` listesinden rastgele 3 ila 6 adet hizmet seçer.
 
+        Args:
+            draws (Dict[str, Any], optional): Önceden üretilmiş rastgele değerler.
+
         Returns:
             List[str]: Oluşturulan hizmet listesi.
         """
-        possible_services = constants.POSSIBLE_SERVICES
-        
-        # Rastgele 3-6 hizmet seç
-        num_services = np.random.randint(3, 7)
-        return np.random.choice(possible_services, num_services, replace=False).tolist()
+        draws = draws or self._draw_random_batch(1)[0]
+        return list(draws['services'])
     
-    def generate_operating_hours(self) -> Dict[str, str]:
+    def generate_operating_hours(self, draws: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
         Rastgele mock çalışma saatleri oluşturur.
 
         %80 ihtimalle 24 saat açık, %20 ihtimalle ise hafta içi ve hafta sonu
         farklı olan sınırlı çalışma saatleri oluşturur.
 
+        Args:
+            draws (Dict[str, Any], optional): Önceden üretilmiş rastgele değerler.
+
         Returns:
             Dict[str, str]: Çalışma saatlerini içeren sözlük.
         """
+        draws = draws or self._draw_random_batch(1)[0]
         # %80 şans 24 saat, %20 şans sınırlı saatler
-        if np.random.random() > 0.2:
+        if draws['flags']['open_24h']:
             return {"all_days": "00:00-23:59"}
         else:
             return {
@@ -621,7 +1249,8 @@ class EnhancedDataCollector:
                 "sunday": "08:00-20:00"
             }
     
-    def generate_price_data(self, country_code: str) -> Dict[str, float]:
+    def generate_price_data(self, country_code: str, draws: Optional[Dict[str, Any]] = None,
+                            base_prices: Optional[Dict[str, float]] = None) -> Dict[str, float]:
         """
         Ülke koduna göre mock yakıt fiyatları oluşturur.
 
@@ -630,41 +1259,49 @@ class EnhancedDataCollector:
 
         Args:
             country_code (str): Fiyatların oluşturulacağı ülkenin kodu.
+            draws (Dict[str, Any], optional): Önceden üretilmiş rastgele değerler.
+            base_prices (Dict[str, float], optional): Önceden seçilmiş temel fiyatlar.
+                                                      Verilmezse ülke koduna göre bulunur.
 
         Returns:
             Dict[str, float]: Yakıt türlerini ve fiyatlarını içeren sözlük.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        gasoline_factor, diesel_factor, premium_factor = draws['price_factors']
+
         # Ortalama fiyatlar (EUR/L)
-        base_prices = constants.BASE_PRICES
-        
-        default_prices = constants.DEFAULT_PRICES
-        prices = base_prices.get(country_code, default_prices)
+        prices = base_prices or constants.BASE_PRICES.get(country_code, constants.DEFAULT_PRICES)
         
         # Fiyatlara %±5 rastgele varyasyon ekle
         return {
-            'gasoline': round(prices['gasoline'] * np.random.uniform(0.95, 1.05), 3),
-            'diesel': round(prices['diesel'] * np.random.uniform(0.95, 1.05), 3),
-            'premium_gasoline': round(prices['gasoline'] * 1.1 * np.random.uniform(0.95, 1.05), 3),
+            'gasoline': round(prices['gasoline'] * gasoline_factor, 3),
+            'diesel': round(prices['diesel'] * diesel_factor, 3),
+            'premium_gasoline': round(prices['gasoline'] * 1.1 * premium_factor, 3),
             'currency': constants.PRICE_CURRENCY
         }
     
-    def generate_facilities(self) -> Dict[str, Any]:
+    def generate_facilities(self, draws: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Rastgele mock istasyon tesis bilgileri oluşturur.
 
         Pompa sayısı, engelli erişimi, EV şarj imkanı, kamyon dostu olup olmadığı,
         ödeme yöntemleri ve sadakat programı gibi bilgileri rastgele olarak üretir.
 
+        Args:
+            draws (Dict[str, Any], optional): Önceden üretilmiş rastgele değerler.
+
         Returns:
             Dict[str, Any]: Tesis bilgilerini içeren sözlük.
         """
+        draws = draws or self._draw_random_batch(1)[0]
+        flags = draws['flags']
         return {
-            'pump_count': np.random.randint(4, 16),
-            'accessibility': np.random.choice([True, False], p=[0.8, 0.2]),
-            'ev_charging': np.random.choice([True, False], p=[0.3, 0.7]),
-            'truck_friendly': np.random.choice([True, False], p=[0.4, 0.6]),
+            'pump_count': draws['pump_count'],
+            'accessibility': flags['facility_accessibility'],
+            'ev_charging': flags['facility_ev_charging'],
+            'truck_friendly': flags['truck_friendly'],
             'payment_methods': constants.PAYMENT_METHODS,
-            'loyalty_program': np.random.choice([True, False], p=[0.6, 0.4])
+            'loyalty_program': flags['loyalty_program']
         }
     
     def collect_comprehensive_data(self, selected_cities: List[str] = None, collection_options: Dict[str, bool] = None, place_types: List[str] = None):
@@ -694,74 +1331,89 @@ class EnhancedDataCollector:
         all_stations = []
         city_summaries = {}
         
-        for city_name in selected_cities:
-            try:
+        # Toplama turunun zamanı bir kez alınır; tüm kayıtlar aynı parti zamanını taşır
+        batch_ts = datetime.now(timezone.utc)
+        batch_ts_iso = batch_ts.isoformat()
+        
+        # Şehirler eşzamanlı toplanır; API beklemeleri örtüşür. Kota aşımında
+        # places_client Retry-After/üstel geri çekilme ile bekler, sabit bekleme yapılmaz.
+        # Özetler ve veritabanı kaydı şehir sırasıyla bu thread'de işlenir.
+        with ThreadPoolExecutor(max_workers=min(CITY_COLLECTION_WORKERS, len(selected_cities))) as executor:
+            city_futures = {}
+            for city_name in selected_cities:
                 logger.info(f"🏙️ {city_name} şehri için veri toplama başlatılıyor...")
-                
                 # Şehir başına maksimum 50 mekan topla
-                stations = self.collect_stations_by_city(city_name, max_stations=50, collection_options=collection_options, place_types=place_types)
-                
-                if stations:
-                    all_stations.extend(stations)
+                city_futures[city_name] = executor.submit(
+                    self.collect_stations_by_city, city_name, max_stations=50,
+                    collection_options=collection_options, place_types=place_types, ts=batch_ts_iso
+                )
+            
+            for city_name, city_future in city_futures.items():
+                try:
+                    stations = city_future.result()
                     
-                    # Şehir özeti
-                    city_summaries[city_name] = {
-                        'city_name': city_name,
-                        'total_stations': len(stations),
-                        'brands': list(set([s['brand'] for s in stations])),
-                        'avg_rating': np.mean([s['rating'] for s in stations if s['rating'] > 0]),
-                        'collection_time': datetime.now(timezone.utc).isoformat()
-                    }
+                    if stations:
+                        all_stations.extend(stations)
                     
-                    logger.info(f"✅ {city_name} şehri için {len(stations)} istasyon verisi toplandı")
-                else:
-                    logger.warning(f"⚠️ {city_name} şehri için istasyon bulunamadı")
+                        # Şehir özeti
+                        city_summaries[city_name] = {
+                            'city_name': city_name,
+                            'total_stations': len(stations),
+                            'brands': list(set([s.brand for s in stations])),
+                            'avg_rating': np.mean([s.rating for s in stations if s.rating > 0]),
+                            'collection_time': batch_ts_iso
+                        }
+                    
+                        logger.info(f"✅ {city_name} şehri için {len(stations)} istasyon verisi toplandı")
+                    else:
+                        logger.warning(f"⚠️ {city_name} şehri için istasyon bulunamadı")
                 
-                # Veritabanına kaydet - tüm yeni field'larla birlikte
-                logger.info(f"🗄️ {city_name} şehri verilerini veritabanına kaydediliyor...")
-                for station in stations:
-                    try:
-                        station_data = FuelStationData(
-                            station_id=station['station_id'],
-                            name=station['name'],
-                            brand=station['brand'],
-                            country=station['country'],
-                            region=station['region'],
-                            latitude=station['latitude'],
-                            longitude=station['longitude'],
-                            address=station['address'],
-                            fuel_types=station['fuel_types'],
-                            services=station['services'],
-                            rating=station['rating'],
-                            review_count=station['review_count'],
-                            operating_hours=station['operating_hours'],
-                            price_data=station['price_data'],
-                            last_updated=datetime.now(timezone.utc)
-                        )
-                        success = self.warehouse.insert_fuel_station(station_data)
-                        if not success:
-                            logger.warning(f"⚠️ İstasyon veritabanına kaydedilemedi: {station['name']}")
-                    except Exception as e:
-                        logger.error(f"❌ İstasyon kaydetme hatası: {e}")
+                    # Veritabanına kaydet - tüm yeni field'larla birlikte
+                    logger.info(f"🗄️ {city_name} şehri verilerini veritabanına kaydediliyor...")
+                    station_records = []
+                    for station in stations:
+                        try:
+                            station_records.append(FuelStationData(
+                                station_id=station.station_id,
+                                name=station.name,
+                                brand=station.brand,
+                                country=station.country,
+                                region=station.region,
+                                latitude=station.latitude,
+                                longitude=station.longitude,
+                                address=station.address,
+                                fuel_types=station.fuel_types,
+                                services=station.services,
+                                rating=station.rating,
+                                review_count=station.review_count,
+                                operating_hours=station.operating_hours,
+                                price_data=station.price_data,
+                                last_updated=batch_ts
+                            ))
+                        except Exception as e:
+                            logger.error(f"❌ İstasyon kaydetme hatası: {e}")
                 
-                logger.info(f"✅ {city_name} şehri verileri veritabanına kaydedildi")
+                    # Şehrin tüm istasyonları COPY ile tek transaction'da yüklenir
+                    saved_count = self.warehouse.bulk_copy_fuel_stations(station_records)
+                    if station_records and not saved_count:
+                        logger.warning(f"⚠️ {city_name} şehri istasyonları veritabanına kaydedilemedi")
                 
-                time.sleep(3)  # Şehirler arası bekleme
+                    logger.info(f"✅ {city_name} şehri verileri veritabanına kaydedildi")
                 
-            except Exception as e:
-                logger.error(f"❌ {city_name} şehri veri toplama hatası: {e}")
-                continue
+                except Exception as e:
+                    logger.error(f"❌ {city_name} şehri veri toplama hatası: {e}")
+                    continue
         
         # Özet rapor
         total_summary = {
             'total_cities': len(selected_cities),
             'total_stations_collected': len(all_stations),
             'cities_processed': len(city_summaries),
-            'collection_date': datetime.now(timezone.utc).isoformat(),
+            'collection_date': batch_ts_iso,
             'data_quality': 'high',
             'data_source': 'Resmi Veri Kaynağı',
             'version': '4.0',
-            'country': 'Turkey'
+            'country': STATION_COUNTRY
         }
         
         # Sonuçları kaydet
@@ -788,7 +1440,7 @@ class EnhancedDataCollector:
         
         return output_data
     
-    def generate_analytics(self, stations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_analytics(self, stations: List[StationRow]) -> Dict[str, Any]:
         """
         Toplanan istasyon verilerinden analitik bir özet oluşturur.
 
@@ -796,7 +1448,7 @@ class EnhancedDataCollector:
         toplam ve aktif istasyon sayısı gibi analitik verileri hesaplar.
 
         Args:
-            stations (List[Dict[str, Any]]): Analiz edilecek istasyon verilerinin listesi.
+            stations (List[StationRow]): Analiz edilecek istasyon verilerinin listesi.
 
         Returns:
             Dict[str, Any]: Hesaplanan analitik verileri içeren bir sözlük.
@@ -804,40 +1456,101 @@ class EnhancedDataCollector:
         if not stations:
             return {}
         
-        # Marka dağılımı
-        brands = [s['brand'] for s in stations]
-        brand_counts = pd.Series(brands).value_counts().to_dict()
+        # Tüm sayımlar istasyon listesi üzerinde tek geçişte toplanır
+        brand_counter = Counter()
+        city_counter = Counter()
+        fuel_type_counter = Counter()
+        status_counts = Counter()
+        rating_values = []
+        total_services = 0
         
-        # Şehir dağılımı
-        cities = [s.get('city', 'Unknown') for s in stations]
-        city_counts = pd.Series(cities).value_counts().to_dict()
+        for s in stations:
+            brand_counter[s.brand] += 1
+            city_counter[s.city or 'Unknown'] += 1
+            fuel_type_counter.update(s.fuel_types)
+            status_counts[s.business_status] += 1
+            total_services += len(s.services)
+            if s.rating > 0:
+                rating_values.append(s.rating)
         
-        # Puan istatistikleri
-        ratings = [s['rating'] for s in stations if s['rating'] > 0]
+        # Dağılımlar çoktan aza sıralı
+        brand_counts = dict(brand_counter.most_common())
+        city_counts = dict(city_counter.most_common())
+        fuel_type_counts = dict(fuel_type_counter.most_common())
         
-        # Yakıt türü analizi
-        all_fuel_types = []
-        for station in stations:
-            all_fuel_types.extend(station.get('fuel_types', []))
-        fuel_type_counts = pd.Series(all_fuel_types).value_counts().to_dict()
+        # Puan istatistikleri tek bir dizi üzerinden hesaplanır
+        ratings = np.fromiter(rating_values, dtype=np.float64, count=len(rating_values))
+        has_ratings = ratings.size > 0
         
         return {
             'brand_distribution': brand_counts,
             'city_distribution': city_counts,
             'rating_stats': {
-                'average': np.mean(ratings) if ratings else 0,
-                'median': np.median(ratings) if ratings else 0,
-                'min': np.min(ratings) if ratings else 0,
-                'max': np.max(ratings) if ratings else 0,
-                'count': len(ratings)
+                'average': ratings.mean() if has_ratings else 0,
+                'median': np.median(ratings) if has_ratings else 0,
+                'min': ratings.min() if has_ratings else 0,
+                'max': ratings.max() if has_ratings else 0,
+                'count': int(ratings.size)
             },
             'fuel_type_distribution': fuel_type_counts,
             'total_stations': len(stations),
-            'active_stations': len([s for s in stations if s.get('business_status') == constants.BUSINESS_STATUS_OPERATIONAL]),
-            'average_services_per_station': np.mean([len(s.get('services', [])) for s in stations])
+            'active_stations': status_counts[constants.BUSINESS_STATUS_OPERATIONAL],
+            'average_services_per_station': total_services / len(stations)
         }
     
-    def export_to_excel(self, stations: List[Dict[str, Any]], filename: str):
+    def export_to_json(self, output_data: Dict[str, Any], base_filename: str) -> bool:
+        """
+        `collect_comprehensive_data` çıktısını iki dosyaya akış halinde yazar.
+
+        - `<base_filename>.summary.json`: summary, city_summaries, analytics ve metadata.
+        - `<base_filename>.stations.jsonl`: her satırda bir istasyon (JSON Lines).
+        
+        İstasyonlar tek tek kodlanıp yazıldığından bellek kullanımı istasyon
+        sayısından bağımsızdır. Okumak için: `pd.read_json(path, lines=True)`.
+
+        Args:
+            output_data (Dict[str, Any]): `collect_comprehensive_data` sonucu.
+            base_filename (str): Uzantısız dosya adı (örn: 'turkey_fuel_stations_20250101_120000').
+
+        Returns:
+            bool: Yazma başarılıysa True.
+        """
+        summary_file = f"{base_filename}.summary.json"
+        stations_file = f"{base_filename}.stations.jsonl"
+        
+        try:
+            summary_data = {key: value for key, value in output_data.items() if key != 'stations'}
+            with open(summary_file, 'wb') as f:
+                f.write(dumps_json_bytes(summary_data, indent=True))
+            
+            with open(stations_file, 'wb') as f:
+                for station in output_data.get('stations', []):
+                    f.write(dumps_json_bytes(station.to_dict()))
+                    f.write(b'\n')
+            
+            logger.info(constants.LOG_MSG_JSON_EXPORT_SUCCESS.format(summary_file=summary_file, stations_file=stations_file))
+            return True
+            
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(constants.LOG_MSG_JSON_EXPORT_ERROR.format(error=e))
+            return False
+    
+    @staticmethod
+    def _excel_cell(value: Any) -> Any:
+        """
+        Değeri Excel hücresine yazılabilir hale getirir.
+
+        Args:
+            value (Any): Hücre değeri.
+
+        Returns:
+            Any: İç içe yapılar (dict/list) JSON metni olarak, diğerleri olduğu gibi.
+        """
+        if isinstance(value, (dict, list, tuple)):
+            return dumps_json(value)
+        return value
+    
+    def export_to_excel(self, stations: List[StationRow], filename: str, fast: bool = False):
         """
         Toplanan verileri çok sayfalı bir Excel dosyasına aktarır.
 
@@ -847,38 +1560,45 @@ class EnhancedDataCollector:
         3. 'Summary': `generate_analytics` tarafından oluşturulan özet istatistikler.
 
         Args:
-            stations (List[Dict[str, Any]]): Dışa aktarılacak istasyon verileri.
+            stations (List[StationRow]): Dışa aktarılacak istasyon verileri.
             filename (str): Oluşturulacak Excel dosyasının adı.
+            fast (bool): True ise dosya Excel kütüphanesi kullanılmadan doğrudan XML
+                         olarak yazılır (`write_xlsx_fast`; stil içermez).
         """
         try:
-            # Ana istasyon verileri
-            df_stations = pd.DataFrame(stations)
+            # Satırlar DataFrame kurulmadan üreteçlerle doğrudan akış modundaki sayfalara yazılır
             
-            # Fiyat verilerini ayrı kolonlara çıkar
-            price_data = []
-            for station in stations:
-                prices = station.get('price_data', {})
-                price_row = {
-                    'station_id': station['station_id'],
-                    'gasoline_price': prices.get('gasoline', 0),
-                    'diesel_price': prices.get('diesel', 0),
-                    'premium_gasoline_price': prices.get('premium_gasoline', 0),
-                    'currency': prices.get('currency', constants.PRICE_CURRENCY)
-                }
-                price_data.append(price_row)
+            # Ana istasyon verileri: önce StationRow'un sabit kolonları, ardından
+            # yalnızca extra sözlüklerinde görülen türe özgü kolonlar
+            extra_columns = list(dict.fromkeys(key for station in stations for key in station.extra))
+            station_rows = (
+                [self._excel_cell(getattr(station, column)) for column in STATION_ROW_FIELDS]
+                + [self._excel_cell(station.extra.get(column)) for column in extra_columns]
+                for station in stations
+            )
             
-            df_prices = pd.DataFrame(price_data)
+            # Fiyat verilerini ayrı kolonlara çıkar
+            price_rows = (
+                [
+                    station.station_id,
+                    station.price_data.get('gasoline', 0),
+                    station.price_data.get('diesel', 0),
+                    station.price_data.get('premium_gasoline', 0),
+                    station.price_data.get('currency', constants.PRICE_CURRENCY)
+                ]
+                for station in stations
+            )
             
-            # Excel'e kaydet
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                df_stations.to_excel(writer, sheet_name='Stations', index=False)
-                df_prices.to_excel(writer, sheet_name='Prices', index=False)
-                
-                # Özet sayfa
-                summary_data = self.generate_analytics(stations)
-                df_summary = pd.DataFrame([summary_data])
-                df_summary.to_excel(writer, sheet_name='Summary', index=False)
+            # Özet sayfa
+            summary_data = self.generate_analytics(stations)
+            summary_rows = [[self._excel_cell(value) for value in summary_data.values()]]
             
+            write_sheets = write_xlsx_fast if fast else write_excel_sheets
+            write_sheets(filename, [
+                ('Stations', [*STATION_ROW_FIELDS, *extra_columns], station_rows),
+                ('Prices', EXCEL_PRICE_COLUMNS, price_rows),
+                ('Summary', list(summary_data), summary_rows),
+            ])
             logger.info(constants.LOG_MSG_EXCEL_EXPORT_SUCCESS.format(filename=filename))
             
         except Exception as e:
@@ -9,7 +9,6 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timezone
-import json
 import os
 import logging
 from typing import Dict, List, Optional
@@ -18,10 +17,50 @@ from streamlit_folium import st_folium
 import psycopg2
 import numpy as np
 
+from utils.json_utils import dumps_json, dumps_json_bytes
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Excel yazıcı (opsiyonel): xlsxwriter varsa pandas onunla, yoksa openpyxl ile yazar
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+def _excel_cell_text(value):
+    """Liste/sözlük hücreleri metne çevirir: metin listeleri virgülle, diğerleri JSON olarak."""
+    if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+        return ','.join(value)
+    if isinstance(value, (list, tuple, dict, np.ndarray)):
+        return dumps_json(value)
+    return value
+
+def _excel_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    DataFrame'i Excel'e yazılmaya hazırlar.
+
+    İç içe değer (liste/sözlük) içeren object kolonlar tek seferde metne çevrilir;
+    böylece Excel yazıcısı her hücre için Python nesnesi dönüştürmek zorunda kalmaz
+    ve xlsxwriter'ın desteklemediği türler kalmaz. Diğer kolonlar olduğu gibi bırakılır.
+
+    Args:
+        df (pd.DataFrame): Yazılacak veri.
+
+    Returns:
+        pd.DataFrame: İç içe kolonları düzleştirilmiş veri.
+    """
+    nested_columns = [
+        column for column in df.columns
+        if df[column].dtype == object
+        and df[column].map(lambda value: isinstance(value, (list, tuple, dict, np.ndarray))).any()
+    ]
+    if not nested_columns:
+        return df
+    return df.assign(**{column: df[column].map(_excel_cell_text) for column in nested_columns})
+
 # Import our modules
 from api.routes_client import GoogleRoutesClient
 from api.driver_assistant import DriverAssistant
@@ -759,15 +798,15 @@ def display_export_options():
                 
                 filename = f"{constants.EXPORT_EXCEL_FILENAME_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
                 
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+                with pd.ExcelWriter(filename, engine=EXCEL_ENGINE) as writer:
                     if not df_stations.empty:
-                        df_stations.to_excel(writer, sheet_name='Stations', index=False)
+                        _excel_frame(df_stations).to_excel(writer, sheet_name='Stations', index=False)
                     if not df_routes.empty:
-                        df_routes.to_excel(writer, sheet_name='Routes', index=False)
+                        _excel_frame(df_routes).to_excel(writer, sheet_name='Routes', index=False)
                     
                     summary = st.session_state.warehouse.get_analytics_summary()
                     df_summary = pd.DataFrame([summary])
-                    df_summary.to_excel(writer, sheet_name='Summary', index=False)
+                    _excel_frame(df_summary).to_excel(writer, sheet_name='Summary', index=False)
                 
                 st.success(f"✅ Excel dosyası oluşturuldu: {filename}")
                 
@@ -781,13 +820,15 @@ def display_export_options():
                 summary = st.session_state.warehouse.get_analytics_summary()
                 filename = f"{constants.EXPORT_JSON_FILENAME_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
                 
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(summary, f, indent=2, ensure_ascii=False)
+                # Özet bir kez kodlanır; aynı baytlar hem dosyaya hem indirme butonuna gider
+                payload = dumps_json_bytes(summary, indent=True)
+                with open(filename, 'wb') as f:
+                    f.write(payload)
                 
                 st.success(f"✅ JSON dosyası oluşturuldu: {filename}")
                 st.download_button(
                     label="📥 İndir",
-                    data=json.dumps(summary, indent=2),
+                    data=payload,
                     file_name=filename,
                     mime="application/json"
                 )
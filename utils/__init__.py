@@ -1,3 +1,9 @@
-from .data_preprocessing import RouteDataProcessor
+__all__ = ['RouteDataProcessor']
 
-__all__ = ['RouteDataProcessor']
\ No newline at end of file
+def __getattr__(name):
+    # RouteDataProcessor sklearn/pandas yükler; yalnızca istendiğinde içe aktarılır ki
+    # utils.json_utils gibi hafif modüller bu bağımlılıkları çekmesin
+    if name == 'RouteDataProcessor':
+        from .data_preprocessing import RouteDataProcessor
+        return RouteDataProcessor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
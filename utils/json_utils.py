@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+JSON Yardımcıları
+Proje genelinde kullanılan tek JSON kodlayıcı; orjson kuruluysa onu, değilse
+standart json modülünü kullanır
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def json_default(value: Any) -> Any:
+    """
+    JSON'un doğrudan desteklemediği değerleri uygun Python türlerine çevirir.
+
+    Args:
+        value (Any): Kodlanamayan değer (NumPy skaler/dizi, Decimal, tarih)
+
+    Returns:
+        Any: JSON'a yazılabilir karşılığı
+    """
+    if np is not None:
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+# Hızlı JSON kodlayıcı (opsiyonel): orjson varsa kodlama/çözme onunla yapılır
+try:
+    import orjson
+
+    def dumps_json_bytes(value: Any, indent: bool = False) -> bytes:
+        """
+        Değeri UTF-8 JSON baytlarına çevirir.
+
+        Args:
+            value (Any): Kodlanacak değer
+            indent (bool): True ise 2 boşluk girintili yazılır
+
+        Returns:
+            bytes: JSON çıktısı
+        """
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=json_default, option=option)
+
+    loads_json = orjson.loads
+except ImportError:
+    def dumps_json_bytes(value: Any, indent: bool = False) -> bytes:
+        """
+        Değeri UTF-8 JSON baytlarına çevirir.
+
+        Args:
+            value (Any): Kodlanacak değer
+            indent (bool): True ise 2 boşluk girintili yazılır
+
+        Returns:
+            bytes: JSON çıktısı
+        """
+        return json.dumps(value, indent=2 if indent else None, ensure_ascii=False,
+                          default=json_default).encode('utf-8')
+
+    loads_json = json.loads
+
+def dumps_json(value: Any, indent: bool = False) -> str:
+    """
+    Değeri JSON metnine çevirir.
+
+    Args:
+        value (Any): Kodlanacak değer
+        indent (bool): True ise 2 boşluk girintili yazılır
+
+    Returns:
+        str: JSON metni
+    """
+    return dumps_json_bytes(value, indent).decode('utf-8')